@@ -0,0 +1,47 @@
+import argparse
+import json
+import sys
+import os
+
+# Makes sure the game knows where the files are located:
+
+current_path = os.path.dirname(__file__)  # where this file is located
+outer_path = os.path.abspath(os.path.join(current_path, os.pardir))  # the src folder
+sys.path.insert(1, outer_path)
+# Keeps pygame's greeting out of the printed results
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+from src.utils import config
+from src.utils.benchmarks import run_memory, run_scenario, scenarios
+
+"""Runs the benchmark scenarios headlessly and prints their results as JSON.
+Example: python benchmark.py TITAN DIAMOND_DUST --ticks 3600 --seed 1 --output before.json
+Example: python benchmark.py --memory 5000
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs seeded stress scenarios without a window or sound.")
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run, default all: " + ", ".join(scenarios.keys()))
+    parser.add_argument("--ticks", type=int, default=config.game_fps * 60, help="most ticks to run each scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write the results to instead of printing them")
+    parser.add_argument("--memory", type=int, metavar="COUNT",
+                        help="measures the bytes and attribute reads of COUNT of each entity instead of the scenarios")
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in scenarios:
+            parser.error("unknown scenario " + name)
+    if args.memory is not None:
+        results = run_memory(args.memory)
+    else:
+        results = [run_scenario(name, args.ticks, args.seed) for name in args.scenarios or scenarios.keys()]
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+    else:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
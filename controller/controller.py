@@ -1,5 +1,6 @@
 import pygame
 import os
+import time
 
 from src.utils import config
 from src.utils.direction import Direction
@@ -30,11 +31,14 @@ class Controller:
     :type start_menu: StartMenu_view
     :param _fps: frames per second to run the game at
     :type _fps: int
+    :param replay: replay to record the player's inputs to, not recorded if None
+    :type replay: Replay or None
     """
 
-    def __init__(self, _model, _view):
+    def __init__(self, _model, _view, replay=None):
         self._model = _model
         self._view = _view
+        self._replay = replay
         self._fps = config.game_fps
         # Endurance by Scott Buckley is the music in the background
         self.game_music_path = os.path.join(self.music_path, 'endurance.mp3')
@@ -55,9 +59,16 @@ class Controller:
         pygame.mixer.music.play(-1)
         pygame.mixer.music.set_volume(.5)
         paused = False
+        show_profile = False
         ANIMATE = pygame.USEREVENT + 1
         game_over_countdown = self._fps * 5
         pygame.time.set_timer(ANIMATE, 300)
+        # Seconds of game time owed to the model, paid off a tick at a time
+        tick_length = 1 / self._fps
+        accumulator = 0
+        last_time = time.perf_counter()
+        # Effects are aged after the frame showing the last tick is rendered, so each tick's effects are seen
+        effects_due = False
         while not done:
             for game_event in pygame.event.get():
                 # Checks if quit
@@ -70,29 +81,59 @@ class Controller:
                     # Goes back to menu
                     elif game_event.key == pygame.K_BACKSPACE and paused:
                         return True
+                    # Shows or hides the profiler overlay
+                    elif game_event.key == pygame.K_F3:
+                        show_profile = not show_profile
+                    # Writes the frame statistics to a file
+                    elif game_event.key == pygame.K_F4:
+                        self._model.profiler.dump()
                 # Animates sprites
                 if game_event.type == ANIMATE:
                     self._view.animate()
             # Grabs the keys currently pressed down
             keys = pygame.key.get_pressed()
-            # Moves the player and ticks
-            if not paused:
-                self._model.move_player(self._parse_keys(keys))
-                self._model.tick()
-            else:
-                self._model.pause()
-            # Renders the _view and removes lasting effects
+            now = time.perf_counter()
+            accumulator += now - last_time
+            last_time = now
+            # Runs as many ticks as the time since the last frame covers
+            ticks = 0
+            while accumulator >= tick_length and ticks < config.max_ticks_per_frame:
+                if effects_due:
+                    self._model.remove_effects()
+                # Moves the player and ticks
+                if not paused:
+                    directions = self._parse_keys(keys)
+                    if self._replay is not None:
+                        self._replay.record(self._model, directions)
+                    self._model.store_positions()
+                    self._model.move_player(directions)
+                    self._model.tick()
+                else:
+                    self._model.pause()
+                effects_due = True
+                accumulator -= tick_length
+                ticks += 1
+                if self._model.is_game_over():
+                    game_over_countdown -= 1
+                    if game_over_countdown == 0:
+                        return True
+            # Drops the time that could not be caught up on, so a slow machine slows the game down instead of
+            # falling further behind every frame
+            if accumulator >= tick_length:
+                accumulator %= tick_length
+            # Renders the _view part of the way to the next tick
+            start = time.perf_counter()
             self._view.render(self._model.get_player(), self._model.get_projectiles(),
-                              self._model.get_ships(), self._model.get_effects())
-            self._model.remove_effects()
-            if self._model.is_game_over():
-                game_over_countdown -= 1
-                if game_over_countdown == 0:
-                    return True
+                              self._model.get_ships(), self._model.get_effects(),
+                              1 if paused else accumulator / tick_length)
+            self._model.profiler.add("render", start)
+            self._model.profiler.end_frame(self._model.get_entity_counts())
             self._view.render_fps(int(clock.get_fps()))
+            if show_profile:
+                self._view.render_profile(self._model.profiler.get_averages(), self._model.profiler.get_counts())
             # Updates display
-            pygame.display.update()
-            clock.tick(self._fps)
+            self._view.update_display()
+            clock.tick(config.render_fps)
         return False
 
     """Takes in a list of Pygame keys and returns a list of directions for the _model.
@@ -0,0 +1,63 @@
+from src.model.model import Model
+from src.utils import config
+
+"""Controller that runs the model without a window, sound, or clock. Ticks as fast as possible, which is useful
+for soak testing and balancing waves.
+"""
+
+
+class HeadlessController:
+    """Constructor that builds a model for the given game mode.
+
+    :param difficulty: Difficulty mode of the AI
+    :type difficulty: DifficultyID
+    :param game_mode: Game mode to play
+    :type game_mode: GameModeID
+    :param ship: Player ship to use, defaults to the one chosen in the hangar
+    :type ship: PlayerID
+    :param weapon: Weapon to use, defaults to the one chosen in the hangar
+    :type weapon: WeaponID
+    :param seed: seed for the game's random choices, a new one every game if None
+    :type seed: int or None
+    """
+
+    def __init__(self, difficulty, game_mode, ship=None, weapon=None, seed=None):
+        if ship is not None:
+            config.player_ship = ship
+        self._model = Model(difficulty, game_mode, headless=True, seed=seed)
+        self._model.switch_weapon(config.weapon if weapon is None else weapon)
+        self.ticks = 0
+
+    """Returns the model being run.
+
+    :returns: the model
+    :rtype: Model
+    """
+
+    def get_model(self):
+        return self._model
+
+    """Ticks the model until the game is over or the tick limit is reached.
+
+    :param max_ticks: most ticks to run for
+    :type max_ticks: int
+    :param inputs: takes in the tick number and returns the directions for the player, no input if None
+    :type inputs: function
+    :param replay: replay to record the player's inputs to, not recorded if None
+    :type replay: Replay or None
+    :returns: the final stats of the game
+    :rtype: Dictionary
+    """
+
+    def run_game(self, max_ticks, inputs=None, replay=None):
+        model = self._model
+        while self.ticks < max_ticks and not model.is_game_over():
+            directions = [] if inputs is None else inputs(self.ticks)
+            if replay is not None:
+                replay.record(model, directions)
+            model.move_player(directions)
+            model.tick()
+            model.remove_effects()
+            model.profiler.end_frame(model.get_entity_counts())
+            self.ticks += 1
+        return model.get_score()
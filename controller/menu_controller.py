@@ -200,7 +200,7 @@ class MenuController:
                 if game_event.type == self.SPAWN_SHIPS:
                     self._model.spawn_ships()
             # Updates display
-            pygame.display.update()
+            self._menus.update_display()
             self._clock.tick(self._fps)
         return 1
 
@@ -279,7 +279,7 @@ class MenuController:
                 if game_event.type == self.SPAWN_SHIPS:
                     self._model.spawn_ships()
             self._menus.render_menu(None)
-            pygame.display.update()
+            self._menus.update_display()
             self._clock.tick(self._fps)
 
     """Parses horizontal movement, which is not continuous upon holding down a key.
@@ -318,5 +318,5 @@ class MenuController:
                 if game_event.type == self.SPAWN_SHIPS:
                     self._model.spawn_ships()
             self._menus.render_menu(stats_container)
-            pygame.display.update()
+            self._menus.update_display()
             self._clock.tick(self._fps)
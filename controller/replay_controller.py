@@ -0,0 +1,125 @@
+import pygame
+
+from src.model.model import Model
+from src.utils import config
+from src.utils.null_sound import NullSound
+
+"""Controller that plays back a recorded game by feeding the recorded directions to a model tick by tick. Plays in a
+window at normal or fast-forward speed, or headlessly as fast as possible. Seeking loads the closest earlier snapshot
+of the game and simulates forward from there.
+"""
+
+
+class ReplayController:
+    # Most ticks simulated per frame when fast-forwarding
+    _max_speed = 16
+
+    """Constructor that rebuilds the recorded game's model.
+
+    :param replay: replay to play back
+    :type replay: Replay
+    :param view: view to render the game to, plays back headlessly if None
+    :type view: View or None
+    """
+
+    def __init__(self, replay, view=None):
+        self._replay = replay
+        self._view = view
+        config.player_ship = replay.ship
+        self._model = Model(replay.difficulty, replay.game_mode, headless=view is None, seed=replay.seed)
+        self._model.switch_weapon(replay.weapon)
+        self._fps = config.game_fps
+        self.ticks = 0
+        # Starts from the first snapshot, which holds anything set up before the recording started
+        if replay.keyframes:
+            self._model.load_state(replay.get_keyframe(0)[1])
+
+    """Returns the model being played back.
+
+    :returns: the model
+    :rtype: Model
+    """
+
+    def get_model(self):
+        return self._model
+
+    """Plays back the next tick of the replay.
+    """
+
+    def step(self):
+        model = self._model
+        model.move_player(self._replay.get_directions(self.ticks))
+        model.tick()
+        model.remove_effects()
+        model.profiler.end_frame(model.get_entity_counts())
+        self.ticks += 1
+
+    """Jumps to a tick of the replay. Loads the latest snapshot at or before the tick, unless the current tick is
+    closer, and plays forward from there without sound.
+
+    :param tick: tick to jump to, clamped to the length of the replay
+    :type tick: int
+    """
+
+    def seek(self, tick):
+        tick = max(0, min(tick, self._replay.ticks))
+        keyframe_tick, state = self._replay.get_keyframe(tick)
+        if not keyframe_tick <= self.ticks <= tick:
+            self._model.load_state(state)
+            self.ticks = keyframe_tick
+        sounds = self._model.sounds
+        self._model.sounds = {name: NullSound() for name in sounds}
+        while self.ticks < tick:
+            self.step()
+        self._model.sounds = sounds
+
+    """Plays back the whole replay without rendering.
+
+    :returns: the final stats of the game
+    :rtype: Dictionary
+    """
+
+    def run_headless(self):
+        while self.ticks < self._replay.ticks:
+            self.step()
+        return self._model.get_score()
+
+    """Plays back the replay in the view until it ends or the window is closed. Space pauses, the left and right
+    arrows jump back and forward by the time between snapshots, and the up and down arrows change the speed.
+
+    :param speed: ticks simulated per frame
+    :type speed: int
+    """
+
+    def run(self, speed=1):
+        clock = pygame.time.Clock()
+        paused = False
+        ANIMATE = pygame.USEREVENT + 1
+        pygame.time.set_timer(ANIMATE, 300)
+        while self.ticks < self._replay.ticks:
+            for game_event in pygame.event.get():
+                if game_event.type == pygame.QUIT:
+                    return
+                elif game_event.type == pygame.KEYUP:
+                    if game_event.key == pygame.K_ESCAPE:
+                        return
+                    elif game_event.key == pygame.K_SPACE:
+                        paused = not paused
+                    elif game_event.key == pygame.K_LEFT:
+                        self.seek(self.ticks - self._replay.keyframe_interval)
+                    elif game_event.key == pygame.K_RIGHT:
+                        self.seek(self.ticks + self._replay.keyframe_interval)
+                    elif game_event.key == pygame.K_UP:
+                        speed = min(speed * 2, self._max_speed)
+                    elif game_event.key == pygame.K_DOWN:
+                        speed = max(speed // 2, 1)
+                if game_event.type == ANIMATE:
+                    self._view.animate()
+            if not paused:
+                for _ in range(min(speed, self._replay.ticks - self.ticks)):
+                    self.step()
+            self._view.render(self._model.get_player(), self._model.get_projectiles(),
+                              self._model.get_ships(), self._model.get_effects())
+            self._view.render_fps(int(clock.get_fps()))
+            self._view.update_display()
+            clock.tick(self._fps)
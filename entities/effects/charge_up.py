@@ -5,6 +5,8 @@ from src.utils import config
 
 
 class ChargeUp(Effect):
+    __slots__ = ()
+
     # Charge delay in frames
     charge_frames = 20
     charge_delay = charge_frames * int(config.game_fps / 30) - 1
@@ -23,4 +25,9 @@ class ChargeUp(Effect):
         super().__init__(x - .75 * config.ship_size, y - .75 * config.ship_size, entity_id)
         self.max_frame = self.charge_delay
 
+    """Resets the charge up as if it was just made, so it can be reused from a free list. Takes the same
+    arguments as the constructor.
+    """
 
+    def reset(self, x, y, entity_id):
+        self.__init__(x, y, entity_id)
@@ -3,6 +3,9 @@
 
 
 class Effect:
+    # Attributes are kept in slots instead of a dictionary to save memory, subclasses only list the ones they add
+    __slots__ = ("entity_id", "x", "y", "curr_frame", "max_frame", "frame_multiplier")
+
     """Constructor to make the Effect.
 
     :param x: x coordinate of effect
@@ -5,6 +5,7 @@ from src.utils import config
 
 
 class Explosion(Effect):
+    __slots__ = ()
 
     """Constructor to make the explosion.
 
@@ -21,4 +22,9 @@ class Explosion(Effect):
         # Explosions have 5 frames of animation
         self.max_frame = 5 * int(config.game_fps / 30) - 1
 
+    """Resets the explosion as if it was just made, so it can be reused from a free list. Takes the same
+    arguments as the constructor.
+    """
 
+    def reset(self, x, y, entity_id):
+        self.__init__(x, y, entity_id)
@@ -7,6 +7,8 @@ from src.utils.ids.effect_id import EffectID
 
 
 class PopUp(Effect):
+    __slots__ = ("text", "center_x", "center_y", "alpha")
+
     """Constructor to make the Effect.
 
     :param text: what text to render
@@ -28,3 +30,5 @@ class PopUp(Effect):
         # Number of frames it lasts
         self.max_frame = config.game_fps * seconds
         self.text = text
+        # Transparency it is drawn with, faded by the view as it is shown, None until first drawn
+        self.alpha = None
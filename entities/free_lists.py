@@ -0,0 +1,105 @@
+from src.entities.effects.charge_up import ChargeUp
+from src.entities.effects.explosion import Explosion
+from src.entities.projectiles.bullet import Bullet
+from src.entities.projectiles.missile import Missile
+from src.utils import config
+
+"""Free lists of the projectiles and effects made and thrown away the most often, so high fire rates and long bursts
+reuse old objects instead of making new ones. An object is reused by calling its reset() with the arguments its
+constructor takes. Objects are given back once the model is done with them: bullets once they are copied into a
+projectile pool, missiles once they leave a pool, and effects once they end.
+"""
+
+
+class FreeList:
+    """Constructor to make an empty free list.
+
+    :param entity_class: class of the objects in the list
+    :type entity_class: type
+    :param size: most unused objects to keep
+    :type size: int
+    """
+
+    def __init__(self, entity_class, size=config.free_list_size):
+        self._entity_class = entity_class
+        self._size = size
+        self._free = []
+        # Objects handed out that were reused, and ones that had to be made
+        self.hits = 0
+        self.misses = 0
+
+    """Returns an object set up with the given arguments, reusing an unused one if there is one.
+
+    :returns: the object
+    :rtype: Projectile or Effect
+    """
+
+    def acquire(self, *args):
+        if self._free:
+            self.hits += 1
+            entity = self._free.pop()
+            entity.reset(*args)
+            return entity
+        self.misses += 1
+        return self._entity_class(*args)
+
+    """Gives back an object that is no longer used anywhere.
+
+    :param entity: object to give back
+    :type entity: Projectile or Effect
+    """
+
+    def release(self, entity):
+        if len(self._free) < self._size:
+            self._free.append(entity)
+
+    """Returns how many objects were reused, made, and are waiting to be reused.
+
+    :returns: hits, misses, and free objects
+    :rtype: {str: int}
+    """
+
+    def get_stats(self):
+        return {"HITS": self.hits, "MISSES": self.misses, "FREE": len(self._free)}
+
+
+bullets = FreeList(Bullet)
+missiles = FreeList(Missile)
+explosions = FreeList(Explosion)
+charge_ups = FreeList(ChargeUp)
+# Free list for each class, exact classes only so subclasses are never handed out as their parent
+_free_lists = {Bullet: bullets, Missile: missiles, Explosion: explosions, ChargeUp: charge_ups}
+
+"""Gives back an object to its free list, does nothing if it has none.
+
+:param entity: object to give back
+:type entity: Projectile or Effect
+"""
+
+
+def release(entity):
+    free_list = _free_lists.get(type(entity))
+    if free_list is not None:
+        free_list.release(entity)
+
+
+"""Returns the statistics of every free list.
+
+:returns: hits, misses, and free objects of each free list
+:rtype: {str: {str: int}}
+"""
+
+
+def get_stats():
+    return {"BULLET": bullets.get_stats(), "MISSILE": missiles.get_stats(), "EXPLOSION": explosions.get_stats(),
+            "CHARGE UP": charge_ups.get_stats()}
+
+
+"""Sets the hit and miss counts of every free list back to zero.
+"""
+
+
+def reset_stats():
+    for free_list in _free_lists.values():
+        free_list.hits = 0
+        free_list.misses = 0
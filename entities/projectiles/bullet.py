@@ -7,6 +7,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Bullet(Projectile):
+    __slots__ = ("direction", "x_change", "y_change")
+
     """Constructor that initializes the bullet.
 
     :param direction: angle the bullet should be going
@@ -23,6 +25,13 @@ class Bullet(Projectile):
             self.has_splash = True
             self.air_burst = True
 
+    """Resets the bullet as if it was just made, so it can be reused from a free list. Takes the same
+    arguments as the constructor.
+    """
+
+    def reset(self, speed, x, y, direction, damage, entity_id):
+        self.__init__(speed, x, y, direction, damage, entity_id)
+
     """Moves the bullet depending on what direction it is going
     """
 
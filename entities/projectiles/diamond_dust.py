@@ -1,5 +1,3 @@
-import random
-
 from src.entities.projectiles.projectile import Projectile
 
 """A really bad missile. Is currently the behavior for the weapon Diamond Dust.
@@ -8,16 +6,21 @@ Was the initial buggy missile behavior that I turned into a feature and made mor
 
 
 class DiamondDust(Projectile):
+    __slots__ = ("direction", "orientation", "target", "_rng")
+
     """Constructor that initializes the missile.
 
     :param direction: angle the missile should be going
     :type direction: int
     :param target: target to follow
     :type target: Ship
+    :param rng: random number generator for its movement
+    :type rng: random.Random
     """
 
-    def __init__(self, speed, x, y, direction, damage, entity_id, target):
+    def __init__(self, speed, x, y, direction, damage, entity_id, target, rng):
         super().__init__(speed, x, y, damage, entity_id)
+        self._rng = rng
         self.direction = direction
         self.has_splash = True
         self.target = target
@@ -39,10 +42,10 @@ class DiamondDust(Projectile):
     """
 
     def move(self):
-        random_speed = random.randint(1, 3 * self.speed)
-        random_direction = random.randint(-180, 180)
+        random_speed = self._rng.randint(1, 3 * self.speed)
+        random_direction = self._rng.randint(-180, 180)
         self.direction = random_direction
-        random_x = random.randint(5 * -self.speed, 5 * self.speed)
+        random_x = self._rng.randint(5 * -self.speed, 5 * self.speed)
         self.x += random_x
         self.y += random_speed * self.orientation
         if self.target is not None:
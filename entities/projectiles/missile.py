@@ -8,6 +8,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Missile(Projectile):
+    __slots__ = ("direction", "orientation", "target", "ticks", "x_change", "y_change")
+
     """Constructor that initializes the missile.
 
     :param direction: angle the bullet should be going
@@ -33,6 +35,13 @@ class Missile(Projectile):
         else:
             self.has_splash = True
 
+    """Resets the missile as if it was just made, so it can be reused from a free list. Takes the same
+    arguments as the constructor.
+    """
+
+    def reset(self, speed, x, y, direction, damage, entity_id, target):
+        self.__init__(speed, x, y, direction, damage, entity_id, target)
+
     """Moves the missile depending on where the enemy is.
     """
 
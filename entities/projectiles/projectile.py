@@ -4,6 +4,10 @@ from src.utils import config
 
 
 class Projectile:
+    # Attributes are kept in slots instead of a dictionary to save memory, subclasses only list the ones they add
+    __slots__ = ("speed", "x", "y", "prev_x", "prev_y", "damage", "entity_id", "has_splash", "air_burst", "size",
+                 "target_destroyed", "remove_if_offscreen")
+
     """Initializes the projectile.
 
     :param speed: speed of the projectile
@@ -20,6 +24,9 @@ class Projectile:
         self.speed = speed
         self.x = x
         self.y = y
+        # Position before the last tick, drawn from when rendering between ticks, None until the first tick
+        self.prev_x = None
+        self.prev_y = None
         self.damage = damage
         self.entity_id = entity_id
         self.has_splash = False
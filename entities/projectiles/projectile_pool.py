@@ -0,0 +1,325 @@
+import numpy as np
+
+from src.entities import free_lists
+from src.entities.projectiles.bullet import Bullet
+from src.utils import config
+from src.utils.ids.projectile_id import ProjectileID
+
+"""Pool of projectiles stored as arrays. Bullets and flak travel in straight lines, so their positions, velocities
+and stats are kept in NumPy arrays and moved all at once. Projectiles that steer themselves such as missiles,
+Diamond Dust and pulses are kept as objects behind the same interface.
+"""
+
+
+class ProjectilePool:
+    # Flags for each bullet
+    SPLASH = 1
+    AIR_BURST = 2
+    INT_DAMAGE = 4
+    # Maps projectile IDs to the numbers stored in the type array and back
+    _projectile_ids = list(ProjectileID)
+    _type_indices = {projectile_id: index for index, projectile_id in enumerate(_projectile_ids)}
+
+    """Constructor to make the pool.
+
+    :param capacity: number of bullets to make room for, grows when full
+    :type capacity: int
+    """
+
+    def __init__(self, capacity=64):
+        self._capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.damage = np.zeros(capacity)
+        self.direction = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.type_id = np.zeros(capacity, dtype=np.int16)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        # Order the projectiles were added in, so hits are checked in firing order
+        self._order = np.zeros(capacity, dtype=np.int64)
+        self.count = 0
+        # Projectiles that are not straight line bullets
+        self.objects = []
+        self._object_order = []
+        self._next_order = 0
+        # Reused to hand out a bullet when checking hits
+        self._cursor = Bullet(0, 0, 0, 0, 0, ProjectileID.FRIENDLY_BULLET)
+
+    """Returns how many projectiles are in the pool.
+
+    :returns: number of projectiles
+    :rtype: int
+    """
+
+    def __len__(self):
+        return self.count + len(self.objects)
+
+    """Adds a projectile to the pool. Bullets are copied into the arrays and given back to their free list, anything
+    else is kept as is.
+
+    :param projectile: projectile to add
+    :type projectile: Projectile
+    """
+
+    def append(self, projectile):
+        if type(projectile) is not Bullet:
+            self.objects.append(projectile)
+            self._object_order.append(self._next_order)
+            self._next_order += 1
+            return
+        if self.count == self._capacity:
+            self._grow()
+        index = self.count
+        self.x[index] = projectile.x
+        self.y[index] = projectile.y
+        self.dx[index] = projectile.x_change
+        self.dy[index] = projectile.y_change
+        self.damage[index] = projectile.damage
+        self.direction[index] = projectile.direction
+        self.speed[index] = projectile.speed
+        self.type_id[index] = self._type_indices[projectile.entity_id]
+        flags = 0
+        if projectile.has_splash:
+            flags |= self.SPLASH
+        if projectile.air_burst:
+            flags |= self.AIR_BURST
+        if isinstance(projectile.damage, int):
+            flags |= self.INT_DAMAGE
+        self.flags[index] = flags
+        self._order[index] = self._next_order
+        self._next_order += 1
+        self.count += 1
+        free_lists.bullets.release(projectile)
+
+    """Doubles the size of every array.
+    """
+
+    def _grow(self):
+        self._capacity *= 2
+        for name in ("x", "y", "dx", "dy", "damage", "direction", "speed", "type_id", "flags", "_order"):
+            old = getattr(self, name)
+            new = np.zeros(self._capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    """Moves every projectile. Bullets are moved in one step.
+    """
+
+    def move(self):
+        count = self.count
+        self.x[:count] += self.dx[:count]
+        self.y[:count] += self.dy[:count]
+        for projectile in self.objects:
+            projectile.move()
+
+    """Shifts every projectile by the given amount.
+
+    :param x: distance to move in the x direction
+    :type x: float
+    :param y: distance to move in the y direction
+    :type y: float
+    """
+
+    def offset(self, x, y):
+        count = self.count
+        self.x[:count] += x
+        self.y[:count] += y
+        for projectile in self.objects:
+            projectile.x += x
+            projectile.y += y
+
+    """Removes every projectile whose center has left the screen by more than half its size.
+    """
+
+    def remove_off_screen(self):
+        self._remove_off_screen_bullets()
+        if self.objects:
+            self._filter_objects([not self._object_is_off_screen(projectile) for projectile in self.objects])
+
+    """Removes every bullet off screen with a single mask over the arrays.
+    """
+
+    def _remove_off_screen_bullets(self):
+        count = self.count
+        if count:
+            half = config.ship_size // 2
+            center_x = self.x[:count] + half
+            center_y = self.y[:count] + half
+            off_screen = (center_x > config.display_width + half) | (center_x < -half) | \
+                         (center_y > config.display_height + half) | (center_y < -half)
+            if off_screen.any():
+                self._compact(~off_screen)
+
+    """Checks if the given object projectile is off screen.
+
+    :param projectile: projectile to check
+    :type projectile: Projectile
+    :returns: True if it is off screen
+    :rtype: bool
+    """
+
+    def _object_is_off_screen(self, projectile):
+        if not projectile.remove_if_offscreen:
+            return False
+        size = projectile.size // 2
+        center = (projectile.x + size, projectile.y + size)
+        x_off = center[0] > config.display_width + size or center[0] < -size
+        y_off = center[1] > config.display_height + size or center[1] < -size
+        return x_off or y_off
+
+    """Removes every projectile the given function returns True for. Projectiles are checked in the order they
+    were added. Bullets are handed to the function through one shared Bullet, so it should not be kept.
+
+    :param should_remove: takes a projectile and returns if it should be removed
+    :type should_remove: function
+    """
+
+    def remove_if(self, should_remove):
+        self._check_projectiles(should_remove, False)
+
+    """Moves every projectile, removes the ones off screen, then removes the ones the given function returns True
+    for. Bullets are all moved at once. Missiles and other objects are moved right before they are checked, since
+    where they go depends on whether projectiles fired before them destroyed their target.
+
+    :param should_remove: takes a projectile and returns if it should be removed
+    :type should_remove: function
+    """
+
+    def update(self, should_remove):
+        count = self.count
+        self.x[:count] += self.dx[:count]
+        self.y[:count] += self.dy[:count]
+        self._remove_off_screen_bullets()
+        self._check_projectiles(should_remove, True)
+
+    """Checks every projectile in the order they were added, removing the ones the given function returns True for.
+
+    :param should_remove: takes a projectile and returns if it should be removed
+    :type should_remove: function
+    :param move_objects: True to move objects and check if they're off screen before checking them
+    :type move_objects: bool
+    """
+
+    def _check_projectiles(self, should_remove, move_objects):
+        count = self.count
+        keep = np.ones(count, dtype=bool)
+        keep_objects = [True] * len(self.objects)
+        # Plain Python values are much faster to do math on than NumPy scalars
+        stats = self._get_stats(count)
+        orders = self._order[:count].tolist()
+        objects = self.objects
+        object_orders = self._object_order
+        cursor = self._cursor
+        bullet = 0
+        other = 0
+        while bullet < count or other < len(objects):
+            if other == len(objects) or (bullet < count and orders[bullet] < object_orders[other]):
+                self._load_stats(cursor, stats, bullet)
+                if should_remove(cursor):
+                    keep[bullet] = False
+                bullet += 1
+            else:
+                projectile = objects[other]
+                if move_objects:
+                    projectile.move()
+                    if self._object_is_off_screen(projectile):
+                        keep_objects[other] = False
+                if keep_objects[other] and should_remove(projectile):
+                    keep_objects[other] = False
+                other += 1
+        if not keep.all():
+            self._compact(keep)
+        if not all(keep_objects):
+            self._filter_objects(keep_objects)
+
+    """Returns the first bullets in the arrays as lists.
+
+    :param count: number of bullets
+    :type count: int
+    :returns: lists of x, y, damage, flags, type, direction, speed, dx and dy
+    :rtype: tuple
+    """
+
+    def _get_stats(self, count):
+        return tuple(array[:count].tolist() for array in (self.x, self.y, self.damage, self.flags, self.type_id,
+                                                           self.direction, self.speed, self.dx, self.dy))
+
+    """Copies the stats of the bullet at the given index onto the given bullet.
+
+    :param bullet: bullet to copy onto
+    :type bullet: Bullet
+    :param stats: lists of bullet stats from _get_stats()
+    :type stats: tuple
+    :param index: index of the bullet
+    :type index: int
+    """
+
+    def _load_stats(self, bullet, stats, index):
+        xs, ys, damages, flags, type_ids, directions, speeds, dxs, dys = stats
+        bullet_flags = flags[index]
+        bullet.x = xs[index]
+        bullet.y = ys[index]
+        bullet.damage = int(damages[index]) if bullet_flags & self.INT_DAMAGE else damages[index]
+        bullet.entity_id = self._projectile_ids[type_ids[index]]
+        bullet.has_splash = bool(bullet_flags & self.SPLASH)
+        bullet.air_burst = bool(bullet_flags & self.AIR_BURST)
+        bullet.direction = directions[index]
+        bullet.speed = speeds[index]
+        bullet.x_change = dxs[index]
+        bullet.y_change = dys[index]
+
+    """Keeps only the bullets marked in the given mask, preserving their order.
+
+    :param keep: which bullets to keep
+    :type keep: numpy.ndarray
+    """
+
+    def _compact(self, keep):
+        count = self.count
+        remaining = int(np.count_nonzero(keep))
+        for array in (self.x, self.y, self.dx, self.dy, self.damage, self.direction, self.speed, self.type_id,
+                      self.flags, self._order):
+            array[:remaining] = array[:count][keep]
+        self.count = remaining
+
+    """Keeps only the object projectiles marked in the given list, giving the rest back to their free lists.
+
+    :param keep: which projectiles to keep
+    :type keep: [bool]
+    """
+
+    def _filter_objects(self, keep):
+        for projectile, kept in zip(self.objects, keep):
+            if not kept:
+                free_lists.release(projectile)
+        self.objects[:] = [projectile for projectile, kept in zip(self.objects, keep) if kept]
+        self._object_order[:] = [order for order, kept in zip(self._object_order, keep) if kept]
+
+    """Returns the positions, directions and IDs of the bullets for rendering.
+
+    :param rewind: fraction of a tick to move the bullets back along their paths by
+    :type rewind: float
+    :returns: x positions, y positions, directions, and projectile IDs
+    :rtype: ([float], [float], [float], [ProjectileID])
+    """
+
+    def get_bullets(self, rewind=0):
+        count = self.count
+        projectile_ids = self._projectile_ids
+        x = self.x[:count]
+        y = self.y[:count]
+        if rewind:
+            x = x - self.dx[:count] * rewind
+            y = y - self.dy[:count] * rewind
+        return (x.tolist(), y.tolist(), self.direction[:count].tolist(),
+                [projectile_ids[index] for index in self.type_id[:count].tolist()])
+
+    """Removes every projectile.
+    """
+
+    def clear(self):
+        self.count = 0
+        del self.objects[:]
+        del self._object_order[:]
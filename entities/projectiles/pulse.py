@@ -6,6 +6,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Pulse(Projectile):
+    __slots__ = ("charge_time", "curr_charge")
+
     """Constructs the pulse projectile.
 
     :param speed: The speed at which the pulse forms in frames.
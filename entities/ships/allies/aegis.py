@@ -7,6 +7,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Aegis(Ally):
+    __slots__ = ()
+
     """Constructs the Aegis.
     """
 
@@ -1,11 +1,9 @@
 import math
-import random
 
 import pygame
 
-from src.entities.projectiles.bullet import Bullet
+from src.entities import free_lists
 from src.entities.projectiles.diamond_dust import DiamondDust
-from src.entities.projectiles.missile import Missile
 from src.entities.ships.ship import Ship
 from src.utils import config
 from src.utils.ids.player_id import PlayerID
@@ -16,6 +14,9 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Ally(Ship):
+    __slots__ = ("entity_id", "score", "fire_rate", "fire_variance", "projectile_damage", "projectile_speed",
+                 "projectile_type", "ready_to_fire", "ticks")
+
     """Constructs the ally.
     """
 
@@ -59,16 +60,18 @@ class Ally(Ship):
         if self.size > config.ship_size:
             x_pos = self.x + ((self.size - default_size) // 2)
             y_pos = self.y + ((self.size - default_size) // 2)
-        offset = random.randint(-self.fire_variance, self.fire_variance)
+        offset = self.rng.randint(-self.fire_variance, self.fire_variance)
         angle = self.angle + 90 + offset
         weapon_type = self.projectile_type
-        projectile = Bullet(self.projectile_speed, x_pos, y_pos, angle + offset, self.projectile_damage, weapon_type)
         if weapon_type == ProjectileID.FRIENDLY_MISSILE:
-            projectile = Missile(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage, weapon_type,
-                                 target)
+            projectile = free_lists.missiles.acquire(self.projectile_speed, x_pos, y_pos, angle,
+                                                     self.projectile_damage, weapon_type, target)
         elif weapon_type == ProjectileID.DIAMOND_DUST:
             projectile = DiamondDust(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage,
-                                     ProjectileID.ENEMY_BULLET, target)
+                                     ProjectileID.ENEMY_BULLET, target, self.rng)
+        else:
+            projectile = free_lists.bullets.acquire(self.projectile_speed, x_pos, y_pos, angle + offset,
+                                                    self.projectile_damage, weapon_type)
 
         projectiles.append(projectile)
 
@@ -111,6 +114,6 @@ class Ally(Ship):
         """
 
     def _generate_pos(self):
-        x = random.randint(config.ship_size, config.display_width - (2 * config.ship_size))
-        y = random.randint(config.display_height // 2, config.display_height - config.ship_size)
+        x = self.rng.randint(config.ship_size, config.display_width - (2 * config.ship_size))
+        y = self.rng.randint(config.display_height // 2, config.display_height - config.ship_size)
         return x, y
@@ -6,6 +6,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Citadel(Ally):
+    __slots__ = ()
+
     """Constructs the citadel.
     """
 
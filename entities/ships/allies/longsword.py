@@ -7,6 +7,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Longsword(Ally):
+    __slots__ = ("_effects", "_ships_spawned_total")
+
     # Number of ships it spawns
     ships_spawned = 1
     """Constructor to make the Longsword ship
@@ -39,25 +41,28 @@ class Longsword(Ally):
         self.entity_id = AllyID.LONGSWORD
         self.projectile_type = ProjectileID.FRIENDLY_MISSILE
         self.fire_variance = 60
-        self._turrets = []
         self._effects = effects
         self._ships_spawned_total = 0
 
-    """Spawns turrets for itself.
+    """Spawns turrets attached to itself.
+
+    :returns: the turrets
+    :rtype: [Ally]
     """
 
     def spawn_turrets(self):
+        turrets = []
         x_pos = (self.x + (self.size / 2)) - config.ship_size
         for _ in range(2):
             for i in range(3):
                 y_pos = self.y + (self.size / 2) - (i * config.ship_size)
                 archer = enemy_generator.generate_enemy(AllyID.ARCHER, x_pos, y_pos, hp=self.hp + self.shield,
-                                                        fire_rate=config.game_fps // 2)
+                                                        fire_rate=config.game_fps // 2, rng=self.rng)
                 archer.projectile_damage = 8
-                archer.remove_if_offscreen = False
-                self._turrets.append(archer)
+                turrets.append(archer)
             x_pos += config.ship_size
-        return self._turrets
+        self.attach(turrets)
+        return self.children
 
     """Doesn't rotate at all.
     """
@@ -69,23 +74,15 @@ class Longsword(Ally):
     """
     def move(self):
         if self.speed > 0:
-            x_change = 0
             if self.x < self.waypoint.x - self.speed:
                 self.x += self.speed
-                x_change += self.speed
             elif self.x > self.waypoint.x + self.speed:
                 self.x -= self.speed
-                x_change -= self.speed
-            y_change = 0
             if self.y < self.waypoint.y - self.speed:
                 self.y += self.speed
-                y_change += self.speed
             elif self.y > self.waypoint.y + self.speed:
                 self.y -= self.speed
-                y_change -= self.speed
-            for turret in self._turrets:
-                turret.x += x_change
-                turret.y += y_change
+            self.move_children()
 
     """Longsword doesn't do anything when firing.
 
@@ -103,12 +100,5 @@ class Longsword(Ally):
 
     def damage(self, damage):
         super().damage(damage)
-        for turret in self._turrets:
+        for turret in self.children:
             turret.damage(damage)
-
-    """Kills all of its turrets if offscreen.
-    """
-    def offscreen(self):
-        for turret in self._turrets:
-            turret.is_dead = True
-            turret.hp = 0
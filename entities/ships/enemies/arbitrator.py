@@ -7,6 +7,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Arbitrator(Enemy):
+    __slots__ = ()
+
     """Constructor to make the Arbitrator ship
 
     :param x: starting x coordinate of ship
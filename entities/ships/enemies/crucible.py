@@ -7,6 +7,8 @@ from src.utils.ids.enemy_id import EnemyID
 
 
 class Crucible(Enemy):
+    __slots__ = ()
+
     """Constructor to make the Crucible ship
 
     :param x: starting x coordinate of ship
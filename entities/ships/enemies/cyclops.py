@@ -9,6 +9,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Cyclops(BurstFireEnemy):
+    __slots__ = ("effects",)
+
     """Constructor to make the enemy.
 
     :param x: starting x coordinate of ship
@@ -7,6 +7,8 @@ from src.utils import config
 
 
 class Deity(Enemy):
+    __slots__ = ()
+
     def __init__(self, entity_id, hp, fire_rate):
         final_x = (config.display_width / 2) - config.ship_size * 4
         super().__init__(entity_id, hp, 0, final_x, -config.display_height, fire_rate=fire_rate * 4,
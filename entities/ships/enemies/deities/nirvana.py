@@ -6,6 +6,8 @@ from src.utils.ids.enemy_id import EnemyID
 
 
 class Nirvana(Deity):
+    __slots__ = ()
+
     def __init__(self, hp, fire_rate):
         super().__init__(EnemyID.MANDIBLE, hp, fire_rate)
         """
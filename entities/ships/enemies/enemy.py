@@ -1,9 +1,5 @@
-import random
-
-from src.entities.effects.charge_up import ChargeUp
-from src.entities.projectiles.bullet import Bullet
+from src.entities import free_lists
 from src.entities.projectiles.diamond_dust import DiamondDust
-from src.entities.projectiles.missile import Missile
 from src.entities.projectiles.pulse import Pulse
 from src.entities.ships.ship import Ship
 from src.model.stats import ship_stats
@@ -15,7 +11,9 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Enemy(Ship):
-    random.seed()
+    __slots__ = ("entity_id", "score", "fire_rate", "fire_variance", "projectile_damage", "projectile_speed",
+                 "projectile_type", "ready_to_fire", "ticks")
+
     """Constructor to make the enemy.
 
     :param ship_size: size the ship is
@@ -57,7 +55,16 @@ class Enemy(Ship):
         self.fire_variance = 0
         # Ticks to determine when to fire
         self.ticks = 0
-        ##################################################
+
+    """Gives the enemy the random number generator of the model it is in, and picks its first position to move
+    into with it.
+
+    :param rng: random number generator to use
+    :type rng: random.Random
+    """
+
+    def set_rng(self, rng):
+        super().set_rng(rng)
         # Determines the final moving position
         self.end_x, self.end_y = self._generate_pos()
 
@@ -67,8 +74,8 @@ class Enemy(Ship):
     :rtype: (int, int)
     """
     def _generate_pos(self):
-        x = random.randint(0, config.display_width - self.size)
-        y = random.randint(0, -self.size // 2 + config.display_height // 2)
+        x = self.rng.randint(0, config.display_width - self.size)
+        y = self.rng.randint(0, -self.size // 2 + config.display_height // 2)
         return x, y
 
     """Fires projectiles from the enemy to the given target, at the given speed, damage, and size.
@@ -93,18 +100,20 @@ class Enemy(Ship):
         if self.size > config.ship_size:
             x_pos = self.x + ((self.size - default_size) // 2)
             y_pos = self.y + ((self.size - default_size) // 2)
-        offset = random.randint(-self.fire_variance, self.fire_variance)
+        offset = self.rng.randint(-self.fire_variance, self.fire_variance)
         angle = self.angle - 90 + offset
         weapon_type = self.projectile_type
-        projectile = Bullet(self.projectile_speed, x_pos, y_pos, angle + offset, self.projectile_damage, weapon_type)
         if weapon_type == ProjectileID.ENEMY_MISSILE:
-            projectile = Missile(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage, weapon_type,
-                                 target)
+            projectile = free_lists.missiles.acquire(self.projectile_speed, x_pos, y_pos, angle,
+                                                     self.projectile_damage, weapon_type, target)
         elif weapon_type == ProjectileID.DIAMOND_DUST:
             projectile = DiamondDust(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage,
-                                     ProjectileID.ENEMY_BULLET, target)
+                                     ProjectileID.ENEMY_BULLET, target, self.rng)
         elif weapon_type == ProjectileID.PULSE:
             projectile = self._fire_pulse(target)
+        else:
+            projectile = free_lists.bullets.acquire(self.projectile_speed, x_pos, y_pos, angle + offset,
+                                                    self.projectile_damage, weapon_type)
         projectiles.append(projectile)
         return projectile
 
@@ -118,12 +127,13 @@ class Enemy(Ship):
     def _fire_pulse(self, target):
         radius = config.ship_size * 1.5 // 2
         offset = target.size // 2
-        rand_x = random.randint(-self.fire_variance, self.fire_variance)
-        rand_y = random.randint(-self.fire_variance, self.fire_variance)
+        rand_x = self.rng.randint(-self.fire_variance, self.fire_variance)
+        rand_y = self.rng.randint(-self.fire_variance, self.fire_variance)
         projectile = Pulse(self.projectile_speed, target.x + rand_x + offset - radius, target.y + rand_y +
                            offset - radius,
                            self.projectile_damage, radius)
-        charge = ChargeUp(projectile.x + projectile.size / 2, projectile.y + projectile.size / 2, EffectID.RED_AOE)
+        charge = free_lists.charge_ups.acquire(projectile.x + projectile.size / 2, projectile.y + projectile.size / 2,
+                                               EffectID.RED_AOE)
         dif = 2 * self.projectile_speed // charge.charge_frames
         charge.frame_multiplier = dif if dif > 0 else 2
         charge.max_frame = ((self.projectile_speed // 5) * 5) - 1
@@ -7,6 +7,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Judicator(Terminus):
+    __slots__ = ()
+
     """Constructor to make the Judicator ship
 
     :param x: starting x coordinate of ship
@@ -8,6 +8,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class KingMandible(BurstFireEnemy):
+    __slots__ = ("_fire_angle", "_phase")
+
     """Constructor to make the enemy.
 
     :param x: starting x coordinate of ship
@@ -7,6 +7,8 @@ from src.utils.ids.enemy_id import EnemyID
 
 
 class Mantis(BurstFireEnemy):
+    __slots__ = ()
+
     """Constructor to make the enemy.
 
     :param x: starting x coordinate of ship
@@ -7,6 +7,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Mothership(Enemy):
+    __slots__ = ("_ai", "max_spawns", "total_spawned")
+
     # How many ships it spawns:
     ships_spawned = 2
     """Constructor to make the Mothership
@@ -56,8 +58,7 @@ class Mothership(Enemy):
         super().fire(target, projectiles)
         if self._ai is not None and self.total_spawned < self.max_spawns:
             for i in range(self.ships_spawned):
-                ship = self._ai.spawn_enemy(EnemyID.MANDIBLE)
-                ship.x, ship.y = self.x, self.y
+                self._ai.stage_enemy(EnemyID.MANDIBLE, self)
             self.total_spawned += self.ships_spawned
         self.fire_variance = temp
         self.projectile_speed = temp_speed
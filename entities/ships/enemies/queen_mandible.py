@@ -8,6 +8,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class QueenMandible(Enemy):
+    __slots__ = ("_ai", "_phase", "ships_spawned")
+
     """Constructor to make the Queen Mandible.
 
     :param x: starting x coordinate of ship
@@ -56,8 +58,7 @@ class QueenMandible(Enemy):
             super().fire(target, projectiles)
         if self._ai is not None:
             for i in range(self.ships_spawned):
-                ship = self._ai.spawn_enemy(EnemyID.MANDIBLE)
-                ship.x, ship.y = self.x + self.size // 2, self.y + self.size // 2
+                self._ai.stage_enemy(EnemyID.MANDIBLE, self, self.size // 2, self.size // 2)
         self.projectile_speed = temp_speed
 
     """Increases fire rate when less than 50% HP
@@ -6,6 +6,8 @@ from src.utils.ids.enemy_id import EnemyID
 
 
 class Seer(Enemy):
+    __slots__ = ()
+
     """Constructor to make the Seer ship
 
     :param x: starting x coordinate of ship
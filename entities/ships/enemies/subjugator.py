@@ -7,6 +7,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Subjugator(Enemy):
+    __slots__ = ()
+
     """Constructor to make the enemy.
 
     :param x: starting x coordinate of ship
@@ -1,5 +1,6 @@
 import math
 
+from src.entities import free_lists
 from src.entities.effects.charge_up import ChargeUp
 from src.entities.ships.enemies.enemy import Enemy
 from src.utils import config
@@ -11,6 +12,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Terminus(Enemy):
+    __slots__ = ("effects",)
+
     """Constructor to make the Terminus ship
 
     :param x: starting x coordinate of ship
@@ -46,6 +49,6 @@ class Terminus(Enemy):
             offset_y = int(math.cos(math.radians(self.angle))) * (self.size // 4)
             x_pos = self.x + self.size // 2
             y_pos = self.y + self.size // 2
-            charge = ChargeUp(x_pos + offset_x, y_pos + offset_y, EffectID.RED_CHARGE)
+            charge = free_lists.charge_ups.acquire(x_pos + offset_x, y_pos + offset_y, EffectID.RED_CHARGE)
             self.effects.append(charge)
             self.ship_effects.append(charge)
@@ -7,6 +7,8 @@ from src.utils.ids.projectile_id import ProjectileID
 
 
 class Titan(Enemy):
+    __slots__ = ("_ai", "_effects")
+
     """Constructor to make the Titan ship
 
     :param x: starting x coordinate of ship
@@ -38,10 +40,12 @@ class Titan(Enemy):
         self.projectile_type = ProjectileID.ENEMY_MISSILE
         self.fire_variance = 45
         self._ai = ai
-        self._turrets = []
         self._effects = effects
 
-    """Spawns turrets for itself.
+    """Spawns turrets attached to itself.
+
+    :returns: the turrets
+    :rtype: [Enemy]
     """
 
     def spawn_turrets(self):
@@ -54,38 +58,40 @@ class Titan(Enemy):
         # Mantis side turrets
         # Upper middle
         mantis1 = enemy_generator.generate_enemy(EnemyID.MANTIS, left_x - (base_size // 2), center_y - base_size,
-                                                 hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 5)
+                                                 hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 5,
+                                                 rng=self.rng)
         mantis1.entity_id = EnemyID.SUBJUGATOR
         mantis1.projectile_type = ProjectileID.ENEMY_MISSILE
         mantis1.fire_variance = 20
         mantis2 = enemy_generator.generate_enemy(EnemyID.MANTIS, right_x - (base_size // 2), center_y - base_size,
-                                                 hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 5)
+                                                 hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 5,
+                                                 rng=self.rng)
         mantis2.entity_id = EnemyID.SUBJUGATOR
         mantis2.projectile_type = ProjectileID.ENEMY_MISSILE
         mantis2.fire_variance = 20
         # Lower middle
         mantis3 = enemy_generator.generate_enemy(EnemyID.MANTIS, left_x - base_size, center_y, hp=self.max_hp,
-                                                 shield=self.max_shield, fire_rate=self.fire_rate // 4)
+                                                 shield=self.max_shield, fire_rate=self.fire_rate // 4, rng=self.rng)
         mantis4 = enemy_generator.generate_enemy(EnemyID.MANTIS, right_x, center_y, hp=self.max_hp,
-                                                 shield=self.max_shield, fire_rate=self.fire_rate // 4)
+                                                 shield=self.max_shield, fire_rate=self.fire_rate // 4, rng=self.rng)
         # Far left
         mantis5 = enemy_generator.generate_enemy(EnemyID.MANTIS, left_x - (1.5 * base_size), center_y - base_size,
-                                                 hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 3)
+                                                 hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 3,
+                                                 rng=self.rng)
         # Far right
         mantis6 = enemy_generator.generate_enemy(EnemyID.MANTIS, right_x + (base_size // 2), center_y - base_size,
-                                                 hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 3)
+                                                 hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 3,
+                                                 rng=self.rng)
         # Middle
         mantis7 = enemy_generator.generate_enemy(EnemyID.MANTIS, center_x - (base_size // 2), center_y, hp=self.max_hp,
-                                                 shield=self.max_shield, fire_rate=self.fire_rate // 6)
+                                                 shield=self.max_shield, fire_rate=self.fire_rate // 6, rng=self.rng)
         # Middle Terminus
         terminus = enemy_generator.generate_enemy(EnemyID.TERMINUS, center_x - (.75 * base_size), center_y - base_size,
                                                   hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 4,
-                                                  effects=self._effects)
+                                                  effects=self._effects, rng=self.rng)
         terminus.projectile_damage = 20
-        self._turrets = [mantis1, mantis2, mantis3, mantis4, mantis5, mantis6, mantis7, terminus]
-        for turret in self._turrets:
-            turret.remove_if_offscreen = False
-        return self._turrets
+        self.attach([mantis1, mantis2, mantis3, mantis4, mantis5, mantis6, mantis7, terminus])
+        return self.children
 
     """Doesn't rotate at all.
     """
@@ -100,8 +106,7 @@ class Titan(Enemy):
         # Just moves down:
         if self.y != -self.size // 4:
             self.y += self.speed
-            for turret in self._turrets:
-                turret.y += self.speed
+            self.move_children()
 
     """Despoiler fires multiple missiles at the target.
 
@@ -130,5 +135,5 @@ class Titan(Enemy):
 
     def damage(self, damage):
         super().damage(damage)
-        for turret in self._turrets:
+        for turret in self.children:
             turret.damage(damage)
@@ -6,6 +6,8 @@ from src.entities.ships.ship import Ship
 
 
 class Player(Ship):
+    __slots__ = ("entity_id", "score", "damage_taken", "hits_taken")
+
     """Constructor to make the player ship
 
     :param x: starting x coordinate of player
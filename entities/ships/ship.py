@@ -1,5 +1,4 @@
 import math
-import random
 
 import pygame
 
@@ -10,13 +9,28 @@ NO_WAYPOINT = 1
 MOVE_WAYPOINT = 2
 FIRE_WAYPOINT = 3
 MOVE_AND_FIRE_WAYPOINT = 4
+# Attached to a parent ship, which moves it
+ATTACHED = 5
 
 """Represents a generic ship.
 """
 
 
 class Ship:
-    random.seed()
+    # Attributes are kept in slots instead of a dictionary to save memory, subclasses only list the ones they add
+    __slots__ = ("speed", "x", "y", "prev_x", "prev_y", "end_x", "end_y", "size", "angle", "hp", "max_hp", "shield",
+                 "max_shield", "shield_recharge_rate", "shield_delay", "shield_recharge", "is_damaged", "is_dead",
+                 "waypoint", "_wp_state", "wp_done", "remove_if_offscreen", "stealth", "rotation_speed", "ship_effects",
+                 "rng", "parent", "children", "offset_x", "offset_y")
+
+    """Builds the rotation and movement tables of each kind of ship from its own methods, so subclasses that override
+    them are dispatched to without every ship keeping its own tables.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _set_wp_tables(cls)
+
     """Constructor to make the ship.
 
     :param x: starting x coordinate of ship
@@ -37,6 +51,9 @@ class Ship:
         # Position
         self.x = int(x)
         self.y = int(y)
+        # Position before the last tick, drawn from when rendering between ticks, None until the first tick
+        self.prev_x = None
+        self.prev_y = None
         self.end_x = 0
         self.end_y = 0
         # Size of the ship (not scaling, should be a value in pixels)
@@ -68,18 +85,6 @@ class Ship:
         self.waypoint = None
         self._wp_state = NO_WAYPOINT
 
-        # Rotation states
-        self._wp_rotations = {NO_WAYPOINT: self._rotate,
-                              MOVE_WAYPOINT: self._rotate,
-                              FIRE_WAYPOINT: self._rotate_to_wp,
-                              MOVE_AND_FIRE_WAYPOINT: self._rotate_to_wp
-                              }
-        # Movement states
-        self._wp_movement = {NO_WAYPOINT: self._move,
-                             MOVE_WAYPOINT: self._move_to_wp,
-                             FIRE_WAYPOINT: self._move,
-                             MOVE_AND_FIRE_WAYPOINT: self._move_to_wp
-                             }
         # If done moving to the waypoint, True by default
         self.wp_done = True
         # If it should be removed when offscreen
@@ -90,6 +95,14 @@ class Ship:
 
         # Ship effects
         self.ship_effects = []
+        # Random number generator of the model the ship is in, given by set_rng()
+        self.rng = None
+
+        # Ship this one is attached to and its position relative to it, and the ships attached to this one
+        self.parent = None
+        self.offset_x = 0
+        self.offset_y = 0
+        self.children = ()
 
     """Represents the angle the ship is facing.
 
@@ -125,7 +138,7 @@ class Ship:
 
     def rotate(self, target):
         if target is not None:
-            self._wp_rotations[self._wp_state](target)
+            self._wp_rotations[self._wp_state](self, target)
 
     """Rotates the ship towards its waypoint.
     """
@@ -167,6 +180,15 @@ class Ship:
                 self.shield = self.max_shield
         self.ship_effects[:] = [effect for effect in self.ship_effects if effect.animate()]
 
+    """Gives the ship the random number generator of the model it is in, used for where it moves and how it fires.
+
+    :param rng: random number generator to use
+    :type rng: random.Random
+    """
+
+    def set_rng(self, rng):
+        self.rng = rng
+
     """Sets the ship's waypoint.
     
     :param wp: waypoint to travel to
@@ -195,7 +217,7 @@ class Ship:
     """
 
     def move(self):
-        self._wp_movement[self._wp_state]()
+        self._wp_movement[self._wp_state](self)
 
     """Moves the ship randomly to a generated position on the screen.
     """
@@ -258,8 +280,8 @@ class Ship:
     """
 
     def _generate_pos(self):
-        x = random.randint(config.ship_size, config.display_width - (2 * config.ship_size))
-        y = random.randint(0, config.display_height - config.ship_size)
+        x = self.rng.randint(config.ship_size, config.display_width - (2 * config.ship_size))
+        y = self.rng.randint(0, config.display_height - config.ship_size)
         return x, y
 
     """Spins the ship in circles.
@@ -270,8 +292,86 @@ class Ship:
         if self.angle > 360:
             self.angle -= 360
 
-    """Does nothing unless it specifically has a command for being offscreen.
+    """Does nothing while attached, its parent sets where it is.
     """
 
-    def offscreen(self):
+    def _follow(self):
         pass
+
+    """Attaches ships to this one, keeping where they are relative to it. They are moved by move_children() instead
+    of moving themselves, so the whole group moves with one position.
+
+    :param children: ships to attach
+    :type children: [Ship]
+    """
+
+    def attach(self, children):
+        for child in children:
+            child.parent = self
+            child.offset_x = child.x - self.x
+            child.offset_y = child.y - self.y
+            child._wp_state = ATTACHED
+            # Removed with the parent instead
+            child.remove_if_offscreen = False
+        self.children = children
+
+    """Moves the attached ships to where they are relative to this one, along with the effects following them.
+    """
+
+    def move_children(self):
+        x = self.x
+        y = self.y
+        for child in self.children:
+            new_x = x + child.offset_x
+            new_y = y + child.offset_y
+            delta_x = new_x - child.x
+            delta_y = new_y - child.y
+            child.x = new_x
+            child.y = new_y
+            for effect in child.ship_effects:
+                effect.x += delta_x
+                effect.y += delta_y
+
+    """Lets go of the attached ships once this one is destroyed, leaving them where they are.
+    """
+
+    def detach_children(self):
+        for child in self.children:
+            child.parent = None
+            child._wp_state = NO_WAYPOINT
+        self.children = ()
+
+    """Destroys the attached ships along with it when it goes offscreen.
+    """
+
+    def offscreen(self):
+        for child in self.children:
+            child.is_dead = True
+            child.hp = 0
+
+
+"""Sets the functions a kind of ship rotates and moves with in each waypoint state.
+
+:param ship_class: class of the ship
+:type ship_class: type
+"""
+
+
+def _set_wp_tables(ship_class):
+    # Rotation states
+    ship_class._wp_rotations = {NO_WAYPOINT: ship_class._rotate,
+                                MOVE_WAYPOINT: ship_class._rotate,
+                                FIRE_WAYPOINT: ship_class._rotate_to_wp,
+                                MOVE_AND_FIRE_WAYPOINT: ship_class._rotate_to_wp,
+                                ATTACHED: ship_class._rotate
+                                }
+    # Movement states
+    ship_class._wp_movement = {NO_WAYPOINT: ship_class._move,
+                               MOVE_WAYPOINT: ship_class._move_to_wp,
+                               FIRE_WAYPOINT: ship_class._move,
+                               MOVE_AND_FIRE_WAYPOINT: ship_class._move_to_wp,
+                               ATTACHED: ship_class._follow
+                               }
+
+
+_set_wp_tables(Ship)
@@ -4,6 +4,9 @@ from src.utils import config
 
 
 class Waypoint:
+    # Attributes are kept in slots instead of a dictionary to save memory
+    __slots__ = ("x", "y", "size", "is_dead")
+
     """Constructs the waypoint.
 
     :param x: x pos
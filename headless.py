@@ -0,0 +1,58 @@
+import argparse
+import sys
+import os
+import time
+
+# Makes sure the game knows where the files are located:
+
+current_path = os.path.dirname(__file__)  # where this file is located
+outer_path = os.path.abspath(os.path.join(current_path, os.pardir))  # the src folder
+sys.path.insert(1, outer_path)
+
+from src.controller.headless_controller import HeadlessController
+from src.utils import config
+from src.utils.direction import Direction
+from src.utils.ids.difficulty_id import DifficultyID
+from src.utils.ids.gamemode_id import GameModeID
+from src.utils.ids.player_id import PlayerID
+from src.utils.ids.weapon_id import WeaponID
+from src.utils.replay import Replay
+
+"""Runs a game without a window or sound as fast as possible and prints the final stats.
+Example: python headless.py ONSLAUGHT HARD --ticks 36000 --weapon FLAK_CANNON --fire --seed 7
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulates a game without a window or sound.")
+    parser.add_argument("game_mode", choices=[mode.name for mode in GameModeID])
+    parser.add_argument("difficulty", choices=[difficulty.name for difficulty in DifficultyID])
+    parser.add_argument("--ticks", type=int, default=60 * 60 * 10, help="most ticks to simulate")
+    parser.add_argument("--ship", choices=[ship.name for ship in PlayerID])
+    parser.add_argument("--weapon", choices=[weapon.name for weapon in WeaponID])
+    parser.add_argument("--fire", action="store_true", help="hold down fire for the whole game")
+    parser.add_argument("--seed", type=int, help="seed to replay the same game, random if not given")
+    parser.add_argument("--record", metavar="PATH", help="writes a replay of the game to this file")
+    args = parser.parse_args()
+    weapon = WeaponID[args.weapon] if args.weapon else config.weapon
+    controller = HeadlessController(DifficultyID[args.difficulty], GameModeID[args.game_mode],
+                                    ship=PlayerID[args.ship] if args.ship else None, weapon=weapon, seed=args.seed)
+    inputs = (lambda tick: [Direction.FIRE]) if args.fire else None
+    model = controller.get_model()
+    replay = None
+    if args.record:
+        replay = Replay(model.seed, GameModeID[args.game_mode], DifficultyID[args.difficulty], config.player_ship,
+                        weapon)
+    start = time.perf_counter()
+    stats = controller.run_game(args.ticks, inputs, replay)
+    elapsed = time.perf_counter() - start
+    if replay is not None:
+        replay.save(args.record)
+    for stat, value in stats.items():
+        print(stat + ": " + str(value))
+    print("TICKS: " + str(controller.ticks))
+    print("TICKS PER SECOND: " + str(int(controller.ticks / elapsed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,11 @@ outer_path = os.path.abspath(os.path.join(current_path, os.pardir))  # the src f
 sys.path.insert(1, outer_path)
 
 from src.model.menu_model import MenuModel
-from src.utils import config, score_storage
+from src.utils import config, run_history, score_storage
 from src.controller.menu_controller import MenuController
 from src.controller.controller import Controller
 from src.model.model import Model
+from src.utils.replay import Replay
 from src.view.menu_view import MenuView
 from src.view.view import View
 
@@ -32,11 +33,16 @@ def start_game():
         if not play_game:
             score_storage.save_data()
             break
-        view = View(game_mode)
         model = Model(difficulty, game_mode)
+        view = View(game_mode, model.get_ship_ids())
         model.switch_weapon(config.weapon)
-        controller = Controller(model, view)
+        replay = None
+        if config.record_replays:
+            replay = Replay(model.seed, game_mode, difficulty, config.player_ship, config.weapon)
+        controller = Controller(model, view, replay)
         finished = not controller.run_game()
+        if replay is not None:
+            replay.save()
         if not finished:
             finished = menu_controller.display_score(model.get_score())
         else:
@@ -51,6 +57,9 @@ def main():
     pygame.mixer.pre_init(channels=32)
     pygame.init()
     start_game()
+    # Makes sure the pilot and the last runs are written before the game closes
+    score_storage.flush_data()
+    run_history.history.flush()
     pygame.quit()
     pygame.mixer.quit()
 
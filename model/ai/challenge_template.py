@@ -41,15 +41,23 @@ class ChallengeAI(EnemyWaveAI):
             self._next_wave()
             self._model.popup_text(self._start_text, 3)
         self._ticks += 1
-        if len(self._model.enemy_ships) == 0 and len(self._enemies) == 0 \
-                and not self._model.is_game_over():
+        if self._wave_cleared() and len(self._enemies) == 0 and not self._model.is_game_over():
             self.cleared = True
             victory_time = "VICTORY: " + str(self._ticks // config.game_fps) + " SECONDS"
             self._model.popup_text(victory_time, 5, y=config.display_height * (2 / 3))
             self._model.end_game()
-        elif len(self._model.enemy_ships) == 0 and not self._model.is_game_over():
+        elif self._wave_cleared() and not self._model.is_game_over():
             self._next_wave()
 
+    """Returns the IDs of the ships this AI can spawn by itself, not counting ships spawned by other ships.
+
+    :returns: IDs of the ships
+    :rtype: {EnemyID or AllyID or PlayerID}
+    """
+
+    def get_spawn_ids(self):
+        return {enemy for wave in self._enemies for enemy in wave}
+
     """Grabs the time.
 
     :returns: time in seconds
@@ -67,4 +75,4 @@ class ChallengeAI(EnemyWaveAI):
             self._model.popup_text(self._final_wave_text, 3)
         enemies_to_spawn = self._enemies.pop(0)
         for enemy in enemies_to_spawn:
-            self.spawn_enemy(enemy)
+            self.stage_enemy(enemy)
@@ -1,5 +1,3 @@
-import random
-
 from src.model.ai.enemy_ai_waves import EnemyWaveAI
 from src.utils import config, weapon_generator
 from src.utils.ids.difficulty_id import DifficultyID
@@ -30,33 +28,9 @@ class EnemyFateAI(EnemyWaveAI):
         if self._wave == 0:
             self._model.popup_text("WARNING: WEAPONS MALFUNCTION", 3)
         if self._wave % self._weapon_change_wave == 0:
-            self._model.switch_weapon(weapon_generator.generate_weapon())
+            self._model.switch_weapon(weapon_generator.generate_weapon(self._rng))
             self._model.popup_text("SYSTEM VARIANCE DETECTED", 3)
-        rating = self._max_combat_rating
-        # List of entity IDs of available enemies to grab from
-        available_enemies = []
-        for enemy, value in self._combat_ratings.items():
-            if value <= rating:
-                available_enemies.append(enemy)
-        while len(available_enemies) > 0:
-            # Chooses an EnemyID of an enemy to spawn
-            chosen = random.randint(0, len(available_enemies) - 1)
-            # Subtracts their score from the current combat rating
-            enemy = available_enemies[chosen]
-            combat_value = self._combat_ratings.get(available_enemies[chosen])
-            if combat_value <= rating:
-                if enemy == EnemyID.TITAN:
-                    # 20% of spawning a Titan
-                    if random.randint(1, 5) != 5:
-                        available_enemies.remove(enemy)
-                        continue
-                    self._model.popup_text("WARNING: DEATH IMMINENT", 3)
-                    self._stats[EnemyID.TITAN]["HP"] += 500
-                rating -= combat_value
-                available_enemies.remove(enemy)
-                self.spawn_enemy(enemy)
-            else:
-                available_enemies.remove(enemy)
+        self._stage_wave()
         self._max_combat_rating += self._combat_ratio
         # Changes the AI of the smaller ships after 20 waves
         if 200 - self._combat_ratio < self._max_combat_rating < 200 + self._combat_ratio:
@@ -1,5 +1,5 @@
-import random
 from src.model.ai.enemy_ai_waves import EnemyWaveAI
+from src.model.ai.wave_planner import WavePlanner
 from src.utils import config
 from src.utils.ids.difficulty_id import DifficultyID
 from src.utils.ids.enemy_id import EnemyID
@@ -59,6 +59,15 @@ class EnemyHeavenAI(EnemyWaveAI):
             self._fire_rate_range = (fps / 2, fps * 1.5)
             self._wave_rest = 0
 
+    """Returns the IDs of the ships this AI can spawn by itself, not counting ships spawned by other ships.
+
+    :returns: IDs of the ships
+    :rtype: {EnemyID or AllyID or PlayerID}
+    """
+
+    def get_spawn_ids(self):
+        return super().get_spawn_ids() | {EnemyID.CRUCIBLE}
+
     """Increases the shield stats of most smaller enemies.
     """
 
@@ -68,40 +77,24 @@ class EnemyHeavenAI(EnemyWaveAI):
                 values["HP"] += 100
                 values["DAMAGE"] += 1
 
+    """Returns the planner that picks the enemies of Heaven's waves. Enemies other than the Titan can be picked again,
+    a Titan that fails to spawn still uses up its rating, and Crucibles fill whatever rating is left over.
+
+    :returns: the planner
+    :rtype: WavePlanner
+    """
+
+    def _make_planner(self):
+        return WavePlanner(self._combat_ratings, chances=self._spawn_chances, repeats=True, unique={EnemyID.TITAN},
+                           filler=(EnemyID.CRUCIBLE, 50), rejected_cost=True)
+
     """Spawns enemy ships based on the wave number. Number of enemies spawned increases with higher wave counts.
     """
 
     def _spawn_enemies(self):
         if self._wave == 0:
             self._model.popup_text("WARNING: ENEMY FLEET DETECTED", 3)
-        rating = self._max_combat_rating
-        # List of entity IDs of available enemies to grab from
-        available_enemies = []
-        for enemy, value in self._combat_ratings.items():
-            if value <= rating:
-                available_enemies.append(enemy)
-        while len(available_enemies) > 0:
-            # Chooses an EntityID of an enemy to spawn
-            chosen = random.randint(0, len(available_enemies) - 1)
-            # Subtracts their score from the current combat rating
-            enemy = available_enemies[chosen]
-            combat_value = self._combat_ratings.get(available_enemies[chosen])
-            if combat_value <= rating:
-                rating -= combat_value
-                if enemy == EnemyID.TITAN:
-                    # 20% of spawning a Titan
-                    if random.randint(1, 5) != 5:
-                        available_enemies.remove(enemy)
-                        continue
-                    self._model.popup_text("WARNING: DEATH IMMINENT", 3)
-                    self._stats[EnemyID.TITAN]["HP"] += 500
-                    available_enemies.remove(enemy)
-                self.spawn_enemy(enemy)
-            else:
-                available_enemies.remove(enemy)
-        while rating > 0:
-            self.spawn_enemy(EnemyID.CRUCIBLE)
-            rating -= 50
+        self._stage_wave()
         self._max_combat_rating += self._combat_ratio
         # Doubles the enemies spawned every given number of waves and buffs them
         if self._wave % self._enemy_buff_wave == 0 and self._wave != 0:
@@ -1,5 +1,3 @@
-import random
-
 from src.entities.ships.waypoint import Waypoint
 from src.model.ai.enemy_ai_waves import EnemyWaveAI
 from src.utils import config, enemy_generator
@@ -24,7 +22,6 @@ class EnemyOnslaughtAI(EnemyWaveAI):
 
     def __init__(self, model, difficulty):
         super().__init__(model, difficulty)
-        random.seed()
         # Additional enemies not in Classic
         self._combat_ratings[EnemyID.SPECTRE] = 100
         self._combat_ratings[EnemyID.PHANTOM] = 400
@@ -50,7 +47,7 @@ class EnemyOnslaughtAI(EnemyWaveAI):
         if player.score >= self._level_up_exp:
             self._model.level_up()
             self._level_up_exp *= 2
-        if len(self._model.enemy_ships) == 0:
+        if self._wave_cleared():
             # Waiting for next wave:
             if self._wait_for_next_wave():
                 self._spawn_enemies()
@@ -61,33 +58,9 @@ class EnemyOnslaughtAI(EnemyWaveAI):
 
     def _spawn_enemies(self):
         if self._wave == 0:
-            cluster_name = str(random.randint(10, 99))
+            cluster_name = str(self._rng.randint(10, 99))
             self._model.popup_text("APPROACHING ENEMY SUPERCLUSTER-" + cluster_name, 3)
-        rating = self._max_combat_rating
-        # List of entity IDs of available enemies to grab from
-        available_enemies = []
-        for enemy, value in self._combat_ratings.items():
-            if value <= rating:
-                available_enemies.append(enemy)
-        while len(available_enemies) > 0:
-            # Chooses an EnemyID of an enemy to spawn
-            chosen = random.randint(0, len(available_enemies) - 1)
-            # Subtracts their score from the current combat rating
-            enemy = available_enemies[chosen]
-            combat_value = self._combat_ratings.get(available_enemies[chosen])
-            if combat_value <= rating:
-                if enemy == EnemyID.TITAN:
-                    # 20% of spawning a Titan
-                    if random.randint(1, 5) != 5:
-                        available_enemies.remove(enemy)
-                        continue
-                    self._model.popup_text("WARNING: DEATH IMMINENT", 3)
-                    self._stats[EnemyID.TITAN]["HP"] += 500
-                rating -= combat_value
-                available_enemies.remove(enemy)
-                self.spawn_enemy(enemy)
-            else:
-                available_enemies.remove(enemy)
+        self._stage_wave()
         self._max_combat_rating += self._combat_ratio
         # Changes the AI of the smaller ships after 20 waves
         if 200 - self._combat_ratio < self._max_combat_rating < 200 + self._combat_ratio:
@@ -110,20 +83,29 @@ class EnemyOnslaughtAI(EnemyWaveAI):
             v["SHIELD"] += max(int(v["SHIELD"] // 5), 10)
             v["DAMAGE"] += 1
 
+    """Returns the IDs of the ships this AI can spawn by itself, not counting ships spawned by other ships.
+
+    :returns: IDs of the ships
+    :rtype: {EnemyID or AllyID or PlayerID}
+    """
+
+    def get_spawn_ids(self):
+        return super().get_spawn_ids() | {PlayerID.CITADEL, PlayerID.AEGIS, AllyID.LONGSWORD, AllyID.ARCHER}
+
     """Spawns an ally!
     """
 
     def spawn_ally(self):
         # 20% chance of spawning small ships randomly
-        if random.randint(1, 5) == 5:
-            random_ship_quantity = random.randint(1, 4)
+        if self._rng.randint(1, 5) == 5:
+            random_ship_quantity = self._rng.randint(1, 4)
             x_posns = []
             for _ in range(random_ship_quantity):
-                random_speed = random.randint(5, 10)
+                random_speed = self._rng.randint(5, 10)
                 rand_x = 0
                 good_x = False
                 while not good_x:
-                    rand_x = random.randint(0, config.display_width - config.ship_size)
+                    rand_x = self._rng.randint(0, config.display_width - config.ship_size)
                     try:
                         for posn in x_posns:
                             if posn - config.ship_size < rand_x < posn + config.ship_size:
@@ -132,7 +114,7 @@ class EnemyOnslaughtAI(EnemyWaveAI):
                         continue
                     good_x = True
                 ship_id = PlayerID.CITADEL
-                if random.randint(1, 4) == 4:
+                if self._rng.randint(1, 4) == 4:
                     ship_id = PlayerID.AEGIS
                 ship = enemy_generator.generate_enemy(ship_id,
                                                       rand_x,
@@ -140,32 +122,32 @@ class EnemyOnslaughtAI(EnemyWaveAI):
                                                       speed=random_speed,
                                                       hp=30,
                                                       shield=30,
-                                                      fire_rate=config.game_fps // 2)
+                                                      fire_rate=config.game_fps // 2, rng=self._rng)
                 x_posns.append(rand_x)
                 ship.set_waypoint(wp=Waypoint(rand_x, -config.display_height))
                 self._model.friendly_ships.append(ship)
         # 5% chance of spawning a Longsword
-        if random.randint(1, 20) == 20:
+        if self._rng.randint(1, 20) == 20:
             # Only allows 1 on screen at once
             for ship in self._model.friendly_ships:
                 if ship.entity_id == AllyID.LONGSWORD:
                     return
-            rand_x = random.randint(-config.display_width // 2, config.display_width // 2)
+            rand_x = self._rng.randint(-config.display_width // 2, config.display_width // 2)
             ship = enemy_generator.generate_enemy(AllyID.LONGSWORD,
                                                   rand_x,
                                                   config.display_height,
                                                   speed=2,
                                                   hp=2000,
-                                                  shield=500)
+                                                  shield=500, rng=self._rng)
             ship.set_waypoint(wp=Waypoint(rand_x, -config.ship_size * 12))
             self._model.friendly_ships.append(ship)
             self._model.friendly_ships.extend(ship.spawn_turrets())
         # 10% chance of spawning a persistent ally
-        if random.randint(1, 10) == 10 and len(self._model.friendly_ships) < 12:
+        if self._rng.randint(1, 10) == 10 and len(self._model.friendly_ships) < 12:
             hp = 50
-            rand_x = random.randint(0, config.display_width - config.ship_size)
+            rand_x = self._rng.randint(0, config.display_width - config.ship_size)
             ship_id = PlayerID.CITADEL
-            if random.randint(1, 4) == 4:
+            if self._rng.randint(1, 4) == 4:
                 ship_id = PlayerID.AEGIS
                 hp *= 2
             ship = enemy_generator.generate_enemy(ship_id,
@@ -174,12 +156,12 @@ class EnemyOnslaughtAI(EnemyWaveAI):
                                                   speed=5,
                                                   hp=hp,
                                                   shield=20,
-                                                  fire_rate=config.game_fps // 2)
+                                                  fire_rate=config.game_fps // 2, rng=self._rng)
             self._model.friendly_ships.append(ship)
         # 10% chance of spawning an Archer turret
-        if random.randint(1, 10) == 10 and len(self._model.friendly_ships) < 12:
+        if self._rng.randint(1, 10) == 10 and len(self._model.friendly_ships) < 12:
             hp = 50
-            rand_x = random.randint(0, config.display_width - config.ship_size)
+            rand_x = self._rng.randint(0, config.display_width - config.ship_size)
             ship_id = AllyID.ARCHER
             ship = enemy_generator.generate_enemy(ship_id,
                                                   rand_x,
@@ -187,5 +169,5 @@ class EnemyOnslaughtAI(EnemyWaveAI):
                                                   speed=5,
                                                   hp=hp,
                                                   shield=20,
-                                                  fire_rate=config.game_fps // 2)
+                                                  fire_rate=config.game_fps // 2, rng=self._rng)
             self._model.friendly_ships.append(ship)
@@ -48,12 +48,21 @@ class EnemyTitanSlayerAI(EnemyWaveAI):
             self.started_game = True
             self._model.popup_text("WARNING: DEATH IMMINENT", 3)
         self._ticks += 1
-        if len(self._model.enemy_ships) == 0 and not self._model.is_game_over():
+        if self._wave_cleared() and not self._model.is_game_over():
             self.cleared = True
             victory_time = "VICTORY: " + str(self._ticks // config.game_fps) + " SECONDS"
             self._model.popup_text(victory_time, 5, y=config.display_height * (2 / 3))
             self._model.end_game()
 
+    """Returns the IDs of the ships this AI can spawn by itself, not counting ships spawned by other ships.
+
+    :returns: IDs of the ships
+    :rtype: {EnemyID}
+    """
+
+    def get_spawn_ids(self):
+        return {EnemyID.TITAN}
+
     """Grabs the time.
     
     :returns: time in seconds
@@ -76,6 +76,15 @@ class EnemyTutorialAI(EnemyWaveAI):
             self.advance_tutorial()
         player.recharge_shield()
 
+    """Returns the IDs of the ships this AI can spawn by itself, not counting ships spawned by other ships.
+
+    :returns: IDs of the ships
+    :rtype: {EnemyID}
+    """
+
+    def get_spawn_ids(self):
+        return {EnemyID.MANDIBLE}
+
     """Advances the stage of the tutorial this is in.
     """
 
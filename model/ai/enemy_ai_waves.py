@@ -1,5 +1,6 @@
-import random
+from collections import deque
 
+from src.model.ai.wave_planner import WavePlanner
 from src.model.stats import ship_stats
 from src.utils import config, enemy_generator
 from src.utils.ids.difficulty_id import DifficultyID
@@ -11,6 +12,11 @@ This is an AI where number of enemies are spawned in waves. Defeating a wave wil
 
 
 class EnemyWaveAI:
+    # Chance of an enemy spawning when it is picked for a wave
+    _spawn_chances = {EnemyID.TITAN: .2}
+    # Hidden enemies that sometimes make up a whole wave instead, and their combat ratings
+    _hidden_ratings = {EnemyID.SPECTRE: 50, EnemyID.PHANTOM: 400}
+
     """Constructor for the AI. Takes in the model used to run the game.
 
     :param model: model used to run the game and grab information from
@@ -46,8 +52,13 @@ class EnemyWaveAI:
         self._level_up_exp = 100
         # Model to work with
         self._model = model
+        # Random number generator shared with the model
+        self._rng = model.rng
+        # Picks the enemies of each wave, made when the first wave spawns so subclasses can change the ratings first
+        self._planner = None
+        # Ships waiting to be made and where to put them, so a big wave is made over several ticks
+        self._spawn_queue = deque()
         self._ticks = 0
-        random.seed()
         fps = config.game_fps
         # Range in fire rate for enemies, chosen randomly
         self._fire_rate_range = (int(fps * .75), int(fps * 2))
@@ -83,12 +94,21 @@ class EnemyWaveAI:
         if player.score >= self._level_up_exp:
             self._model.level_up()
             self._level_up_exp *= 2
-        if len(self._model.enemy_ships) == 0:
+        if self._wave_cleared():
             # Waiting for next wave:
             if self._wait_for_next_wave():
                 self._spawn_enemies()
                 self._wave += 1
 
+    """Returns the IDs of the ships this AI can spawn by itself, not counting ships spawned by other ships.
+
+    :returns: IDs of the ships
+    :rtype: {EnemyID or AllyID or PlayerID}
+    """
+
+    def get_spawn_ids(self):
+        return set(self._combat_ratings)
+
     """Waits for the next wave. Returns true if ready.
 
     :returns: true if next wave is ready
@@ -116,37 +136,12 @@ class EnemyWaveAI:
     def _spawn_enemies(self):
         if self._wave == 0:
             self._model.popup_text("WARNING: ENEMIES DETECTED", 3)
-        rating = self._max_combat_rating
-        # List of entity IDs of available enemies to grab from
-        available_enemies = []
-        for enemy, value in self._combat_ratings.items():
-            if value <= rating:
-                available_enemies.append(enemy)
         # 10% chance of hidden enemies
-        if self._max_combat_rating >= 400 and random.randint(1, 10) == 10:
-            available_enemies = [EnemyID.SPECTRE, EnemyID.PHANTOM]
+        if self._max_combat_rating >= 400 and self._rng.randint(1, 10) == 10:
             self._model.popup_text("UNKNOWN SIGNATURES DETECTED", 3)
-        while len(available_enemies) > 0:
-            # Chooses an EnemyID of an enemy to spawn
-            chosen = random.randint(0, len(available_enemies) - 1)
-            # Subtracts their score from the current combat rating
-            enemy = available_enemies[chosen]
-            combat_value = self._combat_ratings.get(available_enemies[chosen])
-            if combat_value is None:
-                combat_value = {EnemyID.PHANTOM: 400, EnemyID.SPECTRE: 50}[available_enemies[chosen]]
-            if combat_value <= rating:
-                # 20% of spawning a Titan
-                if enemy == EnemyID.TITAN:
-                    if random.randint(1, 5) != 5:
-                        available_enemies.remove(enemy)
-                        continue
-                    self._model.popup_text("WARNING: DEATH IMMINENT", 3)
-                    self._stats[EnemyID.TITAN]["HP"] += 500
-                rating -= combat_value
-                available_enemies.remove(enemy)
-                self.spawn_enemy(enemy)
-            else:
-                available_enemies.remove(enemy)
+            self._stage_wave(WavePlanner(self._hidden_ratings, chances=self._spawn_chances))
+        else:
+            self._stage_wave()
         self._max_combat_rating += self._combat_ratio
         # Changes the AI of the smaller ships after 20 waves
         if 200 - self._combat_ratio < self._max_combat_rating < 200 + self._combat_ratio:
@@ -161,20 +156,95 @@ class EnemyWaveAI:
             self._model.popup_text("WARNING: INCREASE IN ENEMY STRENGTH", 3, y=int(config.display_height * .6))
             self._combat_ratio *= 2
 
+    """Returns the planner that picks the enemies of this game mode's waves.
+
+    :returns: the planner
+    :rtype: WavePlanner
+    """
+
+    def _make_planner(self):
+        return WavePlanner(self._combat_ratings, chances=self._spawn_chances)
+
+    """Plans a wave with the current combat rating and queues its enemies to spawn.
+
+    :param planner: planner to pick the enemies with, or None for this game mode's planner
+    :type planner: WavePlanner or None
+    """
+
+    def _stage_wave(self, planner=None):
+        if planner is None:
+            if self._planner is None:
+                self._planner = self._make_planner()
+            planner = self._planner
+        for enemy in planner.plan(self._max_combat_rating, self._rng):
+            if enemy == EnemyID.TITAN:
+                self._model.popup_text("WARNING: DEATH IMMINENT", 3)
+                self._stats[EnemyID.TITAN]["HP"] += 500
+            self.stage_enemy(enemy)
+
+    """Returns if every enemy of the wave is dead, counting ships still waiting to be made as alive.
+
+    :returns: True if no enemies are left
+    :rtype: bool
+    """
+
+    def _wave_cleared(self):
+        return len(self._model.enemy_ships) == 0 and len(self._spawn_queue) == 0
+
+    """Queues an enemy ship to be made by release_spawns(). Its stats are copied now, so buffs given after the wave is
+    planned only apply to later waves. A ship spawned by another ship is placed relative to where that ship is when
+    it is made, and is not made at all if that ship was destroyed first.
+
+    :param entity_id: ID of the enemy to spawn
+    :type entity_id: EnemyID
+    :param parent: ship spawning it, or None to put it at the top of the screen
+    :type parent: Ship or None
+    :param offset_x: x position relative to the parent
+    :type offset_x: int
+    :param offset_y: y position relative to the parent
+    :type offset_y: int
+    """
+
+    def stage_enemy(self, entity_id, parent=None, offset_x=0, offset_y=0):
+        self._spawn_queue.append((entity_id, self._stats[entity_id].copy(), parent, offset_x, offset_y))
+
+    """Makes ships waiting in the spawn queue, stopping once the tick's budget of ships is used up. A ship that spawns
+    turrets counts each of them, and is made even if that goes over the budget. Ships whose parent was destroyed
+    are dropped without counting.
+
+    :param budget: most ships to make
+    :type budget: int
+    """
+
+    def release_spawns(self, budget=config.spawns_per_tick):
+        enemy_ships = self._model.enemy_ships
+        while self._spawn_queue and budget > 0:
+            entity_id, stats, parent, offset_x, offset_y = self._spawn_queue.popleft()
+            if parent is not None and parent.is_dead:
+                continue
+            count = len(enemy_ships)
+            ship = self.spawn_enemy(entity_id, stats)
+            if parent is not None:
+                ship.x, ship.y = parent.x + offset_x, parent.y + offset_y
+            budget -= len(enemy_ships) - count
+
     """Spawns a single enemy ship depending on the given entity ID.
     :param entity_id: ID of the enemy to spawn
     :type entity_id: EnemyID
+    :param enemy_stats: stats to give the ship, or None for the enemy's current stats
+    :type enemy_stats: dict or None
     :returns: the ship spawned
     :rtype: Ship
     :raises: ValueError if given entity ID does not correspond to a ship
     """
 
-    def spawn_enemy(self, entity_id):
-        enemy_stats = self._stats.get(entity_id)
+    def spawn_enemy(self, entity_id, enemy_stats=None):
+        if enemy_stats is None:
+            enemy_stats = self._stats.get(entity_id)
         # Creates a random starting position
-        x_pos = random.randint(config.ship_size, config.display_width - config.ship_size)
+        x_pos = self._rng.randint(config.ship_size, config.display_width - config.ship_size)
         # Sets their fire rate randomly, from .75 seconds to 2 seconds
-        fire_rate = random.randint(self._fire_rate_range[0], self._fire_rate_range[1])
+        fire_rate = self._rng.randint(self._fire_rate_range[0], self._fire_rate_range[1])
         y_pos = -config.ship_size
         if entity_id == EnemyID.TITAN:
             y_pos = -config.ship_size * 8
@@ -182,7 +252,8 @@ class EnemyWaveAI:
 
         ship = enemy_generator.generate_enemy(entity_id, x_pos, y_pos, hp=enemy_stats["HP"],
                                               speed=enemy_stats["SPEED"], fire_rate=fire_rate,
-                                              shield=enemy_stats["SHIELD"], ai=self, effects=self._model.get_effects())
+                                              shield=enemy_stats["SHIELD"], ai=self,
+                                              effects=self._model.get_effects(), rng=self._rng)
         ship.y = -ship.size // 2
         self._model.enemy_ships.append(ship)
         if entity_id == EnemyID.TITAN:
@@ -0,0 +1,80 @@
+from bisect import bisect_right
+from itertools import accumulate
+
+"""Chooses which enemies make up a wave given the wave's combat rating. Enemies are picked at random, weighted by
+their weight, from the ones whose combat rating still fits in what is left of the wave's rating, and each pick takes
+its rating away from the wave's. Enemies are kept sorted by their rating so the ones that fit are always a prefix of
+them, which makes the running total of their weights a table for every rating at once: the total weight of the
+enemies that fit is found with one binary search, and a pick with another. The table is only rebuilt when an enemy
+can no longer be picked, which happens at most once per enemy, so a wave of k enemies out of n is planned in
+O(k log n + n^2) however large the rating grows.
+"""
+
+
+class WavePlanner:
+    """Constructor to make the planner for a game mode.
+
+    :param ratings: combat rating of each enemy that can be picked
+    :type ratings: {EnemyID: int}
+    :param weights: how likely each enemy is to be picked compared to the others, 1 for any not given
+    :type weights: {EnemyID: float} or None
+    :param chances: chance of an enemy actually spawning when picked, it is not picked again that wave if it does not
+    :type chances: {EnemyID: float} or None
+    :param repeats: if enemies can be picked again after they spawn
+    :type repeats: bool
+    :param unique: enemies only picked once per wave even if others repeat
+    :type unique: {EnemyID} or None
+    :param filler: enemy and its rating used to fill the rating left over once nothing else fits, or None
+    :type filler: (EnemyID, int) or None
+    :param rejected_cost: if an enemy that is picked but fails its chance to spawn still takes its rating away
+    :type rejected_cost: bool
+    """
+
+    def __init__(self, ratings, weights=None, chances=None, repeats=False, unique=None, filler=None,
+                 rejected_cost=False):
+        # Sorted by rating so the enemies that fit under a rating come first, ties keep their order
+        self._enemies = sorted(ratings, key=lambda enemy: ratings[enemy])
+        self._ratings = [ratings[enemy] for enemy in self._enemies]
+        self._weights = [1 if weights is None else weights.get(enemy, 1) for enemy in self._enemies]
+        # Running total of the weights, a wave makes its own once it removes an enemy
+        self._totals = list(accumulate(self._weights))
+        self._chances = {} if chances is None else chances
+        self._repeats = repeats
+        self._unique = set() if unique is None else unique
+        self._filler = filler
+        self._rejected_cost = rejected_cost
+
+    """Returns the enemies of a wave.
+
+    :param rating: combat rating of the wave
+    :type rating: int
+    :param rng: random number generator to pick with
+    :type rng: random.Random
+    :returns: IDs of the enemies in the order they were picked
+    :rtype: [EnemyID]
+    """
+
+    def plan(self, rating, rng):
+        weights = list(self._weights)
+        totals = self._totals
+        ratings = self._ratings
+        wave = []
+        count = bisect_right(ratings, rating)
+        while count > 0 and totals[count - 1] > 0:
+            index = bisect_right(totals, rng.random() * totals[count - 1], 0, count - 1)
+            enemy = self._enemies[index]
+            chance = self._chances.get(enemy)
+            spawns = chance is None or rng.random() < chance
+            if spawns:
+                wave.append(enemy)
+            if spawns or self._rejected_cost:
+                rating -= ratings[index]
+                if rating < ratings[count - 1]:
+                    count = bisect_right(ratings, rating, 0, count)
+            if not spawns or not self._repeats or enemy in self._unique:
+                weights[index] = 0
+                totals = list(accumulate(weights))
+        if self._filler is not None and rating > 0:
+            filler, filler_rating = self._filler
+            wave.extend([filler] * -(-rating // filler_rating))
+        return wave
@@ -1,8 +1,5 @@
-import random
-
-from src.entities.projectiles.bullet import Bullet
+from src.entities import free_lists
 from src.entities.projectiles.diamond_dust import DiamondDust
-from src.entities.projectiles.missile import Missile
 from src.entities.ships.waypoint import Waypoint
 from src.model.model import Model
 from src.utils import config, enemy_generator
@@ -26,7 +23,6 @@ class MenuModel(Model):
 
     def __init__(self):
         super().__init__(DifficultyID.EASY, GameModeID.CLASSIC)
-        random.seed()
         self._player_ship.x = config.display_width
         self._play = False
         # If a weapon or enemy is being showcased
@@ -60,8 +56,8 @@ class MenuModel(Model):
         self._props[:] = []
         self._player_ship.x = config.display_width / 2 - config.ship_size / 2
         self._player_ship.y = config.display_height / 2
-        for projectile in self.friendly_projectiles + self.enemy_projectiles:
-            projectile.y -= 2 * config.display_height
+        self.friendly_projectiles.offset(0, -2 * config.display_height)
+        self.enemy_projectiles.offset(0, -2 * config.display_height)
 
     """Represents a tick in the game. Handles reloads and moves all projectiles and updates the AI module to
     move enemies. Also rotates enemies to face the player.
@@ -69,9 +65,9 @@ class MenuModel(Model):
 
     def tick(self):
         # Moves all projectiles
-        for projectile in self.friendly_projectiles + self.enemy_projectiles:
-            projectile.move()
-        self._queue = [action for action in self._queue if self._process_action(action)]
+        self.friendly_projectiles.move()
+        self.enemy_projectiles.move()
+        self._timers.advance()
         # Has enemies immediately fire when ready
         for ship in self.enemy_ships + self.friendly_ships + self._props:
             ship.move()
@@ -96,6 +92,7 @@ class MenuModel(Model):
             ship.is_damaged = False
         self._player_ship.is_damaged = False
         self._check_collisions()
+        self.sound_aggregator.play(self.sounds)
 
     """Switches the player's weapon to the given type.
 
@@ -111,7 +108,7 @@ class MenuModel(Model):
         x_pos -= config.ship_size
         for i in range(3):
             mandible = enemy_generator.generate_enemy(EnemyID.MANDIBLE, x_pos + (i * config.ship_size),
-                                                      config.display_height / 3)
+                                                      config.display_height / 3, rng=self.rng)
             mandible.fire_rate = 0
             self._props.append(mandible)
 
@@ -128,12 +125,12 @@ class MenuModel(Model):
 
         if entity_id in [EnemyID.ARBITRATOR, EnemyID.TERMINUS, EnemyID.JUDICATOR]:
             ship = enemy_generator.generate_enemy(entity_id, x_pos - (config.ship_size // 4),
-                                                  config.display_height / 3, effects=self.effects)
+                                                  config.display_height / 3, effects=self.effects, rng=self.rng)
         elif entity_id in [EnemyID.MOTHERSHIP, EnemyID.DESPOILER, EnemyID.PHANTOM, EnemyID.CYCLOPS]:
             ship = enemy_generator.generate_enemy(entity_id, x_pos - (config.ship_size // 2),
-                                                  config.display_height / 3, effects=self.effects)
+                                                  config.display_height / 3, effects=self.effects, rng=self.rng)
         elif entity_id in EnemyID:
-            ship = enemy_generator.generate_enemy(entity_id, x_pos, config.display_height / 3)
+            ship = enemy_generator.generate_enemy(entity_id, x_pos, config.display_height / 3, rng=self.rng)
         else:
             return
         ship.projectile_damage = 0
@@ -158,23 +155,25 @@ class MenuModel(Model):
        """
 
     def _check_collisions(self):
+        self._enemy_grid.build(self.enemy_ships + self._props)
+        self._friendly_grid.build(self.friendly_ships + [self._player_ship])
         # Checks friendly projectiles vs. enemy ships
-        self.friendly_projectiles[:] = [projectile for projectile in self.friendly_projectiles
-                                        if not self._check_if_hit(projectile, self.enemy_ships + self._props,
-                                                                  EffectID.BLUE_EXPLOSION)]
+        self.friendly_projectiles.remove_if(
+            lambda projectile: self._check_if_hit(projectile, self._enemy_grid, EffectID.BLUE_EXPLOSION))
         # Checks enemy projectiles vs. friendly ships
-        self.enemy_projectiles[:] = [projectile for projectile in self.enemy_projectiles
-                                     if not self._check_if_hit(projectile, self.friendly_ships + [self._player_ship],
-                                                               EffectID.RED_EXPLOSION)]
+        self.enemy_projectiles.remove_if(
+            lambda projectile: self._check_if_hit(projectile, self._friendly_grid, EffectID.RED_EXPLOSION))
+        # Gives missiles whose targets were destroyed a new target
+        self._enemy_index.build(self.enemy_ships)
+        self._retarget_missiles(self.friendly_projectiles)
+        self._retarget_missiles(self.enemy_projectiles)
 
     """Removes all off screen objects such as projectiles or ships.
         """
 
     def _remove_off_screen_objects(self):
-        self.friendly_projectiles[:] = [projectile for projectile in self.friendly_projectiles
-                                        if not self._is_off_screen(projectile)]
-        self.enemy_projectiles[:] = [projectile for projectile in self.enemy_projectiles
-                                     if not self._is_off_screen(projectile)]
+        self.friendly_projectiles.remove_off_screen()
+        self.enemy_projectiles.remove_off_screen()
         self.friendly_ships[:] = [ship for ship in self.friendly_ships
                                   if not self._is_off_screen(ship)]
         self.enemy_ships[:] = [ship for ship in self.enemy_ships
@@ -199,15 +198,15 @@ class MenuModel(Model):
 
     def spawn_ships(self):
         # ~18% chance of spawning small ships randomly
-        if random.randint(1, 6) == 6:
-            random_ship_quantity = random.randint(1, 4)
+        if self.rng.randint(1, 6) == 6:
+            random_ship_quantity = self.rng.randint(1, 4)
             x_posns = []
             for _ in range(random_ship_quantity):
-                random_speed = random.randint(5, 15)
+                random_speed = self.rng.randint(5, 15)
                 rand_x = 0
                 good_x = False
                 while not good_x:
-                    rand_x = random.randint(0, config.display_width - config.ship_size)
+                    rand_x = self.rng.randint(0, config.display_width - config.ship_size)
                     try:
                         for posn in x_posns:
                             if posn - config.ship_size < rand_x < posn + config.ship_size:
@@ -216,7 +215,7 @@ class MenuModel(Model):
                         continue
                     good_x = True
                 ship_id = PlayerID.CITADEL
-                if random.randint(1, 4) == 4:
+                if self.rng.randint(1, 4) == 4:
                     ship_id = PlayerID.AEGIS
                 ship = enemy_generator.generate_enemy(ship_id,
                                                       rand_x,
@@ -224,27 +223,27 @@ class MenuModel(Model):
                                                       speed=random_speed,
                                                       hp=10,
                                                       shield=20,
-                                                      fire_rate=config.game_fps // 2)
+                                                      fire_rate=config.game_fps // 2, rng=self.rng)
                 x_posns.append(rand_x)
                 ship.set_waypoint(wp=Waypoint(rand_x, -config.display_height))
                 # They do not shoot
                 ship.ready_to_fire = False
                 self.friendly_ships.append(ship)
         # 4% chance of spawning a Longsword
-        if random.randint(1, 25) == 25:
+        if self.rng.randint(1, 25) == 25:
             count = 0
             for ship in self.friendly_ships:
                 if ship.entity_id == AllyID.LONGSWORD:
                     count += 1
                     if count == 2:
                         return
-            rand_x = random.randint(-config.display_width // 2, config.display_width // 2)
+            rand_x = self.rng.randint(-config.display_width // 2, config.display_width // 2)
             ship = enemy_generator.generate_enemy(AllyID.LONGSWORD,
                                                   rand_x,
                                                   config.display_height,
                                                   speed=2,
                                                   hp=100,
-                                                  shield=100)
+                                                  shield=100, rng=self.rng)
             ship.set_waypoint(wp=Waypoint(rand_x, -config.ship_size * 10))
             ship.ready_to_fire = False
             self.friendly_ships.append(ship)
@@ -259,18 +258,18 @@ class MenuModel(Model):
     def _generate_projectile(self, speed, x, y, angle, damage, entity_id):
         self.play_sound(entity_id)
         if entity_id == ProjectileID.FRIENDLY_BULLET or entity_id == ProjectileID.FRIENDLY_FLAK:
-            return Bullet(speed, x, y, angle, 0, entity_id)
+            return free_lists.bullets.acquire(speed, x, y, angle, 0, entity_id)
         elif entity_id == ProjectileID.FRIENDLY_MISSILE:
             closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships + self._props)
-            return Missile(speed, x, y, angle, 0, entity_id, closest_enemy)
+            return free_lists.missiles.acquire(speed, x, y, angle, 0, entity_id, closest_enemy)
         elif entity_id == ProjectileID.DIAMOND_DUST:
             closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships + self._props)
-            return DiamondDust(speed, x, y, angle, 0, ProjectileID.FRIENDLY_BULLET, closest_enemy)
+            return DiamondDust(speed, x, y, angle, 0, ProjectileID.FRIENDLY_BULLET, closest_enemy, self.rng)
         elif entity_id == ProjectileID.HOMING_BULLET:
             closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships + self._props)
-            return Missile(speed, x, y, angle, 0, ProjectileID.FRIENDLY_BULLET, closest_enemy)
+            return free_lists.missiles.acquire(speed, x, y, angle, 0, ProjectileID.FRIENDLY_BULLET, closest_enemy)
         elif entity_id == ProjectileID.RAILGUN_BLAST:
-            return Bullet(speed, x, y, angle, 0, ProjectileID.RAILGUN_BLAST)
+            return free_lists.bullets.acquire(speed, x, y, angle, 0, ProjectileID.RAILGUN_BLAST)
         else:
             raise ValueError("Invalid projectile type:", entity_id)
 
@@ -1,16 +1,18 @@
+import io
 import math
 import os
+import pickle
 import random
+import time
 
 import pygame
 
+from src.entities import free_lists
 from src.entities.effects.charge_up import ChargeUp
-from src.entities.effects.explosion import Explosion
 from src.entities.effects.popup import PopUp
 from src.entities.effects.screen_tint import ScreenTint
-from src.entities.projectiles.bullet import Bullet
 from src.entities.projectiles.diamond_dust import DiamondDust
-from src.entities.projectiles.missile import Missile
+from src.entities.projectiles.projectile_pool import ProjectilePool
 from src.entities.ships.player import Player
 from src.model.ai.enemy_ai_fate import EnemyFateAI
 from src.model.ai.enemy_ai_heaven import EnemyHeavenAI
@@ -20,8 +22,11 @@ from src.model.ai.enemy_ai_spectral import EnemySpectralAI
 from src.model.ai.enemy_ai_titan_slayer import EnemyTitanSlayerAI
 from src.model.ai.enemy_ai_tutorial import EnemyTutorialAI
 from src.model.ai.enemy_ai_waves import EnemyWaveAI
+from src.model.spatial_hash import SpatialHash
 from src.model.stats import ship_stats, weapon_stats
-from src.utils import config, score_storage
+from src.model.target_index import TargetIndex
+from src.model.timer_wheel import TimerWheel
+from src.utils import config, run_history
 from src.utils.direction import Direction
 from src.utils.ids.ally_id import AllyID
 from src.utils.ids.effect_id import EffectID
@@ -30,6 +35,9 @@ from src.utils.ids.game_id import GameID
 from src.utils.ids.gamemode_id import GameModeID
 from src.utils.ids.projectile_id import ProjectileID
 from src.utils.ids.weapon_id import WeaponID
+from src.utils.null_sound import NullSound
+from src.utils.profiler import Profiler
+from src.utils.sound_aggregator import SoundAggregator, get_loudest_volume
 
 """Represents the model that handles controlling the player, firing, enemies, and other game mechanics such as
 health, leveling experience, and game events such as spawning more enemies
@@ -43,8 +51,12 @@ class Model:
     sound_path = os.path.join(resource_path, 'sounds')  # the sounds folder path
     # Time based game modes
     _time_based_game_modes = [GameModeID.TITAN_SLAYER, GameModeID.SPECTRAL, GameModeID.MANDIBLE_MADNESS]
+    # Missiles that look for a new target when theirs is destroyed
+    _missile_ids = [ProjectileID.FRIENDLY_MISSILE, ProjectileID.ENEMY_MISSILE]
     # Friendly ships
     friendly_ships = []
+    # Left out of snapshots of the game
+    _unsaved_state = ["sounds", "sound_aggregator", "profiler", "_headless"]
 
     """Initializes the model with the width and height of the window and the size of ships
 
@@ -52,18 +64,32 @@ class Model:
     :type difficulty: DifficultyID
     :param game_mode: Game mode to play
     :type game_mode: GameModeID or GameID
-    """
-
-    def __init__(self, difficulty, game_mode):
+    :param headless: True to run without sound or recording high scores
+    :type headless: bool
+    :param seed: seed for every random choice in the game, a random one if None
+    :type seed: int or None
+    """
+
+    def __init__(self, difficulty, game_mode, headless=False, seed=None):
+        # Every random choice made by the AI, ships, and projectiles comes from here, so the same seed and inputs
+        # play out the same game
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Ticks played before the game ended
+        self.ticks = 0
         # Friendly ships
         # Enemy ships
         self.enemy_ships = []
         # Enemy projectiles
-        self.enemy_projectiles = []
+        self.enemy_projectiles = ProjectilePool()
         # Friendly projectiles
-        self.friendly_projectiles = []
+        self.friendly_projectiles = ProjectilePool()
         # Effects
         self.effects = []
+        # Times each phase of the tick
+        self.profiler = Profiler()
         """
         Player statistics:
         Speed: projectile movement speed
@@ -92,15 +118,31 @@ class Model:
         self._reload = 0
 
         # Sounds
+        self._headless = headless
         self.sounds = {}
-        for file_name, volume in {"bullet": .05, "missile": .05, "explosion": .3, "railgun": .5}.items():
-            path = os.path.join(self.sound_path, file_name + '_sound.ogg')
-            sound = pygame.mixer.Sound(file=path)
-            sound.set_volume(volume)
-            self.sounds[file_name.upper()] = sound
-
-        # Action queue
-        self._queue = []
+        for name in config.sound_volumes:
+            if headless:
+                sound = NullSound()
+            else:
+                path = os.path.join(self.sound_path, name.lower() + '_sound.ogg')
+                sound = pygame.mixer.Sound(file=path)
+            # Each play is turned down to its own volume on its channel
+            sound.set_volume(get_loudest_volume(name))
+            self.sounds[name] = sound
+        # Plays the sounds requested during a tick at the end of it
+        self.sound_aggregator = SoundAggregator()
+
+        # Delayed actions, such as the later shots of a burst
+        self._timers = TimerWheel()
+        # Collision grids for enemy and friendly ships, rebuilt every tick
+        self._enemy_grid = SpatialHash()
+        self._friendly_grid = SpatialHash()
+        # Number of projectile and ship pair tests skipped by the grids on the last tick
+        self.collision_tests_saved = 0
+        # Closest target lookups for enemy and friendly ships
+        self._enemy_index = TargetIndex()
+        self._enemy_index.build(self.enemy_ships)
+        self._friendly_index = TargetIndex()
         # For ships from the menu
         for ship in self.friendly_ships:
             ship.ready_to_fire = True
@@ -126,6 +168,7 @@ class Model:
         damage = player_stats["DAMAGE MULTIPLIER"]
         player = Player(config.display_width / 2 - config.ship_size / 2, config.display_height / 2, player_stats["HP"],
                         player_stats["SHIELD"], player_id, player_stats["SPEED"])
+        player.set_rng(self.rng)
         return reload, damage, player
 
     """Initializes the enemy artificial intelligence behavior depending on the given gamemode.
@@ -151,28 +194,49 @@ class Model:
     """
 
     def tick(self):
+        start = time.perf_counter()
         if not self._game_over:
-            # Action queue
-            self._queue[:] = [action for action in self._queue if self._process_action(action)]
+            self.ticks += 1
+            # Delayed actions
+            self._timers.advance()
             # Rotates enemies, recharges their shields, and checks if they're dead
+            self._friendly_index.build(self.get_friendlies())
+            # Attached ships are processed along with their parent and only need removing here once destroyed
             self.enemy_ships[:] = [enemy for enemy in self.enemy_ships
-                                   if not self._process_ship(enemy, self.get_friendlies(), self.enemy_projectiles)]
+                                   if not (enemy.is_dead if enemy.parent is not None else
+                                           self._process_ship(enemy, self._friendly_index, self.enemy_projectiles))]
+            self._enemy_index.build(self.enemy_ships)
             self.friendly_ships[:] = [ship for ship in self.friendly_ships
-                                      if not self._process_ship(ship, self.enemy_ships, self.friendly_projectiles)]
+                                      if not (ship.is_dead if ship.parent is not None else
+                                              self._process_ship(ship, self._enemy_index, self.friendly_projectiles))]
+            self.profiler.add("ships", start)
 
             self._process_player()
-            # Moves all projectiles and filters them if they're offscreen
-        self.friendly_projectiles[:] = [projectile for projectile in self.friendly_projectiles
-                                        if not self._process_friendly_projectile(projectile)]
-        self.enemy_projectiles[:] = [projectile for projectile in self.enemy_projectiles
-                                     if not self._process_enemy_projectile(projectile)]
+            start = time.perf_counter()
+            # Adds any enemies the AI spawned
+            self._enemy_index.build(self.enemy_ships)
+        # Buckets the ships so projectiles only check the ones around them
+        self._enemy_grid.build(self.enemy_ships)
+        self._friendly_grid.build(self.get_friendlies())
+        # Moves all projectiles and filters them if they're offscreen
+        self._process_projectiles(self.friendly_projectiles, self._enemy_grid, EffectID.BLUE_EXPLOSION)
+        self._process_projectiles(self.enemy_projectiles, self._friendly_grid, EffectID.RED_EXPLOSION)
+        # Gives missiles whose targets were destroyed a new target
+        self._retarget_missiles(self.friendly_projectiles)
+        self._retarget_missiles(self.enemy_projectiles)
+        self.collision_tests_saved = self._enemy_grid.tests_saved() + self._friendly_grid.tests_saved()
+        self.profiler.add("projectiles", start)
+        self.sound_aggregator.play(self.sounds)
 
     """Processes the player, checking its health, making the AI tick, and deciding when to end the game.
     """
     def _process_player(self):
         # Processing the player
+        start = time.perf_counter()
         if self._player_ship.hp > 0:
             self._AI.tick()
+            self._AI.release_spawns()
+            start = self.profiler.add("ai", start)
             # Reloads the player's weapon depending on its fire speed
             if self._reload < self._reload_time:
                 self._reload += 1
@@ -184,52 +248,97 @@ class Model:
             self._player_ship.is_damaged = False
         elif not self._game_over:
             size = self._player_ship.size // 2
-            self.effects.append(Explosion(self._player_ship.x + size, self._player_ship.y + size,
-                                          EffectID.BLUE_EXPLOSION))
+            self.effects.append(free_lists.explosions.acquire(self._player_ship.x + size,
+                                                              self._player_ship.y + size, EffectID.BLUE_EXPLOSION))
             self._game_over = True
             self.popup_text("Game Over", 4)
+        self.profiler.add("player", start)
 
-    """Processes friendly ships. Also handles their firing and reloads.
+    """Processes a ship, moving it, rotating it towards its closest target, and handling its firing and reloads. Ships
+    attached to it are processed as a group right after, and are let go of once it is removed.
     
-    :param ship: Friendly ship
-    :type ship: Ally
-    :param targets: Possible targets for the ship
-    :type targets: [Ship]
-    :param projectiles: Projectile list to append onto
-    :type projectiles: [Projectile]
+    :param ship: Ship to process
+    :type ship: Ship
+    :param targets: Index of possible targets for the ship
+    :type targets: TargetIndex
+    :param projectiles: Projectiles to append onto
+    :type projectiles: ProjectilePool
     :returns: if the ship should be removed or not
     :rtype: bool
     """
 
     def _process_ship(self, ship, targets, projectiles):
-        result = self._is_dead(ship, targets)
-        if result:
-            return result
-        else:
-            ship.is_damaged = False
-            ship.ticks += 1
-            if ship.ticks == ship.fire_rate:
-                ship.ticks = 0
-                if ship.ready_to_fire:
-                    ship.fire(self.find_closest_target(ship, targets), projectiles)
-                    self.play_sound(ship.projectile_type)
-            return False
+        if self._is_dead(ship):
+            ship.detach_children()
+            return True
+        ship.move()
+        # The same target is used for rotating and firing
+        closest_target = targets.find_closest(ship)
+        ship.rotate(closest_target)
+        ship.recharge_shield()
+        ship.is_damaged = False
+        if ship.is_dead or self._ship_is_off_screen(ship):
+            # Its ships are processed on their own from here, to be removed with it
+            ship.detach_children()
+            return True
+        ship.ticks += 1
+        if ship.ticks == ship.fire_rate:
+            ship.ticks = 0
+            if ship.ready_to_fire:
+                ship.fire(closest_target, projectiles)
+                self.play_sound(ship.projectile_type)
+        if ship.children:
+            self._process_children(ship, targets, projectiles)
+        return False
 
-    """Processes commands in the queue.
-    
-    :param action:
-    :type action: {str : Direction, str : int}
-    """
+    """Processes the ships attached to a parent in one pass, after the parent has moved them. Their position, and
+    being off screen, are handled by the parent, so each only rotates towards its own closest target, recharges its
+    shield, and counts down to firing. Destroyed ones are let go of by the parent.
 
-    def _process_action(self, action):
-        commands = {Direction.FIRE: self._projectile_generator}
-        action["FRAME"] -= 1
-        if action["FRAME"] == 0:
-            commands[action["COMMAND"]]()
-            return False
-        return True
+    :param parent: ship the others are attached to
+    :type parent: Ship
+    :param targets: Index of possible targets for the ships
+    :type targets: TargetIndex
+    :param projectiles: Projectiles to append onto
+    :type projectiles: ProjectilePool
+    """
 
-    """Plays the corresponding sound effect for the projectile fired.
+    def _process_children(self, parent, targets, projectiles):
+        find_closest = targets.find_closest
+        destroyed = False
+        for child in parent.children:
+            if self._is_dead(child):
+                destroyed = True
+                continue
+            # Attached ships don't move, but can still reload or charge up
+            child.move()
+            closest_target = find_closest(child)
+            child.rotate(closest_target)
+            child.recharge_shield()
+            child.is_damaged = False
+            child.ticks += 1
+            if child.ticks == child.fire_rate:
+                child.ticks = 0
+                if child.ready_to_fire:
+                    child.fire(closest_target, projectiles)
+                    self.play_sound(child.projectile_type)
+        if destroyed:
+            parent.children = [child for child in parent.children if not child.is_dead]
+
+    """Calls a function after the given number of ticks, as part of the tick it runs out on.
+
+    :param delay: ticks to wait, at least 1
+    :type delay: int
+    :param callback: function to call, a method of the model or an entity so the game can still be saved
+    :type callback: function
+    :param args: arguments to call it with
+    :type args: tuple
+    """
+
+    def schedule(self, delay, callback, *args):
+        self._timers.schedule(delay, callback, *args)
+
+    """Requests the corresponding sound effect for the projectile fired, played at the end of the tick.
 
     :param entity_id: ID of the projectile
     :type entity_id: ProjectileID
@@ -239,55 +348,57 @@ class Model:
         if entity_id in [ProjectileID.FRIENDLY_FLAK, ProjectileID.FRIENDLY_BULLET,
                          ProjectileID.ENEMY_FLAK, ProjectileID.ENEMY_BULLET, ProjectileID.HOMING_BULLET,
                          ProjectileID.DIAMOND_DUST]:
-            self.sounds["BULLET"].play()
+            self.sound_aggregator.request("BULLET")
         elif entity_id in [ProjectileID.ENEMY_MISSILE, ProjectileID.FRIENDLY_MISSILE]:
-            self.sounds["MISSILE"].play()
+            self.sound_aggregator.request("MISSILE")
         elif entity_id in [ProjectileID.RAILGUN_BLAST]:
-            self.sounds["RAILGUN"].play()
+            self.sound_aggregator.request("RAILGUN")
 
-    """Removes effects that are over.
+    """Advances every effect by a frame and removes effects that are over, giving them back to their free lists.
     """
 
     def remove_effects(self):
+        start = time.perf_counter()
+        for effect in self.effects:
+            effect.curr_frame += 1
         # Filters the effects for objects to offload
-        self.effects[:] = [effect for effect in self.effects if effect.animate()]
-
-    """Determines if the given enemy ship is dead, and adds to the player score if true.
+        ended = [effect for effect in self.effects if not effect.animate()]
+        if ended:
+            self.effects[:] = [effect for effect in self.effects if effect.animate()]
+            # Ships stop moving the effects that follow them before the effects are reused
+            for ship in self.get_ships() + [self._player_ship]:
+                if ship is not None and ship.ship_effects:
+                    ship.ship_effects[:] = [effect for effect in ship.ship_effects if effect.animate()]
+            for effect in ended:
+                free_lists.release(effect)
+        self.profiler.add("effects", start)
+
+    """Determines if the given ship is dead, and adds to the player score if true.
 
     :param ship: Ship to check if dead
     :type ship: Ship
-    :param targets: List of possible targets for the ship
-    :type targets: [Ship]
     :returns: if ship is dead
     :rtype: bool
     """
 
-    def _is_dead(self, ship, targets):
+    def _is_dead(self, ship):
         if ship.is_dead:
             # Adds to score if necessary
             if ship.entity_id in EnemyID:
                 self._player_ship.score += ship.score
                 self._final_stats["ENEMIES SLAIN"] += 1
-            self.sounds["EXPLOSION"].play()
+            self.sound_aggregator.request("EXPLOSION")
             center_x = ship.x + ship.size // 2
             center_y = ship.y + ship.size // 2
-            self.effects.append(Explosion(center_x, center_y,
-                                          EffectID.EXPLOSION))
+            self.effects.append(free_lists.explosions.acquire(center_x, center_y, EffectID.EXPLOSION))
             # Clears all if a Titan is killed
             if ship.entity_id == EnemyID.TITAN:
                 self.popup_text("TITAN SLAIN", 3)
-                self.effects.append(Explosion(ship.x, ship.y, EffectID.TITAN_EXPLOSION))
+                self.effects.append(free_lists.explosions.acquire(ship.x, ship.y, EffectID.TITAN_EXPLOSION))
                 self._final_stats["TITANS SLAIN"] += 1
             elif ship.entity_id == AllyID.LONGSWORD:
-                self.effects.append(Explosion(ship.x, ship.y, EffectID.TITAN_EXPLOSION))
-
-        else:
-            ship.move()
-            closest_target = self.find_closest_target(ship, targets)
-            ship.rotate(closest_target)
-            ship.recharge_shield()
-            ship.is_damaged = False
-        return ship.is_dead or self._ship_is_off_screen(ship)
+                self.effects.append(free_lists.explosions.acquire(ship.x, ship.y, EffectID.TITAN_EXPLOSION))
+        return ship.is_dead
 
     """Moves the player ship and other actions depending on what directions are given.
 
@@ -303,15 +414,16 @@ class Model:
                 if self._reload == self._reload_time:
                     self._reload = 0
                     if self._player_stats["TYPE"] == ProjectileID.RAILGUN_BLAST:
-                        self._queue.append({"COMMAND": Direction.FIRE, "FRAME": ChargeUp.charge_delay})
-                        charge_effect = ChargeUp(self._player_ship.x + self._player_ship.size // 2,
-                                                 self._player_ship.y + self._player_ship.size // 5,
-                                                 EffectID.BLUE_CHARGE)
+                        self.schedule(ChargeUp.charge_delay, self._projectile_generator)
+                        charge_effect = free_lists.charge_ups.acquire(
+                            self._player_ship.x + self._player_ship.size // 2,
+                            self._player_ship.y + self._player_ship.size // 5, EffectID.BLUE_CHARGE)
                         self._player_ship.ship_effects.append(charge_effect)
                         self.effects.append(charge_effect)
                     else:
-                        for i in range(self._player_stats["BURSTS"]):
-                            self._queue.append({"COMMAND": Direction.FIRE, "FRAME": i * 2})
+                        # The first shot of the burst is fired now
+                        for i in range(1, self._player_stats["BURSTS"]):
+                            self.schedule(i * 2, self._projectile_generator)
                         self._projectile_generator()
         # Up and down
         size = config.ship_size
@@ -340,23 +452,29 @@ class Model:
             ship.offscreen()
         return result
 
-    """Helper to process projectiles, removing them if they're off screen. Also moves them.
+    """Helper to process projectiles, moving them and removing them if they're off screen or hit a ship.
     
-    :param projectile: Projectile to move
-    :type projectile: Projectile
-    :returns: True if the projectile is off screen
-    :rtype: bool
+    :param projectiles: Projectiles to process
+    :type projectiles: ProjectilePool
+    :param grid: Grid of ships the projectiles can hit
+    :type grid: SpatialHash
+    :param splash_color: color explosion for projectiles to use
+    :type splash_color: EffectID
     """
 
-    def _process_friendly_projectile(self, projectile):
-        projectile.move()
-        return self._is_off_screen(projectile) or self._check_if_hit(projectile, self.enemy_ships,
-                                                                     EffectID.BLUE_EXPLOSION)
+    def _process_projectiles(self, projectiles, grid, splash_color):
+        projectiles.update(lambda projectile: self._check_if_hit(projectile, grid, splash_color))
 
-    def _process_enemy_projectile(self, projectile):
-        projectile.move()
-        return self._is_off_screen(projectile) or self._check_if_hit(projectile, self.get_friendlies(),
-                                                                     EffectID.RED_EXPLOSION)
+    """Gives every missile whose target has been destroyed the closest enemy as its new target.
+
+    :param projectiles: Projectiles to look through
+    :type projectiles: ProjectilePool
+    """
+
+    def _retarget_missiles(self, projectiles):
+        for projectile in projectiles.objects:
+            if projectile.target_destroyed and projectile.entity_id in self._missile_ids:
+                projectile.acquire_target(self._enemy_index.find_closest(projectile))
 
     """Checks if the given entity is off screen.
 
@@ -378,36 +496,30 @@ class Model:
 
     :param projectile: Projectile to check
     :type projectile: Projectile
-    :param ships: List of ships to check if any were hit
-    :type ships: List of Ship
+    :param grid: Grid of ships to check if any were hit
+    :type grid: SpatialHash
     :param splash_color: color explosion for projectiles to use, also adjusts score of player if blue
     :type splash_color: EntityID
     :returns: True if projectile is to be removed, false otherwise
     :rtype: bool
     """
 
-    def _check_if_hit(self, projectile, ships, splash_color):
+    def _check_if_hit(self, projectile, grid, splash_color):
         weapon_type = projectile.entity_id
         ship_size = config.ship_size
         radius = projectile.size // 2
         proj_center = (projectile.x + radius, projectile.y + radius)
         if weapon_type == ProjectileID.RAILGUN_BLAST:
-            self.effects.append(Explosion(proj_center[0],
-                                          proj_center[1],
-                                          splash_color))
-        elif weapon_type == ProjectileID.FRIENDLY_MISSILE or weapon_type == ProjectileID.ENEMY_MISSILE:
-            # Projectile is missile and its target has been destroyed, gives it a new target
-            if projectile.target_destroyed:
-                projectile.acquire_target(self.find_closest_target(projectile, self.enemy_ships))
+            self.effects.append(free_lists.explosions.acquire(proj_center[0], proj_center[1], splash_color))
         elif weapon_type == ProjectileID.PULSE:
             if projectile.curr_charge != projectile.charge_time:
                 return False
             else:
-                self.effects.append(Explosion(proj_center[0],
-                                              proj_center[1],
-                                              splash_color))
-                self.sounds["EXPLOSION"].play()
-        for ship in ships:
+                self.effects.append(free_lists.explosions.acquire(proj_center[0], proj_center[1], splash_color))
+                self.sound_aggregator.request("EXPLOSION")
+        # Only ships in the surrounding cells can be in range
+        nearby_ships = grid.query(projectile.x + projectile.size / 2, projectile.y + projectile.size / 2)
+        for ship in nearby_ships:
             # Hit box
             ship_bounding_box = ship.size / 4
             # Radius for air burst
@@ -419,11 +531,9 @@ class Model:
                 # Creates an explosion around the projectile
                 if projectile.has_splash:
                     # Calculates what ships receive splash damage
-                    self._check_splash_damage(projectile, ship, ships)
-                    self.effects.append(Explosion(proj_center[0],
-                                                  proj_center[1],
-                                                  splash_color))
-                    self.sounds["EXPLOSION"].play()
+                    self._check_splash_damage(projectile, ship, nearby_ships)
+                    self.effects.append(free_lists.explosions.acquire(proj_center[0], proj_center[1], splash_color))
+                    self.sound_aggregator.request("EXPLOSION")
                 # Removes projectile if it is not a railgun shot
                 if projectile.entity_id not in [ProjectileID.RAILGUN_BLAST, ProjectileID.PULSE]:
                     return True
@@ -531,7 +641,7 @@ class Model:
                 offset += partition
                 self.friendly_projectiles.append(projectile)
         else:
-            offset = random.randint(-stats["SPREAD"], stats["SPREAD"])
+            offset = self.rng.randint(-stats["SPREAD"], stats["SPREAD"])
             self.friendly_projectiles.append(
                 self._generate_projectile(stats["SPEED"], self._player_ship.x, firing_position, offset + player_angle,
                                           stats["DAMAGE"], stats["TYPE"]))
@@ -557,18 +667,18 @@ class Model:
         self._final_stats["SHOTS FIRED"] += 1
         self.play_sound(entity_id)
         if entity_id == ProjectileID.FRIENDLY_BULLET or entity_id == ProjectileID.FRIENDLY_FLAK:
-            return Bullet(speed, x, y, angle, damage, entity_id)
+            return free_lists.bullets.acquire(speed, x, y, angle, damage, entity_id)
         elif entity_id == ProjectileID.FRIENDLY_MISSILE:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships)
-            return Missile(speed, x, y, angle, damage, entity_id, closest_enemy)
+            closest_enemy = self._enemy_index.find_closest(self._player_ship)
+            return free_lists.missiles.acquire(speed, x, y, angle, damage, entity_id, closest_enemy)
         elif entity_id == ProjectileID.DIAMOND_DUST:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships)
-            return DiamondDust(speed, x, y, angle, damage, ProjectileID.FRIENDLY_BULLET, closest_enemy)
+            closest_enemy = self._enemy_index.find_closest(self._player_ship)
+            return DiamondDust(speed, x, y, angle, damage, ProjectileID.FRIENDLY_BULLET, closest_enemy, self.rng)
         elif entity_id == ProjectileID.HOMING_BULLET:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships)
-            return Missile(speed, x, y, angle, damage, ProjectileID.FRIENDLY_BULLET, closest_enemy)
+            closest_enemy = self._enemy_index.find_closest(self._player_ship)
+            return free_lists.missiles.acquire(speed, x, y, angle, damage, ProjectileID.FRIENDLY_BULLET, closest_enemy)
         elif entity_id == ProjectileID.RAILGUN_BLAST:
-            return Bullet(speed, x, y, angle, damage, ProjectileID.RAILGUN_BLAST)
+            return free_lists.bullets.acquire(speed, x, y, angle, damage, ProjectileID.RAILGUN_BLAST)
         else:
             raise ValueError("Invalid projectile type:", entity_id)
 
@@ -661,12 +771,12 @@ class Model:
 
     """Returns all the projectiles in play.
 
-    :returns: list of projectiles in game
-    :rtype: list of Projectile
+    :returns: enemy and friendly projectile pools
+    :rtype: [ProjectilePool]
     """
 
     def get_projectiles(self):
-        return self.enemy_projectiles + self.friendly_projectiles
+        return [self.enemy_projectiles, self.friendly_projectiles]
 
     """Returns all ships excluding the player.
     :returns: list of enemy ships
@@ -684,6 +794,59 @@ class Model:
     def get_effects(self):
         return self.effects
 
+    """Returns how many ships, projectiles, and effects are alive, excluding the player.
+    :returns: number of each kind of entity
+    :rtype: {str: int}
+    """
+
+    def get_entity_counts(self):
+        return {"ships": len(self.enemy_ships) + len(self.friendly_ships),
+                "projectiles": len(self.enemy_projectiles) + len(self.friendly_projectiles),
+                "effects": len(self.effects)}
+
+    """Remembers where every ship and projectile is before the next tick, so the view can draw them between ticks.
+    Bullets stored in the pools' arrays are drawn back along their velocities instead.
+    """
+
+    def store_positions(self):
+        for entity in (self.enemy_ships + self.friendly_ships + self.enemy_projectiles.objects
+                       + self.friendly_projectiles.objects):
+            entity.prev_x = entity.x
+            entity.prev_y = entity.y
+        self._player_ship.prev_x = self._player_ship.x
+        self._player_ship.prev_y = self._player_ship.y
+
+    """Returns a snapshot of the game that load_state() can return to. Sounds, the profiler, and whether the model
+    is headless are left out, and references to the model itself are stored as references to whichever model loads
+    the snapshot.
+
+    :returns: the pickled state of the game
+    :rtype: bytes
+    """
+
+    def save_state(self):
+        state = {name: value for name, value in vars(self).items() if name not in self._unsaved_state}
+        state["friendly_ships"] = self.friendly_ships
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = lambda obj: "MODEL" if obj is self else None
+        pickler.dump(state)
+        return buffer.getvalue()
+
+    """Returns the game to a snapshot made by save_state(), keeping this model's sounds, profiler, and headless
+    setting.
+
+    :param state: the pickled state of the game
+    :type state: bytes
+    """
+
+    def load_state(self, state):
+        unpickler = pickle.Unpickler(io.BytesIO(state))
+        unpickler.persistent_load = lambda pid: self
+        state = unpickler.load()
+        self.friendly_ships[:] = state.pop("friendly_ships")
+        vars(self).update(state)
+
     """Returns the player ship.
     
     :returns: Player
@@ -693,13 +856,23 @@ class Model:
     def get_player(self):
         return self._player_ship
 
+    """Returns the IDs of the ships that can appear in the game without being spawned by another ship: the player's
+    ship and the ships the AI spawns.
+
+    :returns: IDs of the ships
+    :rtype: {EnemyID or AllyID or PlayerID}
+    """
+
+    def get_ship_ids(self):
+        return self._AI.get_spawn_ids() | {self._player_ship.entity_id}
+
     """Resets the model, emptying all lists of entities other than the player.
     """
 
     def clear(self):
         del self.enemy_ships[:]
-        del self.enemy_projectiles[:]
-        del self.friendly_projectiles[:]
+        self.enemy_projectiles.clear()
+        self.friendly_projectiles.clear()
         del self.effects[:]
         del self.friendly_ships[:]
 
@@ -755,14 +928,12 @@ class Model:
         self._final_stats["SCORE"] = score
         self._final_stats["DAMAGE TAKEN"] = int(self._player_ship.damage_taken)
         self._final_stats["HITS TAKEN"] = self._player_ship.hits_taken
-        curr_score = score_storage.data["SCORES"][str(self._game_mode.value)][str(self._difficulty.value)]
-        if score > curr_score["SCORE"]:
-            self._final_stats["HIGH SCORE"] = True
-            curr_score["SCORE"] = score
-            curr_score["SHIP"] = self._player_ship.entity_id.value
-            if self._game_mode != GameModeID.FATE:
-                curr_score["WEAPON"] = self._player_stats["WEAPON"].value
-            score_storage.save_data()
+        # Simulated games don't count towards high scores
+        if not self._headless:
+            if score > run_history.history.get_best(self._game_mode, self._difficulty)["SCORE"]:
+                self._final_stats["HIGH SCORE"] = True
+            run_history.history.record_run(self._game_mode, self._difficulty, self._player_ship.entity_id,
+                                           self._player_stats["WEAPON"], self._final_stats, self.ticks, self.seed)
         return self._final_stats
 
     """Returns all friendly targets.
@@ -0,0 +1,95 @@
+from src.utils import config
+
+"""Uniform grid that buckets ships by the cells their hulls cover. Used to narrow down which ships a projectile
+could possibly collide with instead of checking every ship on the screen.
+"""
+
+
+class SpatialHash:
+    """Constructor to make the grid.
+
+    :param cell_size: width and height of each cell in pixels
+    :type cell_size: int
+    """
+
+    def __init__(self, cell_size=config.ship_size):
+        self._cell_size = cell_size
+        self._cells = {}
+        self._ships = []
+        # Collision pair statistics for the current build
+        self.queries = 0
+        self.pairs_tested = 0
+
+    """Rebuilds the grid from the given ships. Every ship is inserted into each cell its hull overlaps, so large
+    ships such as the Titan are found from any cell they cover.
+
+    :param ships: ships to insert
+    :type ships: [Ship]
+    """
+
+    def build(self, ships):
+        self._cells = {}
+        self._ships = ships
+        self.queries = 0
+        self.pairs_tested = 0
+        cell_size = self._cell_size
+        cells = self._cells
+        for index, ship in enumerate(ships):
+            left = int(ship.x // cell_size)
+            right = int((ship.x + ship.size) // cell_size)
+            top = int(ship.y // cell_size)
+            bottom = int((ship.y + ship.size) // cell_size)
+            for cell_x in range(left, right + 1):
+                for cell_y in range(top, bottom + 1):
+                    key = (cell_x, cell_y)
+                    bucket = cells.get(key)
+                    if bucket is None:
+                        cells[key] = [index]
+                    else:
+                        bucket.append(index)
+
+    """Returns the ships in the cell containing the given point and its neighbouring cells, in the same order
+    they were given to build(). Any ship whose center is within a cell's length of the point, or whose hull
+    contains it, is guaranteed to be returned.
+
+    :param x: x position of the point
+    :type x: float
+    :param y: y position of the point
+    :type y: float
+    :returns: ships that may be within range of the point
+    :rtype: [Ship]
+    """
+
+    def query(self, x, y):
+        cell_size = self._cell_size
+        cell_x = int(x // cell_size)
+        cell_y = int(y // cell_size)
+        cells = self._cells
+        found = set()
+        for i in range(cell_x - 1, cell_x + 2):
+            for j in range(cell_y - 1, cell_y + 2):
+                bucket = cells.get((i, j))
+                if bucket is not None:
+                    found.update(bucket)
+        self.queries += 1
+        self.pairs_tested += len(found)
+        ships = self._ships
+        return [ships[index] for index in sorted(found)]
+
+    """Returns all the ships in the grid.
+
+    :returns: ships the grid was built from
+    :rtype: [Ship]
+    """
+
+    def get_ships(self):
+        return self._ships
+
+    """Returns how many projectile and ship pair tests were skipped compared to checking every ship.
+
+    :returns: number of pair tests saved since the last build
+    :rtype: int
+    """
+
+    def tests_saved(self):
+        return self.queries * len(self._ships) - self.pairs_tested
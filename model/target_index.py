@@ -0,0 +1,137 @@
+import math
+
+from src.utils import config
+
+"""Grid over the ships that can be targeted, used to find the closest ship to a point without measuring the
+distance to every ship. Searches outwards from the point's cell ring by ring and stops once no unsearched cell can
+hold a closer ship. Gives the same ship as a linear search, including which ship wins a tie.
+"""
+
+
+class TargetIndex:
+    # Below this many ships a linear search is faster than the grid
+    linear_limit = 12
+
+    """Constructor to make the index.
+
+    :param cell_size: width and height of each cell in pixels
+    :type cell_size: int
+    """
+
+    def __init__(self, cell_size=config.ship_size * 2):
+        self._cell_size = cell_size
+        self._cells = {}
+        self._ships = []
+        # Largest distance a target can be from the source
+        self._max_distance = config.display_width * 3
+
+    """Rebuilds the index from the given ships, leaving out ones in stealth. The ships should not move until the
+    index is built again.
+
+    :param ships: ships that can be targeted
+    :type ships: [Ship]
+    """
+
+    def build(self, ships):
+        cell_size = self._cell_size
+        self._ships = [(index, ship) for index, ship in enumerate(ships) if not ship.stealth]
+        self._cells = {}
+        if len(self._ships) <= self.linear_limit:
+            return
+        cells = self._cells
+        for entry in self._ships:
+            ship = entry[1]
+            key = (int(ship.x // cell_size), int(ship.y // cell_size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [entry]
+            else:
+                bucket.append(entry)
+
+    """Returns the closest ship to the given source. Ships farther than three screen widths away are ignored.
+    If ships are equally far, the one that came last in the list given to build() is returned.
+
+    :param source: Source ship or projectile to use as origin
+    :type source: Ship or Projectile
+    :returns: closest ship to the source, or None
+    :rtype: Ship or None
+    """
+
+    def find_closest(self, source):
+        if not self._cells:
+            return self._closest_in(source.x, source.y, self._ships, self._max_distance, -1)[1]
+        x = source.x
+        y = source.y
+        cell_size = self._cell_size
+        cell_x = int(x // cell_size)
+        cell_y = int(y // cell_size)
+        cells = self._cells
+        minimum = self._max_distance
+        best_index = -1
+        closest_ship = None
+        found = 0
+        ring = 0
+        # Ships in this ring or farther out are at least (ring - 1) * cell_size away
+        while found < len(self._ships) and (ring - 1) * cell_size <= minimum:
+            for key in self._ring(cell_x, cell_y, ring):
+                bucket = cells.get(key)
+                if bucket is not None:
+                    found += len(bucket)
+                    distance, ship, index = self._closest_in(x, y, bucket, minimum, best_index)
+                    if ship is not None:
+                        minimum = distance
+                        best_index = index
+                        closest_ship = ship
+            ring += 1
+        return closest_ship
+
+    """Finds the closest ship in the given entries to the point, keeping to the same distance and tie rules as a
+    linear search.
+
+    :param x: x position of the point
+    :type x: float
+    :param y: y position of the point
+    :type y: float
+    :param entries: pairs of list index and ship to check
+    :type entries: [(int, Ship)]
+    :param minimum: ships farther than this are ignored
+    :type minimum: int
+    :param best_index: list index of the current closest ship, -1 if none
+    :type best_index: int
+    :returns: the distance, ship and list index of the closest ship, with the ship as None if none are closer
+    :rtype: (int, Ship, int)
+    """
+
+    def _closest_in(self, x, y, entries, minimum, best_index):
+        closest_ship = None
+        for index, ship in entries:
+            distance = int(abs(math.sqrt((x - ship.x) ** 2 + (y - ship.y) ** 2)))
+            if distance < minimum or (distance == minimum and index > best_index):
+                minimum = distance
+                best_index = index
+                closest_ship = ship
+        return minimum, closest_ship, best_index
+
+    """Returns the keys of the cells that make up the square ring around the given cell.
+
+    :param cell_x: x index of the center cell
+    :type cell_x: int
+    :param cell_y: y index of the center cell
+    :type cell_y: int
+    :param ring: distance of the ring from the center cell in cells
+    :type ring: int
+    :returns: cell keys in the ring
+    :rtype: [(int, int)]
+    """
+
+    def _ring(self, cell_x, cell_y, ring):
+        if ring == 0:
+            return [(cell_x, cell_y)]
+        keys = []
+        for i in range(cell_x - ring, cell_x + ring + 1):
+            keys.append((i, cell_y - ring))
+            keys.append((i, cell_y + ring))
+        for j in range(cell_y - ring + 1, cell_y + ring):
+            keys.append((cell_x - ring, j))
+            keys.append((cell_x + ring, j))
+        return keys
@@ -0,0 +1,91 @@
+from src.utils import config
+
+"""Calls functions a number of ticks from now, touching only the timers that run out on a tick. Timers are kept in a
+hierarchy of wheels: the first has a slot for each of the next few ticks, and each slot of a later wheel covers a whole
+turn of the wheel before it. A timer far ahead waits in a coarser wheel and is moved down to a finer one when its slot
+comes up, so scheduling and advancing take the same time however many timers are waiting. Timers that run out on the
+same tick are called in the order they were scheduled.
+"""
+
+
+class TimerWheel:
+    """Constructor to make the wheels with nothing scheduled.
+
+    :param bits: each wheel has 2 ** bits slots
+    :type bits: int
+    :param levels: number of wheels
+    :type levels: int
+    """
+
+    def __init__(self, bits=config.timer_wheel_bits, levels=config.timer_wheel_levels):
+        self._bits = bits
+        self._mask = (1 << bits) - 1
+        self._wheels = [[[] for _ in range(1 << bits)] for _ in range(levels)]
+        # Furthest ahead the wheels can place a timer
+        self._span = (1 << (bits * levels)) - 1
+        # Ticks advanced so far
+        self.now = 0
+        # Timers scheduled so far, numbering them keeps the ones that run out together in order
+        self._scheduled = 0
+        # Timers waiting to run out
+        self.pending = 0
+
+    """Calls a function after the given number of ticks.
+
+    :param delay: ticks to wait, at least 1
+    :type delay: int
+    :param callback: function to call, which must be picklable for the model to be saved
+    :type callback: function
+    :param args: arguments to call it with
+    :type args: tuple
+    """
+
+    def schedule(self, delay, callback, *args):
+        self._scheduled += 1
+        self.pending += 1
+        self._insert((self.now + max(delay, 1), self._scheduled, callback, args))
+
+    """Puts a timer in the finest wheel that covers how far ahead it runs out.
+
+    :param timer: tick it runs out on, its number, function, and arguments
+    :type timer: (int, int, function, tuple)
+    """
+
+    def _insert(self, timer):
+        # Timers past the last wheel wait in the slot furthest ahead and are placed again when it comes up
+        expires = min(timer[0], self.now + self._span)
+        delta = expires - self.now
+        bits = self._bits
+        level = 0
+        while level < len(self._wheels) - 1 and delta >> (bits * (level + 1)):
+            level += 1
+        self._wheels[level][(expires >> (bits * level)) & self._mask].append(timer)
+
+    """Moves on a tick, moving down the timers of coarser slots that came up and calling the timers that run out.
+    """
+
+    def advance(self):
+        self.now += 1
+        if not self.pending:
+            return
+        now = self.now
+        bits = self._bits
+        # Coarser wheels first, so their timers can be moved down again by the finer ones
+        for level in range(len(self._wheels) - 1, 0, -1):
+            shift = bits * level
+            if not now & ((1 << shift) - 1):
+                slot = self._wheels[level][(now >> shift) & self._mask]
+                if slot:
+                    timers = slot[:]
+                    slot.clear()
+                    for timer in timers:
+                        self._insert(timer)
+        slot = self._wheels[0][now & self._mask]
+        if slot:
+            timers = slot[:]
+            slot.clear()
+            # Timers moved down from coarser wheels can come after ones scheduled later
+            timers.sort()
+            self.pending -= len(timers)
+            for _, _, callback, args in timers:
+                callback(*args)
@@ -0,0 +1,47 @@
+import argparse
+import sys
+import os
+
+# Makes sure the game knows where the files are located:
+
+current_path = os.path.dirname(__file__)  # where this file is located
+outer_path = os.path.abspath(os.path.join(current_path, os.pardir))  # the src folder
+sys.path.insert(1, outer_path)
+
+import pygame
+
+from src.controller.replay_controller import ReplayController
+from src.utils import replay
+from src.view.view import View
+
+"""Plays back a recorded game in a window, or headlessly and prints the final stats.
+Example: python play_replay.py replay_20200501_120000.replay --speed 4 --seek 3600
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plays back a recorded game.")
+    parser.add_argument("path", help="replay file to play")
+    parser.add_argument("--speed", type=int, default=1, help="ticks simulated per frame")
+    parser.add_argument("--seek", type=int, default=0, help="tick to start playing from")
+    parser.add_argument("--headless", action="store_true", help="plays without a window and prints the final stats")
+    args = parser.parse_args()
+    recording = replay.load(args.path)
+    if args.headless:
+        controller = ReplayController(recording)
+        controller.seek(args.seek)
+        stats = controller.run_headless()
+        for stat, value in stats.items():
+            print(stat + ": " + str(value))
+        print("TICKS: " + str(controller.ticks))
+        return
+    pygame.mixer.pre_init(channels=32)
+    pygame.init()
+    controller = ReplayController(recording, View(recording.game_mode))
+    controller.seek(args.seek)
+    controller.run(args.speed)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from src.controller.headless_controller import HeadlessController
+from src.entities import free_lists
+from src.entities.effects.explosion import Explosion
+from src.entities.projectiles.bullet import Bullet
+from src.entities.projectiles.missile import Missile
+from src.entities.ships.waypoint import Waypoint
+from src.utils import config, enemy_generator
+from src.utils.direction import Direction
+from src.utils.ids.ally_id import AllyID
+from src.utils.ids.difficulty_id import DifficultyID
+from src.utils.ids.effect_id import EffectID
+from src.utils.ids.enemy_id import EnemyID
+from src.utils.ids.gamemode_id import GameModeID
+from src.utils.ids.player_id import PlayerID
+from src.utils.ids.projectile_id import ProjectileID
+from src.utils.ids.weapon_id import WeaponID
+from src.utils.profiler import Profiler
+
+"""Seeded stress scenarios that drive the model headlessly, timing how fast it ticks and how long each phase of the
+tick takes. Each scenario sets up the model the same way given the same seed, so a change to the model or entities
+can be measured before and after. The player cannot die so every scenario runs for the full number of ticks unless
+the game is won.
+"""
+
+"""Skips the Onslaught AI ahead to wave 30 and fills the screen with allies.
+
+:param model: model to set up
+:type model: Model
+"""
+
+
+def _setup_onslaught_wave_30(model):
+    ai = model._AI
+    # Spawns the earlier waves so the wave 30 stats and ratings are reached
+    while ai._wave < 29:
+        ai._spawn_enemies()
+        ai._wave += 1
+        ai._spawn_queue.clear()
+    ai._spawn_enemies()
+    ai._wave += 1
+    model.effects.clear()
+    # The most persistent allies Onslaught allows, plus a Longsword and its turrets
+    spacing = (config.display_width - config.ship_size) // 11
+    for i in range(12):
+        ship_id = [PlayerID.CITADEL, PlayerID.AEGIS, AllyID.ARCHER][i % 3]
+        model.friendly_ships.append(enemy_generator.generate_enemy(ship_id, i * spacing, config.display_height,
+                                                                   speed=5, hp=50, shield=20,
+                                                                   fire_rate=config.game_fps // 2, rng=model.rng))
+    longsword = enemy_generator.generate_enemy(AllyID.LONGSWORD, 0, config.display_height, speed=2, hp=2000,
+                                               shield=500, rng=model.rng)
+    longsword.set_waypoint(wp=Waypoint(0, -config.ship_size * 12))
+    model.friendly_ships.append(longsword)
+    model.friendly_ships.extend(longsword.spawn_turrets())
+
+
+"""Leaves Titan Slayer as is, the AI spawns the Titan and its turrets on the first tick.
+
+:param model: model to set up
+:type model: Model
+"""
+
+
+def _setup_titan(model):
+    pass
+
+
+"""Replaces the Mandible Madness waves with waves of three Motherships.
+
+:param model: model to set up
+:type model: Model
+"""
+
+
+def _setup_mothership_swarms(model):
+    model._AI._enemies = [[EnemyID.MOTHERSHIP] * 3 for _ in range(5)]
+
+
+"""Replaces the Mandible Madness waves with a single wave of two King Mandibles.
+
+:param model: model to set up
+:type model: Model
+"""
+
+
+def _setup_king_mandible_bursts(model):
+    model._AI._enemies = [[EnemyID.KING_MANDIBLE] * 2]
+
+
+"""Makes the player's Diamond Dust reload ten times faster, and spawns Judicators, which fire Diamond Dust back at
+the player.
+
+:param model: model to set up
+:type model: Model
+"""
+
+
+def _setup_diamond_dust(model):
+    model._player_stats["RMOD"] /= 10
+    model.switch_weapon(WeaponID.DIAMOND_DUST)
+    for _ in range(6):
+        model._AI.spawn_enemy(EnemyID.JUDICATOR)
+
+
+# Game mode, difficulty, player weapon, if the player holds down fire, and what sets up the model
+scenarios = {"ONSLAUGHT_WAVE_30": {"MODE": GameModeID.ONSLAUGHT, "DIFFICULTY": DifficultyID.HARD,
+                                   "WEAPON": WeaponID.MACHINE_GUN, "FIRE": True, "SETUP": _setup_onslaught_wave_30},
+             "TITAN": {"MODE": GameModeID.TITAN_SLAYER, "DIFFICULTY": DifficultyID.HARD,
+                       "WEAPON": WeaponID.GUN, "FIRE": True, "SETUP": _setup_titan},
+             "MOTHERSHIP_SWARMS": {"MODE": GameModeID.MANDIBLE_MADNESS, "DIFFICULTY": DifficultyID.HARD,
+                                   "WEAPON": WeaponID.GUN, "FIRE": True, "SETUP": _setup_mothership_swarms},
+             "KING_MANDIBLE_BURSTS": {"MODE": GameModeID.MANDIBLE_MADNESS, "DIFFICULTY": DifficultyID.HARD,
+                                      "WEAPON": WeaponID.GUN, "FIRE": False, "SETUP": _setup_king_mandible_bursts},
+             "DIAMOND_DUST": {"MODE": GameModeID.CLASSIC, "DIFFICULTY": DifficultyID.HARD,
+                              "WEAPON": WeaponID.DIAMOND_DUST, "FIRE": True, "SETUP": _setup_diamond_dust}
+             }
+
+"""Runs a scenario for the given number of ticks and returns its results.
+
+:param name: name of the scenario in scenarios
+:type name: str
+:param ticks: most ticks to run for
+:type ticks: int
+:param seed: seed for the model's random number generator
+:type seed: int
+:returns: ticks run, seconds taken, ticks per second, percentiles of each phase and the entity counts, and how often
+the free lists reused objects
+:rtype: dict
+"""
+
+
+def run_scenario(name, ticks, seed=0):
+    scenario = scenarios[name]
+    controller = HeadlessController(scenario["DIFFICULTY"], scenario["MODE"], ship=PlayerID.CITADEL,
+                                    weapon=scenario["WEAPON"], seed=seed)
+    model = controller.get_model()
+    player = model.get_player()
+    player.max_hp = player.hp = 10 ** 9
+    scenario["SETUP"](model)
+    # Keeps every tick of the run
+    model.profiler = Profiler(ticks)
+    inputs = (lambda tick: [Direction.FIRE]) if scenario["FIRE"] else None
+    free_lists.reset_stats()
+    start = time.perf_counter()
+    controller.run_game(ticks, inputs)
+    elapsed = time.perf_counter() - start
+    stats = model.profiler.get_stats()
+    return {"SCENARIO": name, "SEED": seed, "TICKS": controller.ticks, "SECONDS": elapsed,
+            "TICKS PER SECOND": controller.ticks / elapsed, "PHASES": stats["PHASES"], "COUNTS": stats["COUNTS"],
+            "FREE LISTS": free_lists.get_stats()}
+
+
+# Makes the entities measured by run_memory(), given an x position and a random number generator
+entity_makers = {"SHIP": lambda x, rng: enemy_generator.generate_enemy(EnemyID.MANDIBLE, x, 0, rng=rng),
+                 "BULLET": lambda x, rng: Bullet(10, x, 0, 90, 10, ProjectileID.ENEMY_BULLET),
+                 "MISSILE": lambda x, rng: Missile(10, x, 0, 90, 10, ProjectileID.ENEMY_MISSILE, None),
+                 "EXPLOSION": lambda x, rng: Explosion(x, 0, EffectID.EXPLOSION),
+                 "WAYPOINT": lambda x, rng: Waypoint(x, 0)}
+
+"""Makes the given number of each kind of entity and measures how many bytes each one takes up and how long reading
+an attribute of it takes.
+
+:param count: how many of each kind of entity to make
+:type count: int
+:param repeats: how many times to read the attributes of every entity
+:type repeats: int
+:returns: bytes per entity and nanoseconds per attribute read for each kind of entity
+:rtype: dict
+"""
+
+
+def run_memory(count=5000, repeats=20):
+    results = {"ENTITIES": count, "BYTES PER ENTITY": {}, "NANOSECONDS PER ATTRIBUTE READ": {}}
+    rng = random.Random(0)
+    for name, make in entity_makers.items():
+        gc.collect()
+        tracemalloc.start()
+        entities = [make(i % config.display_width, rng) for i in range(count)]
+        size = tracemalloc.get_traced_memory()[0] - sys.getsizeof(entities)
+        tracemalloc.stop()
+        results["BYTES PER ENTITY"][name] = size / count
+        # Times an empty loop over the entities so only the reads are counted
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for entity in entities:
+                pass
+        loop = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for entity in entities:
+                entity.x
+                entity.y
+        reads = time.perf_counter() - start - loop
+        results["NANOSECONDS PER ATTRIBUTE READ"][name] = reads / (count * repeats * 2) * 10 ** 9
+    return results
+
@@ -9,8 +9,57 @@ from src.utils.ids.weapon_id import WeaponID
 display_width = 1024
 display_height = 720
 ship_size = 90
+# Ticks simulated per second
 game_fps = 60
+# Most frames rendered per second, ships and projectiles are drawn between ticks when this differs from game_fps
+render_fps = 60
+# Most ticks simulated before a frame is rendered, past this the game slows down instead of falling further behind
+max_ticks_per_frame = 5
 game_title = 'Tears Over Heaven'
+# Sprites are rotated in steps of this many degrees
+rotation_step = 3
+# Most memory in bytes the cached rotations of a single sprite can take up
+rotation_cache_bytes = 4 * 1024 * 1024
+# Most pieces of rendered text kept in a view's text cache
+text_cache_size = 256
+# Most unused bullets, missiles, explosions, and charge ups kept for reuse, per kind
+free_list_size = 1024
+# Number of frames the profiler keeps, and the file its statistics are written to (time.strftime format)
+profiler_frames = 600
+profile_path = 'profile_%Y%m%d_%H%M%S.json'
+# Whether games are recorded, the file each replay is written to (time.strftime format), and the ticks between
+# snapshots of the game that playback can jump to
+record_replays = False
+replay_path = 'replay_%Y%m%d_%H%M%S.replay'
+replay_keyframe_interval = game_fps * 10
+# Volume of each sound, and which sounds keep playing over others when there are more sounds than voices
+sound_volumes = {"BULLET": .05, "MISSILE": .05, "EXPLOSION": .3, "RAILGUN": .5}
+sound_priorities = {"BULLET": 0, "MISSILE": 1, "EXPLOSION": 2, "RAILGUN": 3}
+# Most sounds playing at once, kept below the mixer's 32 channels
+sound_voices = 16
+# Volume multiplier added for each extra play of a sound requested on the same tick, and the most it can reach
+sound_coalesce_boost = .25
+sound_max_boost = 2
+# Ticks after a sound is played during which it is not played again
+sound_duplicate_window = 3
+# Whether scaled sprites are kept in a file between launches, and the file they are kept in
+sprite_pack = True
+sprite_pack_path = 'sprites.pack'
+# File every finished game is kept in, and how many runs a leaderboard shows
+run_history_path = 'runs.db'
+leaderboard_size = 10
+# Threads that decode and scale images in the background
+asset_workers = 4
+# Most enemy ships made per tick, the rest of a wave waits in a queue until later ticks
+spawns_per_tick = 4
+# Each wheel of the model's timer wheel has 2 ** timer_wheel_bits slots, each wheel's slot covering a turn of the one
+# before, timers further ahead than every wheel covers wait in the last one
+timer_wheel_bits = 6
+timer_wheel_levels = 3
+# Whether the background scrolls
+scroll_background = True
+# Only redraws the parts of the screen that changed, used when the background is not scrolling
+dirty_rects = False
 
 # Player ship and weapon chosen:
 try:
@@ -63,9 +63,13 @@ entities = {EnemyID.MANDIBLE: Mandible,
 :type fire_rate: int
 :param shield: shield points of enemy, default 0
 :type shield: int
+:param rng: random number generator of the model the enemy is in
+:type rng: random.Random
 """
 
 
-def generate_enemy(entity_id, x, y, hp=10000, speed=0, fire_rate=config.game_fps, shield=0, ai=None, effects=None):
+def generate_enemy(entity_id, x, y, hp=10000, speed=0, fire_rate=config.game_fps, shield=0, ai=None, effects=None,
+                   rng=None):
     enemy = entities[entity_id](hp, shield, x, y, speed, fire_rate, ai=ai, effects=effects)
+    enemy.set_rng(rng)
     return enemy
@@ -0,0 +1,25 @@
+"""Stand-in for a pygame Sound that does nothing. Used when the game runs without a mixer.
+"""
+
+
+class NullSound:
+    """Does nothing instead of playing the sound.
+    """
+
+    def play(self, *args, **kwargs):
+        pass
+
+    """Does nothing instead of stopping the sound.
+    """
+
+    def stop(self):
+        pass
+
+    """Does nothing instead of setting the volume.
+
+    :param volume: volume of the sound
+    :type volume: float
+    """
+
+    def set_volume(self, volume):
+        pass
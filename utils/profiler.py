@@ -0,0 +1,128 @@
+import json
+import time
+
+import numpy as np
+
+from src.utils import config
+
+"""Times each phase of a frame and keeps the times of the last few hundred frames in a ring buffer, along with how
+many entities were alive. Meant to be cheap enough to leave on, so slow frames can be traced back to the part of the
+game that caused them.
+"""
+
+
+class Profiler:
+    # Phases in the order they happen in a frame
+    phases = ["ships", "ai", "player", "projectiles", "effects", "render"]
+    # Entities counted every frame
+    counts = ["ships", "projectiles", "effects"]
+    # Percentiles written out by dump()
+    percentiles = [50, 95, 99]
+
+    """Constructor to make the profiler.
+
+    :param frames: how many of the latest frames to keep
+    :type frames: int
+    """
+
+    def __init__(self, frames=config.profiler_frames):
+        self._phase_index = {phase: i for i, phase in enumerate(self.phases)}
+        # Seconds spent in each phase for the latest frames, and the entity counts for those frames
+        self._times = np.zeros((frames, len(self.phases)))
+        self._counts = np.zeros((frames, len(self.counts)), dtype=np.int32)
+        self._frame = np.zeros(len(self.phases))
+        # Next row of the ring buffer to write to, and how many rows are filled
+        self._row = 0
+        self._filled = 0
+
+    """Adds the time since the given start to a phase of the current frame. Returns the current time so the next
+    phase can start from it.
+
+    :param phase: phase to add the time to
+    :type phase: str
+    :param start: time the phase started at, from time.perf_counter()
+    :type start: float
+    :returns: the current time
+    :rtype: float
+    """
+
+    def add(self, phase, start):
+        now = time.perf_counter()
+        self._frame[self._phase_index[phase]] += now - start
+        return now
+
+    """Ends the current frame, storing its phase times and entity counts in the ring buffer.
+
+    :param counts: number of each kind of entity alive this frame
+    :type counts: {str: int}
+    """
+
+    def end_frame(self, counts):
+        self._times[self._row] = self._frame
+        self._counts[self._row] = [counts[name] for name in self.counts]
+        self._frame[:] = 0
+        self._row = (self._row + 1) % len(self._times)
+        self._filled = min(self._filled + 1, len(self._times))
+
+    """Returns the average milliseconds spent in each phase over the latest frames.
+
+    :param frames: how many of the latest frames to average over
+    :type frames: int
+    :returns: milliseconds per phase
+    :rtype: {str: float}
+    """
+
+    def get_averages(self, frames=config.game_fps):
+        frames = min(frames, self._filled)
+        if frames == 0:
+            return dict.fromkeys(self.phases, 0.0)
+        rows = np.arange(self._row - frames, self._row) % len(self._times)
+        averages = self._times[rows].mean(axis=0) * 1000
+        return {phase: float(averages[i]) for i, phase in enumerate(self.phases)}
+
+    """Returns the entity counts of the latest frame.
+
+    :returns: number of each kind of entity
+    :rtype: {str: int}
+    """
+
+    def get_counts(self):
+        if self._filled == 0:
+            return dict.fromkeys(self.counts, 0)
+        row = self._counts[self._row - 1]
+        return {name: int(row[i]) for i, name in enumerate(self.counts)}
+
+    """Returns the percentiles of each phase's milliseconds, the whole frame's, and the entity counts over every
+    frame in the ring buffer.
+
+    :returns: statistics of the stored frames
+    :rtype: dict
+    """
+
+    def get_stats(self):
+        times = self._times[:self._filled] * 1000
+        counts = self._counts[:self._filled]
+        stats = {"FRAMES": self._filled, "PHASES": {}, "COUNTS": {}}
+        if self._filled == 0:
+            return stats
+        columns = [(phase, times[:, i]) for i, phase in enumerate(self.phases)] + [("frame", times.sum(axis=1))]
+        for phase, column in columns:
+            stats["PHASES"][phase] = {"p" + str(p): float(np.percentile(column, p)) for p in self.percentiles}
+        for i, name in enumerate(self.counts):
+            stats["COUNTS"][name] = {"p" + str(p): float(np.percentile(counts[:, i], p)) for p in self.percentiles}
+        return stats
+
+    """Writes the statistics of the stored frames to a JSON file. Returns the path of the file.
+
+    :param path: file to write to, defaults to a new file named after the current time
+    :type path: str or None
+    :returns: path of the written file
+    :rtype: str
+    """
+
+    def dump(self, path=None):
+        if path is None:
+            path = time.strftime(config.profile_path)
+        with open(path, "w") as file:
+            json.dump(self.get_stats(), file, indent=2)
+        return path
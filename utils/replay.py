@@ -0,0 +1,144 @@
+import bisect
+import pickle
+import time
+import zlib
+
+from src.utils import config
+from src.utils.direction import Direction
+
+"""Records the inputs of a game so it can be played back exactly. A game is decided by its seed, game mode,
+difficulty, ship, weapon, and the directions given every tick, so only those are stored. The directions are stored as
+one bitmask per tick, run length encoded since the player holds the same keys for many ticks in a row. Snapshots of
+the whole game are taken every few seconds so playback can jump to any tick without simulating from the start.
+"""
+
+# Bit of each direction in a tick's bitmask
+_direction_bits = {direction: 1 << i for i, direction in enumerate(Direction)}
+# Version of the replay file format
+_version = 9
+
+
+class Replay:
+    """Constructor to make an empty replay of a game.
+
+    :param seed: seed of the game's model
+    :type seed: int
+    :param game_mode: game mode played
+    :type game_mode: GameModeID or GameID
+    :param difficulty: difficulty played on
+    :type difficulty: DifficultyID
+    :param ship: player's ship
+    :type ship: PlayerID
+    :param weapon: player's starting weapon
+    :type weapon: WeaponID
+    :param keyframe_interval: ticks between snapshots of the game
+    :type keyframe_interval: int
+    """
+
+    def __init__(self, seed, game_mode, difficulty, ship, weapon, keyframe_interval=config.replay_keyframe_interval):
+        self.seed = seed
+        self.game_mode = game_mode
+        self.difficulty = difficulty
+        self.ship = ship
+        self.weapon = weapon
+        self.keyframe_interval = keyframe_interval
+        # Pairs of bitmask and how many ticks in a row it was held for
+        self.runs = []
+        # Snapshots of the model by the tick they were taken before
+        self.keyframes = {}
+        self.ticks = 0
+        # Tick each run starts on, built when a tick is looked up
+        self._run_starts = None
+
+    """Records the directions given to the model for the next tick. Takes a snapshot of the model first if a keyframe
+    is due.
+
+    :param model: model about to be ticked
+    :type model: Model
+    :param directions: directions given to the player this tick
+    :type directions: [Direction]
+    """
+
+    def record(self, model, directions):
+        if self.ticks % self.keyframe_interval == 0:
+            self.keyframes[self.ticks] = model.save_state()
+        mask = 0
+        for direction in directions:
+            mask |= _direction_bits[direction]
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+        self.ticks += 1
+        self._run_starts = None
+
+    """Returns the directions given to the player on a tick.
+
+    :param tick: tick to look up
+    :type tick: int
+    :returns: directions given on that tick
+    :rtype: [Direction]
+    """
+
+    def get_directions(self, tick):
+        if self._run_starts is None:
+            self._run_starts = []
+            start = 0
+            for _, length in self.runs:
+                self._run_starts.append(start)
+                start += length
+        mask = self.runs[bisect.bisect_right(self._run_starts, tick) - 1][0]
+        return [direction for direction, bit in _direction_bits.items() if mask & bit]
+
+    """Returns the latest keyframe taken at or before a tick.
+
+    :param tick: tick to find a keyframe for
+    :type tick: int
+    :returns: the tick of the keyframe and the snapshot of the model
+    :rtype: (int, bytes)
+    """
+
+    def get_keyframe(self, tick):
+        keyframe_tick = max(keyframe for keyframe in self.keyframes if keyframe <= tick)
+        return keyframe_tick, self.keyframes[keyframe_tick]
+
+    """Writes the replay to a compressed file. Returns the path of the file.
+
+    :param path: file to write to, defaults to a new file named after the current time
+    :type path: str or None
+    :returns: path of the written file
+    :rtype: str
+    """
+
+    def save(self, path=None):
+        if path is None:
+            path = time.strftime(config.replay_path)
+        data = {"VERSION": _version, "SEED": self.seed, "MODE": self.game_mode, "DIFFICULTY": self.difficulty,
+                "SHIP": self.ship, "WEAPON": self.weapon, "KEYFRAME INTERVAL": self.keyframe_interval,
+                "TICKS": self.ticks, "RUNS": self.runs, "KEYFRAMES": self.keyframes}
+        with open(path, "wb") as file:
+            file.write(zlib.compress(pickle.dumps(data, pickle.HIGHEST_PROTOCOL)))
+        return path
+
+
+"""Reads a replay written by Replay.save().
+
+:param path: file to read
+:type path: str
+:returns: the replay
+:rtype: Replay
+:raises: ValueError if the file is from a different version of the replay format
+"""
+
+
+def load(path):
+    with open(path, "rb") as file:
+        data = pickle.loads(zlib.decompress(file.read()))
+    if data["VERSION"] != _version:
+        raise ValueError("Unsupported replay version: " + str(data["VERSION"]))
+    replay = Replay(data["SEED"], data["MODE"], data["DIFFICULTY"], data["SHIP"], data["WEAPON"],
+                    data["KEYFRAME INTERVAL"])
+    replay.runs = data["RUNS"]
+    replay.keyframes = data["KEYFRAMES"]
+    replay.ticks = data["TICKS"]
+    return replay
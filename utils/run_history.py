@@ -0,0 +1,307 @@
+import atexit
+import sqlite3
+import threading
+import time
+
+from src.utils import config, score_storage
+from src.utils.ids.player_id import PlayerID
+from src.utils.ids.weapon_id import WeaponID
+
+"""Keeps every finished game in a SQLite database, so leaderboards and loadout statistics can be asked for without
+reading every run into memory. Runs are looked up by game mode and difficulty through an index sorted by score. The
+best scores kept in data.json by older versions are imported as runs the first time the database is made. The
+database is opened the first time it is used.
+
+Finished runs are written by a background thread with its own connection, so the game never waits on the disk when a
+game ends. The best run of each game mode and difficulty is kept in memory, read once and then updated as runs are
+recorded, so the menus never query the database either.
+"""
+
+# Version of the tables, kept in the database's user_version
+_version = 1
+_create_tables = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    played_at REAL,
+    pilot TEXT,
+    mode INTEGER NOT NULL,
+    difficulty INTEGER NOT NULL,
+    ship INTEGER NOT NULL,
+    weapon INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER,
+    enemies_slain INTEGER,
+    titans_slain INTEGER,
+    shots_fired INTEGER,
+    damage_taken INTEGER,
+    hits_taken INTEGER,
+    ticks INTEGER,
+    seed INTEGER,
+    imported INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (mode, difficulty, score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_loadout ON runs (mode, difficulty, ship, weapon);
+"""
+# Queries are kept as constants so sqlite3 prepares each once and reuses it from its statement cache
+_insert_run = """
+INSERT INTO runs (played_at, pilot, mode, difficulty, ship, weapon, score, level, enemies_slain, titans_slain,
+                  shots_fired, damage_taken, hits_taken, ticks, seed, imported)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_select_leaderboard = """
+SELECT pilot, ship, weapon, score, played_at FROM runs WHERE mode = ? AND difficulty = ?
+ORDER BY score DESC LIMIT ?
+"""
+_select_loadouts = """
+SELECT ship, weapon, COUNT(*), MAX(score), AVG(score) FROM runs WHERE mode = ? AND difficulty = ?
+GROUP BY ship, weapon ORDER BY MAX(score) DESC
+"""
+_select_best = """
+SELECT mode, difficulty, ship, weapon, MAX(score) FROM runs GROUP BY mode, difficulty
+"""
+_select_runs = """
+SELECT played_at, pilot, ship, weapon, score, ticks, seed FROM runs WHERE mode = ? AND difficulty = ? ORDER BY id
+"""
+# Final stats stored with each run, in the order of their columns
+_stat_names = ["LEVEL", "ENEMIES SLAIN", "TITANS SLAIN", "SHOTS FIRED", "DAMAGE TAKEN", "HITS TAKEN"]
+
+
+class RunHistory:
+    """Constructor to make the history. The database is opened the first time it is used, and the writer thread
+    starts on the first run recorded.
+
+    :param path: file the database is kept in
+    :type path: str
+    """
+
+    def __init__(self, path=config.run_history_path):
+        self._path = path
+        # Connection used for reads on the thread that asks for them
+        self._connection = None
+        # Makes sure the tables are only made once when both threads open the database at the same time
+        self._setup_lock = threading.Lock()
+        # Ship, weapon, and score of the best run by game mode and difficulty values, read the first time it is needed
+        self._best = None
+        self._condition = threading.Condition()
+        self._thread = None
+        # Rows waiting to be inserted, and if the writer thread is inserting some
+        self._pending = []
+        self._writing = False
+        # Error hit by the last insert, or None if it succeeded
+        self.error = None
+
+    """Opens a connection to the database, making the tables the first time.
+
+    :returns: the connection
+    :rtype: sqlite3.Connection
+    """
+
+    def _open(self):
+        connection = sqlite3.connect(self._path)
+        # Commits only wait for the write ahead log, not for the database file to be synced
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        with self._setup_lock:
+            if connection.execute("PRAGMA user_version").fetchone()[0] < _version:
+                with connection:
+                    connection.executescript(_create_tables)
+                    self._import_scores(connection, score_storage.data.get("SCORES", {}))
+                    connection.execute("PRAGMA user_version = %d" % _version)
+        return connection
+
+    """Returns the connection used for reads, opening it the first time. Waits for recorded runs to be written first
+    so reads include them.
+
+    :returns: the connection
+    :rtype: sqlite3.Connection
+    """
+
+    def _connect(self):
+        self.flush()
+        if self._connection is None:
+            self._connection = self._open()
+        return self._connection
+
+    """Adds the best scores kept in data.json as runs, skipping modes and difficulties never played.
+
+    :param connection: connection to the database
+    :type connection: sqlite3.Connection
+    :param scores: best score, ship, and weapon by game mode and difficulty
+    :type scores: {str: {str: dict}}
+    """
+
+    def _import_scores(self, connection, scores):
+        rows = []
+        for mode, results in scores.items():
+            for difficulty, best in results.items():
+                if not isinstance(best, dict) or not best.get("SCORE"):
+                    continue
+                rows.append((None, config.player_name, int(mode), int(difficulty), best["SHIP"], best["WEAPON"],
+                             best["SCORE"]) + (None,) * 8 + (1,))
+        connection.executemany(_insert_run, rows)
+
+    """Adds a finished game. The best run kept in memory is updated right away, and the run is written to the
+    database by the writer thread.
+
+    :param game_mode: game mode played
+    :type game_mode: GameModeID
+    :param difficulty: difficulty played on
+    :type difficulty: DifficultyID
+    :param ship: player's ship
+    :type ship: PlayerID
+    :param weapon: player's weapon at the end of the game
+    :type weapon: WeaponID
+    :param stats: final stats of the game
+    :type stats: dict
+    :param ticks: ticks the game lasted
+    :type ticks: int
+    :param seed: seed of the game
+    :type seed: int
+    """
+
+    def record_run(self, game_mode, difficulty, ship, weapon, stats, ticks, seed):
+        row = ((time.time(), config.player_name, game_mode.value, difficulty.value, ship.value, weapon.value,
+                stats["SCORE"]) + tuple(stats[name] for name in _stat_names) + (ticks, seed, 0))
+        best = self._get_best_runs()
+        key = (game_mode.value, difficulty.value)
+        if key not in best or stats["SCORE"] > best[key]["SCORE"]:
+            best[key] = {"SHIP": ship.value, "WEAPON": weapon.value, "SCORE": stats["SCORE"]}
+        with self._condition:
+            self._pending.append(row)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="RunHistory", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    """Inserts recorded runs until the game exits, all the runs waiting at once in one transaction.
+    """
+
+    def _run(self):
+        connection = None
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                rows = self._pending
+                self._pending = []
+                self._writing = True
+            error = None
+            try:
+                if connection is None:
+                    connection = self._open()
+                with connection:
+                    connection.executemany(_insert_run, rows)
+            except sqlite3.Error as write_error:
+                error = write_error
+            with self._condition:
+                self.error = error
+                self._writing = False
+                # Runs that failed to be written are tried again before newer ones
+                if error is not None:
+                    self._pending[:0] = rows
+                self._condition.notify_all()
+            if error is not None:
+                # Waits before trying again instead of spinning on a disk that keeps failing
+                time.sleep(.5)
+
+    """Waits until every recorded run is written, giving up if a write fails.
+    """
+
+    def flush(self):
+        with self._condition:
+            if self._thread is None:
+                return
+            self.error = None
+            while (self._pending or self._writing) and self.error is None:
+                self._condition.wait()
+
+    """Returns the best run of each game mode and difficulty, reading them from the database the first time.
+
+    :returns: ship, weapon, and score by game mode and difficulty values
+    :rtype: {(int, int): dict}
+    """
+
+    def _get_best_runs(self):
+        if self._best is None:
+            self._best = {(mode, difficulty): {"SHIP": ship, "WEAPON": weapon, "SCORE": score}
+                          for mode, difficulty, ship, weapon, score in self._connect().execute(_select_best)}
+        return self._best
+
+    """Returns the highest scoring runs of a game mode and difficulty.
+
+    :param game_mode: game mode played
+    :type game_mode: GameModeID
+    :param difficulty: difficulty played on
+    :type difficulty: DifficultyID
+    :param count: most runs to return
+    :type count: int
+    :returns: pilot, ship, weapon, score, and time played of each run, best first
+    :rtype: [dict]
+    """
+
+    def get_leaderboard(self, game_mode, difficulty, count=config.leaderboard_size):
+        rows = self._connect().execute(_select_leaderboard, (game_mode.value, difficulty.value, count))
+        return [{"PILOT": pilot, "SHIP": ship, "WEAPON": weapon, "SCORE": score, "PLAYED AT": played_at}
+                for pilot, ship, weapon, score, played_at in rows]
+
+    """Returns the ship, weapon, and score of the best run of a game mode and difficulty.
+
+    :param game_mode: game mode played
+    :type game_mode: GameModeID
+    :param difficulty: difficulty played on
+    :type difficulty: DifficultyID
+    :returns: ship, weapon, and score, the Citadel and Gun with no score if it was never played
+    :rtype: dict
+    """
+
+    def get_best(self, game_mode, difficulty):
+        best = self._get_best_runs().get((game_mode.value, difficulty.value))
+        if best is None:
+            return {"SHIP": PlayerID.CITADEL.value, "WEAPON": WeaponID.GUN.value, "SCORE": 0}
+        return dict(best)
+
+    """Returns how each ship and weapon pair has done in a game mode and difficulty.
+
+    :param game_mode: game mode played
+    :type game_mode: GameModeID
+    :param difficulty: difficulty played on
+    :type difficulty: DifficultyID
+    :returns: ship, weapon, runs played, best score, and average score of each pair, best first
+    :rtype: [dict]
+    """
+
+    def get_loadout_stats(self, game_mode, difficulty):
+        rows = self._connect().execute(_select_loadouts, (game_mode.value, difficulty.value))
+        return [{"SHIP": ship, "WEAPON": weapon, "RUNS": runs, "BEST": best, "AVERAGE": average}
+                for ship, weapon, runs, best, average in rows]
+
+    """Yields every run of a game mode and difficulty in the order they were played, reading them from the database
+    as they are asked for.
+
+    :param game_mode: game mode played
+    :type game_mode: GameModeID
+    :param difficulty: difficulty played on
+    :type difficulty: DifficultyID
+    :returns: time played, pilot, ship, weapon, score, ticks, and seed of each run
+    :rtype: generator
+    """
+
+    def get_runs(self, game_mode, difficulty):
+        for played_at, pilot, ship, weapon, score, ticks, seed in self._connect().execute(
+                _select_runs, (game_mode.value, difficulty.value)):
+            yield {"PLAYED AT": played_at, "PILOT": pilot, "SHIP": ship, "WEAPON": weapon, "SCORE": score,
+                   "TICKS": ticks, "SEED": seed}
+
+    """Writes any recorded runs and closes the database, it is opened again if used after.
+    """
+
+    def close(self):
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+# The run history shared by the game
+history = RunHistory()
+atexit.register(history.flush)
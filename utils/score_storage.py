@@ -1,13 +1,129 @@
+import atexit
 import json
+import os
 import random
 import string
+import threading
+import time
 
-from src.utils.ids.difficulty_id import DifficultyID
-from src.utils.ids.gamemode_id import GameModeID
 from src.utils.ids.player_id import PlayerID
 from src.utils.ids.weapon_id import WeaponID
 
+"""Writes and reads the pilot's name and loadout from a file, scores are kept by run_history. Saves are written by a
+background thread, so the game never waits on the disk. Saves made close together are written once, and the file is
+replaced in one step so a crash never leaves it half written. Anything not yet written is written when the game exits.
+"""
+
+
+class ScoreWriter:
+    # Seconds to wait after a save for more saves before writing
+    _coalesce_delay = .5
+
+    """Constructor to make the writer. Its thread starts on the first save.
+
+    :param path: file to write to
+    :type path: str
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._condition = threading.Condition()
+        self._thread = None
+        # Contents of the newest save not yet written, and if it is being written
+        self._pending = None
+        self._writing = False
+        # If the next save should be written without waiting for more
+        self._flushing = False
+        # Saves requested and files written
+        self.saves = 0
+        self.writes = 0
+        # Error hit by the last write, or None if it succeeded
+        self.error = None
+
+    """Queues contents to be written, replacing any queued contents not yet written.
+
+    :param contents: contents of the file
+    :type contents: str
+    """
+
+    def save(self, contents):
+        with self._condition:
+            self._pending = contents
+            self.saves += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ScoreWriter", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    """Writes anything queued and waits until it is on disk.
+    """
+
+    def flush(self):
+        with self._condition:
+            if self._thread is None:
+                return
+            self._flushing = True
+            self.error = None
+            self._condition.notify_all()
+            # Gives up if a write fails so exiting never hangs on a broken disk
+            while (self._pending is not None or self._writing) and self.error is None:
+                self._condition.wait()
+            self._flushing = False
+
+    """Writes queued contents until the game exits, waiting a short while after each save for newer ones.
+    """
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                deadline = time.monotonic() + self._coalesce_delay
+                while not self._flushing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                contents = self._pending
+                self._pending = None
+                self._writing = True
+            error = None
+            try:
+                self._write(contents)
+            except OSError as write_error:
+                error = write_error
+            with self._condition:
+                self.error = error
+                self._writing = False
+                # A failed save is tried again unless a newer one replaced it
+                if error is not None and self._pending is None:
+                    self._pending = contents
+                self._condition.notify_all()
+            if error is not None:
+                # Waits before trying again instead of spinning on a disk that keeps failing
+                time.sleep(self._coalesce_delay)
+
+    """Writes contents to a temporary file and then replaces the file with it.
+
+    :param contents: contents of the file
+    :type contents: str
+    """
+
+    def _write(self, contents):
+        temp_path = self._path + ".tmp"
+        with open(temp_path, "w") as file:
+            file.write(contents)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self._path)
+        self.writes += 1
+
+
 data = {}
+writer = ScoreWriter("data.json")
+
+"""Makes a new pilot with a random name and the starting loadout, and saves it.
+"""
 
 
 def construct_data():
@@ -18,45 +134,31 @@ def construct_data():
     data["PILOT"] = {"NAME": "Pilot-" + random_letter + random_number,
                      "WEAPON": WeaponID.GUN.value,
                      "SHIP": PlayerID.CITADEL.value}
-    scores = {}
-    for game_mode in GameModeID:
-        not_attempted = {"SHIP": PlayerID.CITADEL.value, "WEAPON": WeaponID.GUN.value, "SCORE": 0}
-        results = {}
-        for difficulty in DifficultyID:
-            results[difficulty.value] = not_attempted.copy()
-        scores[int(game_mode.value)] = results
-    data["SCORES"] = scores
-    with open("data.json", "w") as outfile:
-        json.dump(data, outfile)
-
-
-read = False
-while not read:
-    try:
-        with open('data.json') as f:
-            data = json.load(f)
-            read = True
-            f.close()
-    except FileNotFoundError:
-        construct_data()
-
-"""Writes and reads scores and the pilot name from a file."""
+    save_data()
+
+
+"""Queues the pilot to be written to the file. The data is copied right away, so later changes to it are not written
+until the next save.
+"""
 
 
 def save_data():
-    with open('data.json', 'w') as file:
-        json.dump(data, file)
-        f.close()
+    writer.save(json.dumps(data))
 
 
-"""Checks all the existing gamemodes and adds them if they do not exist.
+"""Writes any saves not yet written and waits for them to finish. Runs when the game exits.
 """
 
 
-def update_gamemodes():
-    for gamemode in GameModeID:
-        try:
-            test = data["SCORES"][gamemode.value]["SHIP"]
-        except KeyError:
-            data["SCORES"][int(gamemode.value)] = {"SHIP": PlayerID.CITADEL.value, "WEAPON": WeaponID.GUN.value, "SCORE": 0}
-    save_data()
+def flush_data():
+    writer.flush()
+
+
+atexit.register(flush_data)
+
+try:
+    with open('data.json') as f:
+        data = json.load(f)
+except FileNotFoundError:
+    construct_data()
+
@@ -0,0 +1,86 @@
+from src.utils import config
+
+"""Collects the sounds requested during a tick and plays them together at the end of it. Requests for the same sound
+are played once, louder the more there were. Only a set number of sounds play at once, a new sound takes the voice of
+the lowest priority sound playing if it is at least as important, and a sound played a moment ago is not played again.
+Sounds are kept at the loudest they can be played at, and each play is turned down on its own channel, so boosting one
+play never changes the volume of earlier plays of the same sound that are still going.
+"""
+
+"""Returns the volume a sound is kept at, the loudest a boosted play of it can reach.
+
+:param name: name of the sound
+:type name: str
+:returns: the volume
+:rtype: float
+"""
+
+
+def get_loudest_volume(name):
+    return min(config.sound_volumes[name] * config.sound_max_boost, 1)
+
+
+class SoundAggregator:
+    """Constructor to make the aggregator with nothing requested.
+
+    :param voices: most sounds playing at once
+    :type voices: int
+    """
+
+    def __init__(self, voices=config.sound_voices):
+        self._voices = voices
+        # Number of requests for each sound this tick
+        self._requests = {}
+        # Priority and channel of each sound playing, oldest first
+        self._playing = []
+        # Tick each sound was last played on
+        self._last_played = {}
+        self._tick = 0
+        # Requests skipped for being duplicates or having no voice, and voices taken from other sounds
+        self.skipped = 0
+        self.stolen = 0
+
+    """Requests a sound to be played at the end of the tick.
+
+    :param name: name of the sound
+    :type name: str
+    """
+
+    def request(self, name):
+        self._requests[name] = self._requests.get(name, 0) + 1
+
+    """Plays the sounds requested this tick, most important first, and clears the requests.
+
+    :param sounds: sounds by name
+    :type sounds: {str: Sound or NullSound}
+    """
+
+    def play(self, sounds):
+        self._tick += 1
+        if not self._requests:
+            return
+        # Frees the voices of sounds that finished
+        self._playing[:] = [voice for voice in self._playing if voice[1].get_busy()]
+        for name in sorted(self._requests, key=lambda sound: -config.sound_priorities[sound]):
+            count = self._requests[name]
+            last_played = self._last_played.get(name)
+            if last_played is not None and self._tick - last_played < config.sound_duplicate_window:
+                self.skipped += count
+                continue
+            priority = config.sound_priorities[name]
+            if len(self._playing) >= self._voices:
+                lowest = min(self._playing, key=lambda voice: voice[0])
+                if lowest[0] > priority:
+                    self.skipped += count
+                    continue
+                lowest[1].stop()
+                self._playing.remove(lowest)
+                self.stolen += 1
+            sound = sounds[name]
+            boost = min(1 + config.sound_coalesce_boost * (count - 1), config.sound_max_boost)
+            channel = sound.play()
+            self._last_played[name] = self._tick
+            if channel is not None:
+                channel.set_volume(min(config.sound_volumes[name] * boost, 1) / get_loudest_volume(name))
+                self._playing.append((priority, channel))
+        self._requests.clear()
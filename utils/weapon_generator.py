@@ -1,5 +1,3 @@
-import random
-
 from src.utils import config
 from src.utils.ids.projectile_id import ProjectileID
 
@@ -10,38 +8,40 @@ REGULAR = 2  # Continuously fires single rounds
 SPREADER = 3  # Fires at a spread
 
 """Generates a random weapon with randoms stats. Does not include railgun type weapons.
+
+:param rng: random number generator to roll the stats with
+:type rng: random.Random
 """
 
 
-def generate_weapon():
-    random.seed()
-    result = {"PROJECTILE SPEED": random.randint(10, 25)}
-    weapon_type = [BURST_FIRE, REGULAR, SPREADER][random.randint(0, 2)]
-    random_fire_rate = random.randint(3, config.game_fps // 2)
+def generate_weapon(rng):
+    result = {"PROJECTILE SPEED": rng.randint(10, 25)}
+    weapon_type = [BURST_FIRE, REGULAR, SPREADER][rng.randint(0, 2)]
+    random_fire_rate = rng.randint(3, config.game_fps // 2)
     result["RELOAD"] = random_fire_rate
     if weapon_type == BURST_FIRE:
-        bursts = random.randint(0, 12)
+        bursts = rng.randint(0, 12)
         result["BURSTS"] = bursts
-        multiple_or_single = random.randint(0, 1)
+        multiple_or_single = rng.randint(0, 1)
         if multiple_or_single == 0:
             result["PROJECTILE COUNT"] = 1
-            result["SPREAD"] = random.randint(0, 30)
+            result["SPREAD"] = rng.randint(0, 30)
         else:
-            projectile_count = random.randint(2, 6)
+            projectile_count = rng.randint(2, 6)
             result["PROJECTILE COUNT"] = projectile_count
-            result["SPREAD"] = random.randint(1, 6) * (projectile_count + 1)
+            result["SPREAD"] = rng.randint(1, 6) * (projectile_count + 1)
     elif weapon_type == REGULAR:
         result["BURSTS"] = 0
         result["PROJECTILE COUNT"] = 1
-        result["SPREAD"] = random.randint(0, 30)
+        result["SPREAD"] = rng.randint(0, 30)
     else:
         result["BURSTS"] = 0
-        projectile_count = random.randint(2, 8)
+        projectile_count = rng.randint(2, 8)
         result["PROJECTILE COUNT"] = projectile_count
-        result["SPREAD"] = random.randint(1, 6) * (projectile_count + 1)
+        result["SPREAD"] = rng.randint(1, 6) * (projectile_count + 1)
 
-    result["PROJECTILE TYPE"] = projectile_types[random.randint(0, len(projectile_types) - 1)]
-    dps = random.randint(150, 300)
+    result["PROJECTILE TYPE"] = projectile_types[rng.randint(0, len(projectile_types) - 1)]
+    dps = rng.randint(150, 300)
     bursts_modifier = result["BURSTS"] if result["BURSTS"] > 0 else 1
     result["DAMAGE"] = dps / ((config.game_fps / random_fire_rate) * (bursts_modifier * result["PROJECTILE COUNT"]))
     if result["DAMAGE"] == 0:
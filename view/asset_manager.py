@@ -0,0 +1,300 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from src.utils import config
+from src.view.sprite_pack import SpritePack
+
+"""Loads images once for the whole game and hands out the same surfaces to every view that asks for them, so going
+back to the menu or starting another game does not load and scale every sprite again. Images are kept by their path
+and the size they were scaled to, and image containers are kept by their class and the arguments they were made with.
+Surfaces handed out are shared, so they must not be drawn on. Scaled frames are also kept in a sprite pack on disk,
+so later launches skip decoding and scaling.
+
+Images can be preloaded, which decodes and scales them on worker threads into raw pixels. Only turning the pixels into
+surfaces in the display's format happens on the main thread, when the image is first asked for or update() is called.
+"""
+
+"""Decodes an image and cuts it into scaled frames. Runs on a worker thread, so it only touches its own surfaces and
+returns raw pixels.
+
+:param path: path of the image file
+:type path: str
+:param size: width and height to scale each frame to, or None to keep the image's size
+:type size: (int, int) or None
+:param count: number of square sprites in a row in the image
+:type count: int
+:returns: the RGBA pixels and size of each frame
+:rtype: [(bytes, (int, int))]
+"""
+
+
+def _decode(path, size, count):
+    image = pygame.image.load(path)
+    if count == 1:
+        frames = [image if size is None else pygame.transform.scale(image, size)]
+    else:
+        sprite_size = image.get_width() // count
+        image_size = (sprite_size, sprite_size)
+        frames = [pygame.transform.scale(image.subsurface(pygame.Rect((sprite_size * i, 0), image_size)), size)
+                  for i in range(count)]
+    return [(pygame.image.tostring(frame, "RGBA"), frame.get_size()) for frame in frames]
+
+
+"""Makes surfaces that share the pixels of decoded frames.
+
+:param frames: the RGBA pixels and size of each frame
+:type frames: [(bytes, (int, int))]
+:returns: the frames, not yet converted to the display's format
+:rtype: [pygame.Surface]
+"""
+
+
+def _to_surfaces(frames):
+    return [pygame.image.frombuffer(pixels, size, "RGBA") for pixels, size in frames]
+
+
+class AssetManager:
+    """Constructor to make the manager with nothing loaded.
+
+    :param pack: pack to read scaled frames from and add new ones to, or None to always load the image files
+    :type pack: SpritePack or None
+    :param workers: threads that decode preloaded images
+    :type workers: int
+    """
+
+    def __init__(self, pack=None, workers=config.asset_workers):
+        self._pack = pack
+        self._workers = workers
+        # Made when something is first preloaded
+        self._executor = None
+        # Surfaces by path, size, and if they have transparency
+        self._images = {}
+        # Lists of frames cut from spritesheets by path, frame count, and size
+        self._sprites = {}
+        # Image containers by class and arguments
+        self._containers = {}
+        # Preloads still being decoded, and decoded frames not yet asked for when there is no pack, by path, size, and
+        # frame count
+        self._pending = {}
+        self._decoded = {}
+        # Preloads finished and requested since the last time nothing was left to preload
+        self._preloads_done = 0
+        self._preloads_total = 0
+        # Called with the preloads finished and requested whenever one finishes
+        self._progress = None
+        # Assets handed out that were already loaded, and ones that had to be loaded
+        self.hits = 0
+        self.misses = 0
+
+    """Returns an image, loading it and scaling it the first time it is asked for.
+
+    :param path: path of the image file
+    :type path: str
+    :param size: width and height to scale the image to, or None to keep its size
+    :type size: (int, int) or None
+    :param alpha: if the image has transparency
+    :type alpha: bool
+    :returns: the image
+    :rtype: pygame.Surface
+    """
+
+    def get_image(self, path, size=None, alpha=True):
+        key = (path, size, alpha)
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+        self.misses += 1
+        image = self._load(path, size, 1)[0]
+        image = image.convert_alpha() if alpha else image.convert()
+        self._images[key] = image
+        return image
+
+    """Returns the frames of a spritesheet made of square sprites in a row, each scaled to a square of the given
+    size, cutting them out the first time they are asked for.
+
+    :param path: path of the spritesheet
+    :type path: str
+    :param count: number of sprites in the sheet
+    :type count: int
+    :param size: width and height to scale each sprite to
+    :type size: int
+    :returns: the frames in order, shared so the list must not be changed
+    :rtype: (pygame.Surface)
+    """
+
+    def get_sprites(self, path, count, size):
+        key = (path, count, size)
+        sprites = self._sprites.get(key)
+        if sprites is not None:
+            self.hits += 1
+            return sprites
+        self.misses += 1
+        sprites = tuple(sprite.convert_alpha() for sprite in self._load(path, (size, size), count))
+        self._sprites[key] = sprites
+        return sprites
+
+    """Starts decoding images on the worker threads so they are ready by the time they are asked for. Images already
+    loaded, being loaded, or in the sprite pack are skipped.
+
+    :param requests: path, size to scale each frame to, and number of frames of each image
+    :type requests: [(str, (int, int) or None, int)]
+    :param progress: called on the main thread with the preloads finished and requested each time one finishes
+    :type progress: function or None
+    """
+
+    def preload(self, requests, progress=None):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._workers)
+        if not self._pending:
+            self._preloads_done = 0
+            self._preloads_total = 0
+        self._progress = progress
+        for path, size, count in requests:
+            key = (path, size, count)
+            if key in self._pending or key in self._decoded or self._is_loaded(path, size, count):
+                continue
+            if self._pack is not None and self._pack.has_frames(path, size, count):
+                continue
+            self._pending[key] = self._executor.submit(_decode, path, size, count)
+            self._preloads_total += 1
+        self._report_progress()
+
+    """Returns if an image was already turned into surfaces.
+
+    :param path: path of the image file
+    :type path: str
+    :param size: size of each frame
+    :type size: (int, int) or None
+    :param count: number of frames in the image
+    :type count: int
+    :returns: True if it was loaded
+    :rtype: bool
+    """
+
+    def _is_loaded(self, path, size, count):
+        if count == 1:
+            return (path, size, True) in self._images or (path, size, False) in self._images
+        return (path, count, size[0]) in self._sprites
+
+    """Takes in the preloads that finished decoding and reports the progress.
+
+    :returns: the fraction of the requested preloads that are done
+    :rtype: float
+    """
+
+    def update(self):
+        for key, future in list(self._pending.items()):
+            if future.done():
+                self._finish_preload(key)
+        return self._preloads_done / self._preloads_total if self._preloads_total else 1
+
+    """Waits for a preload to finish, turns its pixels into surfaces, and keeps them until they are asked for, in the
+    sprite pack if there is one.
+
+    :param key: path, size, and frame count of the image
+    :type key: (str, (int, int) or None, int)
+    """
+
+    def _finish_preload(self, key):
+        path, size, _ = key
+        pixels = self._pending.pop(key).result()
+        # Frames in the pack are read from it when asked for, and are only kept on the heap until it is saved
+        if self._pack is not None:
+            self._pack.add(path, size, pixels)
+        else:
+            self._decoded[key] = _to_surfaces(pixels)
+        self._preloads_done += 1
+        self._report_progress()
+
+    """Calls the progress hook with the preloads finished and requested.
+    """
+
+    def _report_progress(self):
+        if self._progress is not None:
+            self._progress(self._preloads_done, self._preloads_total)
+
+    """Returns the frames of an image, split into square sprites in a row unless there is only one, and scaled. Takes
+    them from a preload if there is one, then from the sprite pack, otherwise loads and scales the image and adds the
+    frames to the pack.
+
+    :param path: path of the image file
+    :type path: str
+    :param size: width and height to scale each frame to, or None to keep the image's size
+    :type size: (int, int) or None
+    :param count: number of sprites in the image
+    :type count: int
+    :returns: the frames in order
+    :rtype: [pygame.Surface]
+    """
+
+    def _load(self, path, size, count):
+        key = (path, size, count)
+        if key in self._pending:
+            self._finish_preload(key)
+        frames = self._decoded.pop(key, None)
+        if frames is not None:
+            return frames
+        if self._pack is not None:
+            frames = self._pack.get_frames(path, size, count)
+            if frames is not None:
+                return frames
+        pixels = _decode(path, size, count)
+        if self._pack is not None:
+            self._pack.add(path, size, pixels)
+        return _to_surfaces(pixels)
+
+    """Writes any frames loaded since the last save to the sprite pack.
+    """
+
+    def save_pack(self):
+        if self._pack is not None:
+            self._pack.save()
+
+    """Returns an image container made with the given arguments, making it the first time it is asked for. Containers
+    keep any rotations they made, so later views reuse those too.
+
+    :param container_class: class of the container
+    :type container_class: type
+    :returns: the container
+    :rtype: ImageHolder or ExplosionImages or ScreenTintImages or RotationAtlas
+    """
+
+    def get_container(self, container_class, *args):
+        key = (container_class, args)
+        container = self._containers.get(key)
+        if container is not None:
+            self.hits += 1
+            return container
+        self.misses += 1
+        container = container_class(*args)
+        self._containers[key] = container
+        return container
+
+    """Returns how many assets were handed out already loaded, how many were loaded, and how many are kept.
+
+    :returns: hits, misses, and the number of images, spritesheets, and containers kept
+    :rtype: {str: int}
+    """
+
+    def get_stats(self):
+        return {"HITS": self.hits, "MISSES": self.misses, "IMAGES": len(self._images),
+                "SPRITESHEETS": len(self._sprites), "CONTAINERS": len(self._containers)}
+
+    """Drops every loaded asset, such as after the display size changes. Preloads that have not started are
+    cancelled.
+    """
+
+    def clear(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._decoded.clear()
+        self._images.clear()
+        self._sprites.clear()
+        self._containers.clear()
+
+
+# The asset manager shared by every view
+assets = AssetManager(SpritePack() if config.sprite_pack else None)
@@ -1,6 +1,5 @@
-import pygame
-
 from src.utils import config
+from src.view.asset_manager import assets
 
 """Container to hold images for an explosion.
 """
@@ -16,17 +15,8 @@ class ExplosionImages:
     """
 
     def __init__(self, images, size):
-        self.frames = []
-        spritesheet = pygame.image.load(images).convert_alpha()
-        width = spritesheet.get_width()
-        # 5 sprites
-        sprite_size = width // 5
-        image_size = (sprite_size, sprite_size)
-        self.frames = []
-        for i in range(5):
-            offset = sprite_size * i
-            self.frames.append(
-                pygame.transform.scale(spritesheet.subsurface(pygame.Rect((offset, 0), image_size)), (size, size)))
+        # 5 sprites, copied since subclasses can reorder them
+        self.frames = list(assets.get_sprites(images, 5, size))
         self.frame_offset = int(config.game_fps / 30)
 
     """Returns the given frame of the explosion.
@@ -37,6 +27,4 @@ class ExplosionImages:
     :rtype: pygame image
     """
     def get_frame(self, effect):
-        result = self.frames[int(effect.curr_frame / (self.frame_offset * effect.frame_multiplier))]
-        effect.curr_frame += 1
-        return result
+        return self.frames[int(effect.curr_frame / (self.frame_offset * effect.frame_multiplier))]
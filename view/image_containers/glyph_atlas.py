@@ -0,0 +1,44 @@
+"""Container that holds a rendered image for each character of a font, so text that changes every frame such as
+numbers can be drawn character by character without rendering it again.
+"""
+
+
+class GlyphAtlas:
+    """Constructor to make the atlas.
+
+    :param font: Font to render the characters with
+    :type font: pygame.font.Font
+    :param color: color of the characters
+    :type color: (int, int, int)
+    """
+
+    def __init__(self, font, color):
+        self._font = font
+        self._color = color
+        self._glyphs = {}
+
+    """Returns the image of the given character, rendering it the first time it is asked for.
+
+    :param character: character to get the image of
+    :type character: str
+    :returns: image of the character
+    :rtype: pygame.Surface
+    """
+
+    def get(self, character):
+        glyph = self._glyphs.get(character)
+        if glyph is None:
+            glyph = self._font.render(character, 1, self._color).convert_alpha()
+            self._glyphs[character] = glyph
+        return glyph
+
+    """Returns how wide the given text is when drawn from the atlas.
+
+    :param text: text to measure
+    :type text: str
+    :returns: width in pixels
+    :rtype: int
+    """
+
+    def get_width(self, text):
+        return sum(self.get(character).get_width() for character in text)
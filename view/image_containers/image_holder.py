@@ -1,4 +1,5 @@
-import pygame
+from src.view.asset_manager import assets
+from src.view.image_containers.rotation_atlas import RotationAtlas
 
 """Container to hold images for ships and projectiles
 """
@@ -15,17 +16,13 @@ class ImageHolder:
 
     def __init__(self, images, size):
         # Sprite sheet consists of 4 sprites by default
-        spritesheet = pygame.image.load(images).convert_alpha()
-        width = spritesheet.get_width()
-        # 4 sprites
-        sprite_size = width // 4
-        image_size = (sprite_size, sprite_size)
-        sprites = []
-        for i in range(4):
-            offset = sprite_size * i
-            sprites.append(
-                pygame.transform.scale(spritesheet.subsurface(pygame.Rect((offset, 0), image_size)), (size, size)))
+        sprites = assets.get_sprites(images, 4, size)
         self.base_image = sprites[0]
         self.animated_image = sprites[1]
         self.damaged_image = sprites[2]
         self.shield_damage_image = sprites[3]
+        # Rotated copies of each image, made when first needed
+        self.base_rotations = RotationAtlas(self.base_image)
+        self.animated_rotations = RotationAtlas(self.animated_image)
+        self.damaged_rotations = RotationAtlas(self.damaged_image)
+        self.shield_damage_rotations = RotationAtlas(self.shield_damage_image)
@@ -1,6 +1,5 @@
-import pygame
-
 from src.utils import config
+from src.view.image_containers.text_cache import TextCache
 
 """Container to hold and render text.
 """
@@ -14,13 +13,12 @@ class PopUpImage:
     """
 
     def __init__(self, font):
-        self.current_text = ''
         self.font = font
-        # How much the text fades
-        self.alpha_decrease = 0
+        # Each text is rendered once and kept, popups only change the alpha of their text before it is drawn. The
+        # cache is not shared with the HUD since the alpha is set on the cached surface.
+        self._text_cache = TextCache()
         # Maximum transparency
         self.max_alpha = 200
-        self.current_alpha = self.max_alpha
         self.width = config.display_width
         self.height = config.display_height
 
@@ -33,18 +31,15 @@ class PopUpImage:
     """
 
     def get_frame(self, effect):
-        if effect.text != self.current_text:
-            # New text, resets all fields
-            self.current_alpha = self.max_alpha
-            self.current_text = effect.text
-            # Places text image on center of screen
-            self.alpha_decrease = self.max_alpha // effect.max_frame
-        image = self.font.render(effect.text, 1, (255, 255, 255)).convert_alpha()
+        image = self._text_cache.render(self.font, effect.text, True, (255, 255, 255))
+        # Places text image on center of screen
         rect = image.get_rect(center=(effect.center_x, effect.center_y))
         effect.x, effect.y = rect.topleft
-        effect.curr_frame += 1
-        self.current_alpha -= self.alpha_decrease
-        if self.current_alpha <= 0:
-            self.current_alpha = self.max_alpha
-        image.fill((255, 255, 255, self.current_alpha), None, pygame.BLEND_RGBA_MULT)
+        # Each popup fades on its own
+        if effect.alpha is None:
+            effect.alpha = self.max_alpha
+        effect.alpha -= self.max_alpha // effect.max_frame
+        if effect.alpha <= 0:
+            effect.alpha = self.max_alpha
+        image.set_alpha(effect.alpha)
         return image
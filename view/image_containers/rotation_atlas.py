@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+import pygame
+
+from src.utils import config
+
+"""Container that holds rotated copies of an image. Angles are rounded to a fixed step and each rotation is only
+made the first time it is asked for, along with the offset to blit it centered on a point. Keeps the least recently
+used rotations under a memory limit, so large sprites do not hold onto every angle.
+"""
+
+
+class RotationAtlas:
+    """Constructor to make the atlas.
+
+    :param image: image to rotate
+    :type image: pygame.Surface
+    :param step: degrees between each cached rotation
+    :type step: int
+    :param max_bytes: most memory the cached rotations can take up
+    :type max_bytes: int
+    """
+
+    def __init__(self, image, step=config.rotation_step, max_bytes=config.rotation_cache_bytes):
+        self._image = image
+        self._step = step
+        self._steps = int(round(360 / step))
+        self._max_bytes = max_bytes
+        self._rotations = OrderedDict()
+        self._bytes = 0
+
+    """Returns the image rotated to the closest step of the given angle, and the offset from the center to blit
+    it at.
+
+    :param angle: angle in degrees to rotate counterclockwise
+    :type angle: float
+    :returns: rotated image and offset from its center to its top left corner
+    :rtype: (pygame.Surface, (int, int))
+    """
+
+    def get(self, angle):
+        key = int(round(angle / self._step)) % self._steps
+        rotation = self._rotations.get(key)
+        if rotation is None:
+            return self._rotate(key)
+        self._rotations.move_to_end(key)
+        return rotation
+
+    """Rotates the image for the given step and caches it, dropping the least recently used rotations if over the
+    memory limit.
+
+    :param key: which step to rotate to
+    :type key: int
+    :returns: rotated image and offset from its center to its top left corner
+    :rtype: (pygame.Surface, (int, int))
+    """
+
+    def _rotate(self, key):
+        image = pygame.transform.rotate(self._image, key * self._step)
+        width, height = image.get_size()
+        rotation = (image, (-(width // 2), -(height // 2)))
+        self._rotations[key] = rotation
+        self._bytes += image.get_pitch() * height
+        # Always keeps the newest rotation even if it is over the limit by itself
+        while self._bytes > self._max_bytes and len(self._rotations) > 1:
+            old_image = self._rotations.popitem(last=False)[1][0]
+            self._bytes -= old_image.get_pitch() * old_image.get_height()
+        return rotation
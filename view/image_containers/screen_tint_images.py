@@ -1,6 +1,5 @@
-import pygame
-
 from src.utils import config
+from src.view.asset_manager import assets
 
 """Container to hold images for an explosion.
 """
@@ -14,9 +13,7 @@ class ScreenTintImages:
     """
 
     def __init__(self, image):
-        frame1 = pygame.image.load(image).convert_alpha()
-        frame1 = pygame.transform.scale(frame1, (config.display_width, config.display_height))
-        self.frame = frame1
+        self.frame = assets.get_image(image, (config.display_width, config.display_height))
 
     """Returns the given frame. Always returns a single frame.
 
@@ -26,5 +23,4 @@ class ScreenTintImages:
     :rtype: pygame image"""
 
     def get_frame(self, effect):
-        effect.curr_frame += 1
         return self.frame
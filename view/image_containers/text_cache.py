@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+from src.utils import config
+
+"""Cache of rendered text. Text is only rendered the first time it is asked for with a given font, antialiasing,
+and color, and the least recently used text is dropped once the cache is full. Images given out are shared, so they
+should not be drawn on or have their alpha changed.
+"""
+
+
+class TextCache:
+    """Constructor to make the cache.
+
+    :param max_entries: most pieces of text to keep rendered
+    :type max_entries: int
+    """
+
+    def __init__(self, max_entries=config.text_cache_size):
+        self._max_entries = max_entries
+        self._images = OrderedDict()
+
+    """Returns the text rendered with the given font, rendering it if it is not cached.
+
+    :param font: Font to render the text with
+    :type font: pygame.font.Font
+    :param text: text to render
+    :type text: str
+    :param antialias: whether the text has smooth edges
+    :type antialias: bool
+    :param color: color of the text
+    :type color: (int, int, int)
+    :returns: the rendered text
+    :rtype: pygame.Surface
+    """
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, color)
+        image = self._images.get(key)
+        if image is None:
+            image = font.render(text, antialias, color).convert_alpha()
+            self._images[key] = image
+            if len(self._images) > self._max_entries:
+                self._images.popitem(last=False)
+        else:
+            self._images.move_to_end(key)
+        return image
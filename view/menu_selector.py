@@ -1,5 +1,6 @@
 from src.model.stats import gamemode_stats
-from src.utils import score_storage
+from src.utils import run_history
+from src.utils.ids.difficulty_id import DifficultyID
 from src.utils.ids.game_id import GameID
 from src.view.menu_tree import MenuTree
 
@@ -79,8 +80,5 @@ class MenuSelector(MenuTree):
     """
 
     def set_addl_info(self, game_mode):
-        try:
-            self.info = score_storage.data["SCORES"][str(game_mode.value)]
-        except KeyError:
-            score_storage.update_gamemodes()
-            self.info = score_storage.data["SCORES"][str(game_mode.value)]
+        self.info = {str(difficulty.value): run_history.history.get_best(game_mode, difficulty)
+                     for difficulty in DifficultyID}
@@ -6,6 +6,7 @@ from src.utils.ids.difficulty_id import DifficultyID
 from src.utils.ids.game_id import GameID
 from src.utils.ids.player_id import PlayerID
 from src.utils.ids.weapon_id import WeaponID
+from src.view.asset_manager import assets
 from src.view.view import View
 
 """View to render the game, uses pygame to render images. Represents the menus in game.
@@ -28,7 +29,8 @@ class MenuView(View):
 
     def __init__(self, model):
         # Sets up the game window surface
-        super().__init__(GameID.MENU)
+        # Enemies are loaded when they are first shown
+        super().__init__(GameID.MENU, set(PlayerID) | set(WeaponID))
         self._font_size = config.display_height // 24
         # Title font size
         self._title_font_size = config.display_height / 10
@@ -40,6 +42,12 @@ class MenuView(View):
         self._current = 0
         self._init_title_screen(display_font)
         self._description_font = pygame.font.Font(display_font, int(self._font_size / 1.5))
+        # Every other ship and background streams in behind the title screen
+        self._loading_done = 0
+        self._loading_total = 0
+        assets.preload(self._get_asset_requests(None) + [self._get_background_request(background_id)
+                                                         for background_id in self._background_paths],
+                       self._update_loading)
         # When to switch animations:
         # Mock model to simulate gallery items
         self._model = model
@@ -67,6 +75,20 @@ class MenuView(View):
         self._prompt_alpha = 150
         self._prompt_alpha_change = -2
 
+    """Keeps track of how many of the preloaded assets are done, and saves them to the sprite pack once all are.
+
+    :param done: preloads finished
+    :type done: int
+    :param total: preloads requested
+    :type total: int
+    """
+
+    def _update_loading(self, done, total):
+        if total and done == total and self._loading_done < total:
+            assets.save_pack()
+        self._loading_done = done
+        self._loading_total = total
+
     """Renders menu options.
 
     :param tree: Tree to get options from.
@@ -76,6 +98,7 @@ class MenuView(View):
     def render_menu(self, tree):
         # TODO: ADD ANIMATIONS FOR SCROLLING BETWEEN OPTIONS
         self._model.tick()
+        assets.update()
         if tree is None:
             self._render_title_screen()
         elif tree.name not in GameID:
@@ -95,7 +118,7 @@ class MenuView(View):
 
     def _render_descriptive_menu(self, tree):
         self._draw_background(self._background)
-        if tree.get_curr_id() in self._backgrounds.keys():
+        if tree.get_curr_id() in self._background_paths:
             self._transition_background(tree.get_curr_id())
         elif self._target_background_id is not None:
             self._transition_background(self._target_background_id)
@@ -128,8 +151,8 @@ class MenuView(View):
             placement_posn = self._find_posn(image, x, y)
             if i == curr_selected:
                 pointer_rect = pointer.get_rect(topright=placement_posn)
-                self._game_display.blit(pointer, pointer_rect.topleft)
-            self._game_display.blit(image, placement_posn)
+                self._blit(pointer, pointer_rect.topleft)
+            self._blit(image, placement_posn)
             y += self._text_height
         # Displays the descriptions
         if tree.name not in [GameID.GALLERY, GameID.HANGAR]:
@@ -148,9 +171,9 @@ class MenuView(View):
         y = config.display_height // 8
         x = config.display_width / 2
         for text in description:
-            title_text = self._description_font.render(text, 0, self.WHITE).convert_alpha()
+            title_text = self._text_cache.render(self._description_font, text, 0, self.WHITE)
             text_rect = title_text.get_rect(center=(x, y))
-            self._game_display.blit(title_text, text_rect.topleft)
+            self._blit(title_text, text_rect.topleft)
             y += text_rect.height
         if item in DifficultyID:
             # Item is the difficulty in this case
@@ -173,19 +196,19 @@ class MenuView(View):
             # k -> type
             # v -> enum value or int
             if k == "SCORE":
-                text = self._description_font.render("HIGH SCORE: " + str(v), 0, self.WHITE).convert_alpha()
-                self._game_display.blit(text, self._find_posn(text, int(config.display_width * .75),
-                                                              y_pos - config.ship_size))
+                text = self._text_cache.render(self._description_font, "HIGH SCORE: " + str(v), 0, self.WHITE)
+                self._blit(text, self._find_posn(text, int(config.display_width * .75),
+                                                 y_pos - config.ship_size))
             else:
                 if k == "SHIP":
-                    name = self._description_font.render(PlayerID(v).name, 0, self.WHITE).convert_alpha()
-                    image = self._image_dict[PlayerID(v)].base_image
+                    name = self._text_cache.render(self._description_font, PlayerID(v).name, 0, self.WHITE)
+                    image = self._get_images(PlayerID(v)).base_image
                 else:
                     # Weapon
-                    name = self._description_font.render(WeaponID(v).name, 0, self.WHITE).convert_alpha()
-                    image = self._image_dict[WeaponID(v)]
-                self._game_display.blit(image, self._find_posn(image, x_pos, y_pos))
-                self._game_display.blit(name, self._find_posn(name, x_pos, y_pos + config.ship_size // 2))
+                    name = self._text_cache.render(self._description_font, WeaponID(v).name, 0, self.WHITE)
+                    image = self._get_images(WeaponID(v))
+                self._blit(image, self._find_posn(image, x_pos, y_pos))
+                self._blit(name, self._find_posn(name, x_pos, y_pos + config.ship_size // 2))
                 x_pos += 2 * config.ship_size
 
     """Renders the current loadout.
@@ -198,8 +221,8 @@ class MenuView(View):
         # Welcome text
         welcome_text = self._description_font.render("Welcome " + config.player_name, 0, self.WHITE).convert_alpha()
         welcome_text.fill((255, 255, 255, self._prompt_alpha), None, pygame.BLEND_RGBA_MULT)
-        self._game_display.blit(welcome_text, self._find_posn(welcome_text, int(config.display_width * .75),
-                                                              y + config.ship_size / 2))
+        self._blit(welcome_text, self._find_posn(welcome_text, int(config.display_width * .75),
+                                                 y + config.ship_size / 2))
         self._render_ship(self._model.get_player(), 0)
 
     """Renders the title screen.
@@ -212,13 +235,17 @@ class MenuView(View):
                                  config.display_width / 2 - config.ship_size / 2, config.display_height / 2)
         self.render(self._model.get_player(), self._model.get_projectiles(),
                     self._model.get_ships(), self._model.get_effects())
-        self._game_display.blit(self._title,
-                                self._find_posn(self._title, int(self._width / 2), int(self._height / 2.5)))
+        self._blit(self._title,
+                   self._find_posn(self._title, int(self._width / 2), int(self._height / 2.5)))
         self._model.reset_showcase()
         self._compute_alpha()
         image = self._start_prompt.copy()
         image.fill((255, 255, 255, self._prompt_alpha), None, pygame.BLEND_RGBA_MULT)
-        self._game_display.blit(image, (self._prompt_x, self._prompt_y))
+        self._blit(image, (self._prompt_x, self._prompt_y))
+        if self._loading_done < self._loading_total:
+            progress = self._text_cache.render(self._description_font, "Loading %d%%" % (
+                100 * self._loading_done // self._loading_total), 0, self.WHITE)
+            self._blit(progress, self._find_posn(progress, self._width // 2, self._prompt_y + config.ship_size))
 
     """Computes alpha values for anything that fades in and out.
     """
@@ -246,24 +273,24 @@ class MenuView(View):
         # Other stats to show
         offset = 0
         for stat in gallery.stats:
-            stat_displayed = self._description_font.render(stat, 0, self.WHITE).convert_alpha()
+            stat_displayed = self._text_cache.render(self._description_font, stat, 0, self.WHITE)
             offset += self._ship_size // 4
-            self._game_display.blit(stat_displayed, self._find_posn(stat_displayed,
-                                                                    int(self._width * .7),
-                                                                    int(self._height / 4) + offset))
+            self._blit(stat_displayed, self._find_posn(stat_displayed,
+                                                       int(self._width * .7),
+                                                       int(self._height / 4) + offset))
         # Render a ship or weapon?
         if gallery.entity_type == GameID.WEAPON:
             offset += self._ship_size
-            weapon_image = self._image_dict[gallery.entity_id]
-            self._game_display.blit(weapon_image, self._find_posn(weapon_image,
-                                                                  int(self._width * .7),
-                                                                  int(self._height / 4) + offset))
+            weapon_image = self._get_images(gallery.entity_id)
+            self._blit(weapon_image, self._find_posn(weapon_image,
+                                                     int(self._width * .7),
+                                                     int(self._height / 4) + offset))
         # Title and description
-        name_displayed = self._text_font.render(str(gallery.name), 1, self.WHITE).convert_alpha()
-        self._game_display.blit(name_displayed,
-                                self._find_posn(name_displayed, int(self._width / 2), int(self._height / 10)))
-        description = self._description_font.render(gallery.description, 0, self.WHITE).convert_alpha()
-        self._game_display.blit(description, self._find_posn(description, int(self._width / 2), int(self._height / 6)))
+        name_displayed = self._text_cache.render(self._text_font, str(gallery.name), 1, self.WHITE)
+        self._blit(name_displayed,
+                   self._find_posn(name_displayed, int(self._width / 2), int(self._height / 10)))
+        description = self._text_cache.render(self._description_font, gallery.description, 0, self.WHITE)
+        self._blit(description, self._find_posn(description, int(self._width / 2), int(self._height / 6)))
 
     """Renders the game, including background, ships, and projectiles.
 
@@ -272,13 +299,12 @@ class MenuView(View):
    """
 
     def render(self, player, projectiles, ships, effects):
-        self._model.remove_effects()
         # Renders enemies to face the player
         for ship in ships:
             self._render_ship(ship, ship.angle)
         # Renders projectiles
-        for projectile in projectiles:
-            self._render_projectile(projectile)
+        for pool in projectiles:
+            self._render_projectiles(pool)
 
         # If the player isn't dead, it is rendered
         if player is not None:
@@ -286,6 +312,7 @@ class MenuView(View):
         # Renders effects
         for effect in effects:
             self._render_effect(effect)
+        self._model.remove_effects()
 
     """Renders the loadout selection screen.
     
@@ -299,8 +326,8 @@ class MenuView(View):
         self.render(self._model.get_player(), self._model.get_projectiles(),
                     self._model.get_ships(), self._model.get_effects())
         self._render_loadout_selector_helper(tree)
-        launch_text = self._description_font.render("Press [SPACE] to launch:", 1, self.WHITE)
-        self._game_display.blit(launch_text, self._find_posn(launch_text, self._width // 2, self._height // 5))
+        launch_text = self._text_cache.render(self._description_font, "Press [SPACE] to launch:", 1, self.WHITE)
+        self._blit(launch_text, self._find_posn(launch_text, self._width // 2, self._height // 5))
 
     """Displays the currently selected ship and weapon.
     
@@ -331,11 +358,11 @@ class MenuView(View):
             # Text
             text = self._description_font.render(options[i].name.replace("_", " "), 0, self.WHITE).convert_alpha()
             text.fill((*self.WHITE, text_transparency), None, pygame.BLEND_RGBA_MULT)
-            self._game_display.blit(text, self._find_posn(text, x_posns[i], y + config.ship_size / 2))
+            self._blit(text, self._find_posn(text, x_posns[i], y + config.ship_size / 2))
             # Image
             if options[i] in WeaponID:
-                weapon_image = self._image_dict[options[i]]
-                self._game_display.blit(weapon_image, self._find_posn(weapon_image, x_posns[i], y))
+                weapon_image = self._get_images(options[i])
+                self._blit(weapon_image, self._find_posn(weapon_image, x_posns[i], y))
             else:
                 self._model.spawn_player(options[i], x_posns[i] - config.ship_size / 2, y - config.ship_size / 2)
                 self._render_ship(self._model.get_player(), 0)
@@ -345,7 +372,7 @@ class MenuView(View):
             offset = config.ship_size
             for _ in range(2):
                 temp_chevron = pygame.transform.rotate(chevron, angle)
-                self._game_display.blit(temp_chevron, self._find_posn(temp_chevron, x_posns[i], y + offset))
+                self._blit(temp_chevron, self._find_posn(temp_chevron, x_posns[i], y + offset))
                 angle *= -1
                 offset *= -1
 
@@ -363,30 +390,30 @@ class MenuView(View):
         welcome_text = self._description_font.render("Welcome back " + config.player_name, 0,
                                                      self.WHITE).convert_alpha()
         welcome_text.fill((255, 255, 255, self._prompt_alpha), None, pygame.BLEND_RGBA_MULT)
-        self._game_display.blit(welcome_text, self._find_posn(welcome_text, int(config.display_width * .75),
-                                                              config.display_height / 2 + config.ship_size / 2))
+        self._blit(welcome_text, self._find_posn(welcome_text, int(config.display_width * .75),
+                                                 config.display_height / 2 + config.ship_size / 2))
 
         self.render(self._model.get_player(), self._model.get_projectiles(),
                     self._model.get_ships(), self._model.get_effects())
         middle_of_screen = int(self._width / 2)
         # Debriefing
-        title_image = self._text_font.render("DEBRIEFING", 1, self.WHITE).convert_alpha()
-        self._game_display.blit(title_image,
-                                self._find_posn(title_image, middle_of_screen, int(self._height / 10)))
+        title_image = self._text_cache.render(self._text_font, "DEBRIEFING", 1, self.WHITE)
+        self._blit(title_image,
+                   self._find_posn(title_image, middle_of_screen, int(self._height / 10)))
         self._compute_alpha()
         if stats["HIGH SCORE"]:
             high_score_text = self._text_font.render(".:HIGH SCORE:.", 1, self.WHITE).convert_alpha()
             high_score_text.fill((255, 255, 255, self._prompt_alpha), None, pygame.BLEND_RGBA_MULT)
-            self._game_display.blit(high_score_text,
-                                    self._find_posn(high_score_text, middle_of_screen,
-                                                    int(self._height / 10) + config.ship_size // 2))
+            self._blit(high_score_text,
+                       self._find_posn(high_score_text, middle_of_screen,
+                                       int(self._height / 10) + config.ship_size // 2))
         x_pos = int(self._width / 5)
         num_items = len(stats.items())
         y_pos = int(self._height / 2) - ((num_items // 2) * config.ship_size // 2)
         for k, v in stats.items():
             if k == "HIGH SCORE":
                 continue
-            text_to_render = self._description_font.render("> " + k + ": " + str(v), 1, self.WHITE).convert_alpha()
-            self._game_display.blit(text_to_render,
-                                    self._find_posn(text_to_render, x_pos, y_pos))
+            text_to_render = self._text_cache.render(self._description_font, "> " + k + ": " + str(v), 1, self.WHITE)
+            self._blit(text_to_render,
+                       self._find_posn(text_to_render, x_pos, y_pos))
             y_pos += config.ship_size // 2
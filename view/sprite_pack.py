@@ -0,0 +1,217 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+from src.utils import config
+
+"""File that keeps the scaled frames of every sprite as raw RGBA pixels, so later launches skip decoding and scaling
+the images. Frames are found by the hash of the image file they came from, the size they were scaled to, and their
+place in the spritesheet, so a changed image simply misses and is rebuilt. The whole pack is thrown away when the ship
+size or display size changes. The file is memory mapped and only the frames asked for are read.
+"""
+
+# Start of every pack file, then the format version and the length of the JSON index after it
+_magic = b"TUHPACK"
+_version = 1
+_header = struct.Struct("<7sHI")
+
+
+class SpritePack:
+    """Constructor to make the pack. The file is opened the first time a frame is looked up.
+
+    :param path: file the pack is kept in
+    :type path: str
+    """
+
+    def __init__(self, path=config.sprite_pack_path):
+        self._path = path
+        self._file = None
+        self._buffer = None
+        self._opened = False
+        # Image path, offset in the file, width, and height of each packed frame
+        self._frames = {}
+        # Image path, pixels, width, and height of each frame made since the pack was last written
+        self._new_frames = {}
+        # Hash of each image file looked up
+        self._hashes = {}
+
+    """Returns the settings the packed frames were scaled for.
+
+    :returns: ship size and display size
+    :rtype: dict
+    """
+
+    def _get_settings(self):
+        return {"SHIP SIZE": config.ship_size, "DISPLAY": [config.display_width, config.display_height]}
+
+    """Maps the pack file and reads its index, leaving the pack empty if the file is missing, unreadable, from another
+    version, or made for other settings.
+    """
+
+    def _open(self):
+        self._opened = True
+        try:
+            self._file = open(self._path, "rb")
+        except FileNotFoundError:
+            return
+        try:
+            magic, version, index_length = _header.unpack(self._file.read(_header.size))
+            index = json.loads(self._file.read(index_length).decode("utf-8"))
+            if magic != _magic or version != _version or index["SETTINGS"] != self._get_settings():
+                self._close()
+                return
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (struct.error, ValueError, KeyError, OSError):
+            self._close()
+            return
+        start = _header.size + index_length
+        self._frames = {key: (path, start + offset, width, height)
+                        for key, (path, offset, width, height) in index["FRAMES"].items()}
+
+    """Unmaps and closes the pack file, forgetting the frames in it.
+    """
+
+    def _close(self):
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._frames = {}
+
+    """Returns the hash of an image file.
+
+    :param path: path of the image file
+    :type path: str
+    :returns: hash of the file's contents
+    :rtype: str
+    """
+
+    def _get_hash(self, path):
+        file_hash = self._hashes.get(path)
+        if file_hash is None:
+            with open(path, "rb") as file:
+                file_hash = hashlib.sha1(file.read()).hexdigest()
+            self._hashes[path] = file_hash
+        return file_hash
+
+    """Returns the key a frame is packed under.
+
+    :param path: path of the image file
+    :type path: str
+    :param size: size the frame was scaled to, or None if it was not scaled
+    :type size: (int, int) or None
+    :param count: number of frames in the image
+    :type count: int
+    :param index: place of the frame in the image
+    :type index: int
+    :returns: the key
+    :rtype: str
+    """
+
+    def _get_key(self, path, size, count, index):
+        return "%s %s %d %d" % (self._get_hash(path), size, count, index)
+
+    """Returns the frames cut from an image and scaled to a size, or None if any of them are not packed.
+
+    :param path: path of the image file
+    :type path: str
+    :param size: size the frames were scaled to, or None if they were not scaled
+    :type size: (int, int) or None
+    :param count: number of frames in the image
+    :type count: int
+    :returns: the frames, not yet converted to the display's format
+    :rtype: [pygame.Surface] or None
+    """
+
+    def get_frames(self, path, size, count):
+        if not self._opened:
+            self._open()
+        frames = []
+        for index in range(count):
+            key = self._get_key(path, size, count, index)
+            if key in self._new_frames:
+                _, pixels, width, height = self._new_frames[key]
+            elif key in self._frames and self._buffer is not None:
+                _, offset, width, height = self._frames[key]
+                pixels = self._buffer[offset:offset + width * height * 4]
+            else:
+                return None
+            frames.append(pygame.image.frombuffer(pixels, (width, height), "RGBA"))
+        return frames
+
+    """Returns if every frame cut from an image and scaled to a size is packed.
+
+    :param path: path of the image file
+    :type path: str
+    :param size: size the frames were scaled to, or None if they were not scaled
+    :type size: (int, int) or None
+    :param count: number of frames in the image
+    :type count: int
+    :returns: True if they are all packed
+    :rtype: bool
+    """
+
+    def has_frames(self, path, size, count):
+        if not self._opened:
+            self._open()
+        for index in range(count):
+            key = self._get_key(path, size, count, index)
+            if key not in self._new_frames and (key not in self._frames or self._buffer is None):
+                return False
+        return True
+
+    """Adds the frames cut from an image to the pack, written out on the next save().
+
+    :param path: path of the image file
+    :type path: str
+    :param size: size the frames were scaled to, or None if they were not scaled
+    :type size: (int, int) or None
+    :param frames: the RGBA pixels and size of each frame in order
+    :type frames: [(bytes, (int, int))]
+    """
+
+    def add(self, path, size, frames):
+        for index, (pixels, (width, height)) in enumerate(frames):
+            self._new_frames[self._get_key(path, size, len(frames), index)] = (path, pixels, width, height)
+
+    """Writes the pack out if frames were added, replacing the file in one step so a crash never leaves half a pack.
+    Frames of images that have changed since they were packed are left out.
+    """
+
+    def save(self):
+        if not self._new_frames:
+            return
+        if not self._opened:
+            self._open()
+        index = {}
+        chunks = []
+        offset = 0
+        for key, (path, start, width, height) in self._frames.items():
+            # Skips frames of images whose contents changed
+            if key in self._new_frames or (path in self._hashes and not key.startswith(self._hashes[path])):
+                continue
+            length = width * height * 4
+            chunks.append(self._buffer[start:start + length])
+            index[key] = (path, offset, width, height)
+            offset += length
+        for key, (path, pixels, width, height) in self._new_frames.items():
+            chunks.append(pixels)
+            index[key] = (path, offset, width, height)
+            offset += len(pixels)
+        data = json.dumps({"SETTINGS": self._get_settings(), "FRAMES": index}).encode("utf-8")
+        temp_path = self._path + ".tmp"
+        with open(temp_path, "wb") as file:
+            file.write(_header.pack(_magic, _version, len(data)))
+            file.write(data)
+            for chunk in chunks:
+                file.write(chunk)
+        self._close()
+        os.replace(temp_path, self._path)
+        self._new_frames.clear()
+        self._open()
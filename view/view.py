@@ -10,11 +10,15 @@ from src.utils.ids.gamemode_id import GameModeID
 from src.utils.ids.player_id import PlayerID
 from src.utils.ids.projectile_id import ProjectileID
 from src.utils.ids.weapon_id import WeaponID
+from src.view.asset_manager import assets
 from src.view.image_containers.charge_up_images import ChargeUpImages
 from src.view.image_containers.explosion_images import ExplosionImages
+from src.view.image_containers.glyph_atlas import GlyphAtlas
 from src.view.image_containers.image_holder import ImageHolder
 from src.view.image_containers.popup_image import PopUpImage
+from src.view.image_containers.rotation_atlas import RotationAtlas
 from src.view.image_containers.screen_tint_images import ScreenTintImages
+from src.view.image_containers.text_cache import TextCache
 
 """View to render the game, uses pygame to render images. Add ships, projectiles, and effects images to render
 inside their respective fields ships_to_init, projectiles_to_init, and effects_to_init inside init_images().
@@ -32,8 +36,7 @@ class View:
     _font_path = os.path.join(_resource_path, 'fonts')
     _font_path = os.path.join(_font_path, 'insane_hours_2.ttf')
     # Backgrounds
-    _backgrounds = {"INITIALIZED": False,
-                    GameModeID.TITAN_SLAYER: os.path.join(_image_path, 'titan_background.png'),
+    _background_paths = {GameModeID.TITAN_SLAYER: os.path.join(_image_path, 'titan_background.png'),
                     GameModeID.MANDIBLE_MADNESS: os.path.join(_image_path, 'mandible_background.png'),
                     GameModeID.CLASSIC: os.path.join(_image_path, 'survival_background.png'),
                     GameModeID.HEAVEN: os.path.join(_image_path, 'heaven_background.png'),
@@ -78,26 +81,34 @@ class View:
     :type game_mode: EntityID
     :param fps: Frames per second to set effect length
     :type fps: int
+    :param ship_ids: ships and weapons to load images for up front, any others are loaded when first drawn, loads
+    every one if None
+    :type ship_ids: {EnemyID or AllyID or PlayerID or WeaponID} or None
     """
 
-    def __init__(self, game_mode):
+    def __init__(self, game_mode, ship_ids=None):
         self._width = config.display_width
         self._height = config.display_height
         #######################################################
         # Determines when to switch images for animation
         self._animation_switch = True
+        # Fraction of a tick to draw ships and projectiles back towards where they were before the last tick
+        self._rewind = 0
         # Sets up the game window surface
         self._game_display = pygame.display.set_mode((self._width, self._height))
         self._ship_size = config.ship_size
         # Title of the window
         pygame.display.set_caption(config.game_title)
         self._curr_game_mode = game_mode
+        # Decodes the images in the background while the rest is set up
+        assets.preload(self._get_asset_requests(ship_ids))
         self._init_backgrounds()
         #######################################################
         self._init_hud()
         #######################################################
         # Grabs the image dictionary
-        self._image_dict = self._init_images()
+        self._image_dict = self._init_images(ship_ids)
+        assets.save_pack()
 
     """Initializes the HUD elements.
     """
@@ -106,6 +117,12 @@ class View:
         # Display parameters
         self._font_size = self._height / 24
         self._text_font = pygame.font.Font(self._font_path, int(self._font_size))
+        # Rendered text, and digits for numbers that change every frame
+        self._text_cache = TextCache()
+        self._digits = GlyphAtlas(self._text_font, self.WHITE)
+        # Smaller text for the profiler overlay
+        self._profile_font_size = self._font_size / 2
+        self._profile_glyphs = GlyphAtlas(pygame.font.Font(self._font_path, int(self._profile_font_size)), self.WHITE)
         self._hp_text = self._text_font.render("HP", 1, self.WHITE).convert_alpha()
         hp_width, hp_height = pygame.font.Font.size(self._text_font, "HP")
         #######################################################
@@ -125,87 +142,168 @@ class View:
         # FPS ticker
         self._fps_text = self._text_font.render("FPS:", 1, self.WHITE).convert_alpha()
 
-    """Initializes the backgrounds in the game.
+    """Initializes the backgrounds in the game. Only the current background is loaded, others are loaded when they
+    are transitioned to.
     """
 
     def _init_backgrounds(self):
-        if not self._backgrounds["INITIALIZED"]:
-            for key, value in self._backgrounds.items():
-                if key != "INITIALIZED":
-                    temp_background = pygame.image.load(value).convert()
-                    temp_background = pygame.transform.scale(temp_background,
-                                                             (config.display_width, config.display_height))
-                    self._backgrounds[key] = temp_background
-            self._backgrounds["INITIALIZED"] = True
-        self._background = self._backgrounds[self._curr_game_mode]
+        self._background = self._get_background(self._curr_game_mode)
         self._target_background_id = None
         # How much the background scrolls
         self._scrolling_background_change = 2 * (30 / config.game_fps)
         # For background transitions:
         self._background_alpha = 255
         self._new_background = None
+        # Parts of the screen drawn on this frame and the last, for dirty rectangle updates
+        self._dirty_rects = []
+        self._last_dirty_rects = []
+        self._drawn_background = None
+        self._full_redraw = True
 
-    """Initializes all the images used in the game.
+    """Initializes the images used in the game. Ships and weapons not given are left to be loaded when first drawn.
 
+    :param ship_ids: ships and weapons to load images for, or None for all of them
+    :type ship_ids: {EnemyID or AllyID or PlayerID or WeaponID} or None
     :returns: dictionary of entity ID to images
     :rtype: {EntityID : ImageHolder}
     """
 
-    def _init_images(self):
+    def _init_images(self, ship_ids):
         # Result to return:
         result = {}
         # Projectiles to render
         projectiles_to_init = [e for e in ProjectileID if e not in self._projectiles_with_no_sprite]
         # Effects to render
         effects_to_init = [EffectID.EXPLOSION, EffectID.RED_EXPLOSION, EffectID.BLUE_EXPLOSION, EffectID.RED_AOE]
-        # Renders each ship
-        for id_name, size in self._ship_scaling.items():
-            ship_name = id_name.name
-            image_path = os.path.join(self._image_path, ship_name + '.png')
-            container = ImageHolder(image_path, int(self._ship_size * size))
-            result[id_name] = container
+        # Renders each ship and weapon sprite
+        for id_name in list(self._ship_scaling) + list(WeaponID):
+            if ship_ids is None or id_name in ship_ids:
+                result[id_name] = self._load_images(id_name)
         # Renders each projectile
         projectile_size = self._ship_size // 2
         for id_name in projectiles_to_init:
             projectile_name = id_name.name
             image_path = os.path.join(self._image_path, projectile_name + '.png')
-            image = pygame.image.load(image_path).convert_alpha()
-            image = pygame.transform.scale(image, (projectile_size, projectile_size))
-            result[id_name] = image
-        # Renders each weapon sprite
-        for weapon_id in WeaponID:
-            weapon_name = weapon_id.name
-            image_path = os.path.join(self._image_path, weapon_name + '.png')
-            image = pygame.image.load(image_path).convert_alpha()
-            image = pygame.transform.scale(image, (int(config.ship_size * 1.2), int(config.ship_size * 1.2)))
-            result[weapon_id] = image
+            image = assets.get_image(image_path, (projectile_size, projectile_size))
+            result[id_name] = assets.get_container(RotationAtlas, image)
         # Renders each effect (explosions)
         for id_name in effects_to_init:
             effect_name = id_name.name
             image_paths = os.path.join(self._image_path, effect_name + '.png')
-            container = ExplosionImages(image_paths, int(self._ship_size * 1.5))
+            container = assets.get_container(ExplosionImages, image_paths, int(self._ship_size * 1.5))
             # Two additional effects that do not have different sprites
             if effect_name == "EXPLOSION":
-                big_container = ExplosionImages(image_paths, int(self._ship_size * 8))
+                big_container = assets.get_container(ExplosionImages, image_paths, int(self._ship_size * 8))
                 result[EffectID.TITAN_EXPLOSION] = big_container
             elif effect_name == "RED_EXPLOSION":
-                charge_effect_container = ChargeUpImages(image_paths, int(self._ship_size * 1.5))
+                charge_effect_container = assets.get_container(ChargeUpImages, image_paths, int(self._ship_size * 1.5))
                 result[EffectID.RED_CHARGE] = charge_effect_container
             elif effect_name == "BLUE_EXPLOSION":
-                charge_effect_container = ChargeUpImages(image_paths, int(self._ship_size * 1.5))
+                charge_effect_container = assets.get_container(ChargeUpImages, image_paths, int(self._ship_size * 1.5))
                 result[EffectID.BLUE_CHARGE] = charge_effect_container
             result[id_name] = container
         # Screen tints
         blue_tint = os.path.join(self._image_path, 'shield_damage_screen_effect.png')
         red_tint = os.path.join(self._image_path, 'damage_screen_effect.png')
-        shield_damage_tint = ScreenTintImages(blue_tint)
-        damage_tint = ScreenTintImages(red_tint)
+        shield_damage_tint = assets.get_container(ScreenTintImages, blue_tint)
+        damage_tint = assets.get_container(ScreenTintImages, red_tint)
         result[EffectID.SHIELD_TINT] = shield_damage_tint
         result[EffectID.HP_TINT] = damage_tint
         # Popup text
         result[EffectID.POPUP] = PopUpImage(self._text_font)
         return result
 
+    """Returns the background of a game mode or menu, scaled to the window.
+
+    :param background_id: ID of the game mode or menu
+    :type background_id: GameModeID or GameID
+    :returns: the background
+    :rtype: pygame.Surface
+    """
+
+    def _get_background(self, background_id):
+        path, size, _ = self._get_background_request(background_id)
+        return assets.get_image(path, size, alpha=False)
+
+    """Returns the path, frame size, and frame count of every image used by the game, to be preloaded.
+
+    :param ship_ids: ships and weapons to include, or None for all of them
+    :type ship_ids: {EnemyID or AllyID or PlayerID or WeaponID} or None
+    :returns: path, frame size, and frame count of each image
+    :rtype: [(str, (int, int), int)]
+    """
+
+    def _get_asset_requests(self, ship_ids):
+        requests = [self._get_sprite_request(id_name) for id_name in list(self._ship_scaling) + list(WeaponID)
+                    if ship_ids is None or id_name in ship_ids]
+        projectile_size = (self._ship_size // 2, self._ship_size // 2)
+        requests.extend((os.path.join(self._image_path, id_name.name + '.png'), projectile_size, 1)
+                        for id_name in ProjectileID if id_name not in self._projectiles_with_no_sprite)
+        effect_size = (int(self._ship_size * 1.5), int(self._ship_size * 1.5))
+        for id_name in [EffectID.EXPLOSION, EffectID.RED_EXPLOSION, EffectID.BLUE_EXPLOSION, EffectID.RED_AOE]:
+            requests.append((os.path.join(self._image_path, id_name.name + '.png'), effect_size, 5))
+        requests.append((os.path.join(self._image_path, 'EXPLOSION.png'),
+                         (int(self._ship_size * 8), int(self._ship_size * 8)), 5))
+        for tint in ['shield_damage_screen_effect.png', 'damage_screen_effect.png']:
+            requests.append((os.path.join(self._image_path, tint), (config.display_width, config.display_height), 1))
+        requests.append(self._get_background_request(self._curr_game_mode))
+        return requests
+
+    """Returns the path, frame size, and frame count of a background.
+
+    :param background_id: ID of the game mode or menu
+    :type background_id: GameModeID or GameID
+    :returns: path, frame size, and frame count of the background
+    :rtype: (str, (int, int), int)
+    """
+
+    def _get_background_request(self, background_id):
+        return self._background_paths[background_id], (self._width, self._height), 1
+
+    """Returns the path, frame size, and frame count of the images of a ship or the sprite of a weapon.
+
+    :param entity_id: ID of the ship or weapon
+    :type entity_id: EnemyID or AllyID or PlayerID or WeaponID
+    :returns: path, frame size, and frame count of the image
+    :rtype: (str, (int, int), int)
+    """
+
+    def _get_sprite_request(self, entity_id):
+        image_path = os.path.join(self._image_path, entity_id.name + '.png')
+        if entity_id in WeaponID:
+            return image_path, (int(config.ship_size * 1.2), int(config.ship_size * 1.2)), 1
+        size = int(self._ship_size * self._ship_scaling[entity_id])
+        return image_path, (size, size), 4
+
+    """Loads the images of a ship or the sprite of a weapon.
+
+    :param entity_id: ID of the ship or weapon
+    :type entity_id: EnemyID or AllyID or PlayerID or WeaponID
+    :returns: the ship's images or the weapon's sprite
+    :rtype: ImageHolder or pygame.Surface
+    """
+
+    def _load_images(self, entity_id):
+        image_path, size, _ = self._get_sprite_request(entity_id)
+        if entity_id in WeaponID:
+            return assets.get_image(image_path, size)
+        return assets.get_container(ImageHolder, image_path, size[0])
+
+    """Returns the images of a ship or the sprite of a weapon, loading them if they were not loaded up front.
+
+    :param entity_id: ID of the ship or weapon
+    :type entity_id: EnemyID or AllyID or PlayerID or WeaponID
+    :returns: the ship's images or the weapon's sprite
+    :rtype: ImageHolder or pygame.Surface
+    """
+
+    def _get_images(self, entity_id):
+        images = self._image_dict.get(entity_id)
+        if images is None:
+            images = self._load_images(entity_id)
+            self._image_dict[entity_id] = images
+        return images
+
     """Returns a list of the image paths for a ship.
 
     :param ship_name: Name of the ship and the image file
@@ -231,17 +329,20 @@ class View:
 
     :param items: ships and projectiles to render
     :type items: list of Ship or Projectile
+    :param alpha: how far between the previous tick and the last one to draw ships and projectiles, from 0 to 1
+    :type alpha: float
     """
 
-    def render(self, player, projectiles, ships, effects):
+    def render(self, player, projectiles, ships, effects, alpha=1):
+        self._rewind = 1 - alpha
         # Scrolling background
         self._draw_background(self._background)
         # Renders enemies to face the player
         for ship in ships:
             self._render_ship(ship, ship.angle)
         # Renders projectiles
-        for projectile in projectiles:
-            self._render_projectile(projectile)
+        for pool in projectiles:
+            self._render_projectiles(pool)
 
         # If the player isn't dead, it is rendered
         if not player.is_dead:
@@ -259,11 +360,66 @@ class View:
     """
 
     def _draw_background(self, background):
-        self._game_display.blit(background, (0, self._scrolling_background_y))
-        self._game_display.blit(background, (0, self._scrolling_background_y - self._height))
-        self._scrolling_background_y += self._scrolling_background_change
-        if self._scrolling_background_y == self._height:
-            self._scrolling_background_y = 0
+        y = self._scrolling_background_y
+        if self._uses_dirty_rects() and background is self._drawn_background:
+            # Only paints over what was drawn last frame
+            for rect in self._last_dirty_rects:
+                self._game_display.blit(background, rect, rect.move(0, -y))
+                self._game_display.blit(background, rect, rect.move(0, self._height - y))
+            return
+        self._game_display.blit(background, (0, y))
+        self._game_display.blit(background, (0, y - self._height))
+        self._drawn_background = background
+        self._full_redraw = True
+        if config.scroll_background:
+            self._scrolling_background_y += self._scrolling_background_change
+            if self._scrolling_background_y == self._height:
+                self._scrolling_background_y = 0
+
+    """Returns whether only the changed parts of the screen need to be redrawn. Only possible while the background
+    stands still and is not fading into another one.
+
+    :returns: if dirty rectangles can be used
+    :rtype: bool
+    """
+
+    def _uses_dirty_rects(self):
+        return config.dirty_rects and not config.scroll_background and self._new_background is None
+
+    """Draws an image onto the screen and marks where it was drawn.
+
+    :param image: image to draw
+    :type image: pygame.Surface
+    :param posn: top left position to draw the image at
+    :type posn: (int, int)
+    """
+
+    def _blit(self, image, posn):
+        self._dirty_rects.append(self._game_display.blit(image, posn))
+
+    """Draws a filled rectangle onto the screen and marks where it was drawn.
+
+    :param color: color of the rectangle
+    :type color: (int, int, int)
+    :param rect: rectangle to draw
+    :type rect: pygame.Rect
+    """
+
+    def _draw_rect(self, color, rect):
+        self._dirty_rects.append(pygame.draw.rect(self._game_display, color, rect))
+
+    """Pushes the drawn frame to the window. Only updates the parts drawn this frame and the last one if dirty
+    rectangles are being used, otherwise the whole window.
+    """
+
+    def update_display(self):
+        if self._full_redraw or not self._uses_dirty_rects():
+            pygame.display.update()
+        else:
+            pygame.display.update(self._last_dirty_rects + self._dirty_rects)
+        self._full_redraw = False
+        self._last_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
 
     """Draws the HUD on the bottom of the screen.
 
@@ -273,22 +429,38 @@ class View:
 
     def _draw_hud(self, player):
         # Red bar underneath
-        pygame.draw.rect(self._game_display, (255, 0, 0), self._red_bar)
+        self._draw_rect((255, 0, 0), self._red_bar)
         # Green HP bar above the red bar
         if player.hp > 0:
             self._hp_bar.width = (self._width / 3) / (player.max_hp / player.hp)
-            pygame.draw.rect(self._game_display, (0, 148, 43), self._hp_bar)
+            self._draw_rect((0, 148, 43), self._hp_bar)
         # Shield health bar
         if player.shield > 0:
             self._shield_bar.width = (self._width / 3) / (player.max_shield / player.shield)
-            pygame.draw.rect(self._game_display, (0, 159, 225), self._shield_bar)
+            self._draw_rect((0, 159, 225), self._shield_bar)
         # HP Text
-        self._game_display.blit(self._hp_text, (0, self._height - self._font_size))
+        self._blit(self._hp_text, (0, self._height - self._font_size))
         # Score
-        self._game_display.blit(self._score_text, (self._score_x, self._height - self._font_size))
-        score = self._text_font.render(str(player.score), 1, self.WHITE).convert_alpha()
-        self._game_display.blit(score, (self._score_x + self._score_width,
-                                        self._height - self._font_size))
+        self._blit(self._score_text, (self._score_x, self._height - self._font_size))
+        self._blit_glyphs(self._digits, str(player.score),
+                          (self._score_x + self._score_width, self._height - self._font_size))
+
+    """Draws text one character at a time from the cached character images.
+
+    :param glyphs: character images to draw with
+    :type glyphs: GlyphAtlas
+    :param text: text to draw
+    :type text: str
+    :param posn: top left position to start drawing at
+    :type posn: (int, int)
+    """
+
+    def _blit_glyphs(self, glyphs, text, posn):
+        x, y = posn
+        for character in text:
+            glyph = glyphs.get(character)
+            self._blit(glyph, (x, y))
+            x += glyph.get_width()
 
     """Renders an individual ship depending on if it's damaged etc.
 
@@ -299,22 +471,52 @@ class View:
     """
 
     def _render_ship(self, ship, angle):
-        image_holder = self._image_dict.get(ship.entity_id)
-        image = image_holder.base_image
+        image_holder = self._get_images(ship.entity_id)
+        rotations = image_holder.base_rotations
         # Decides which image to use:
         # damaged image, base image, or second base image for animation for engines
         if ship.is_damaged:
             if ship.shield > 0:
-                image = image_holder.shield_damage_image
+                rotations = image_holder.shield_damage_rotations
             else:
-                image = image_holder.damaged_image
+                rotations = image_holder.damaged_rotations
         elif self._animation_switch:
-            image = image_holder.animated_image
-        # Rotates ship to face the given angle
-        ship_image = pygame.transform.rotate(image, angle)
+            rotations = image_holder.animated_rotations
+        # Grabs the image rotated to face the given angle
+        ship_image, offset = rotations.get(angle)
+        x, y = self._interpolate(ship)
+        self._blit(ship_image, (x + ship.size / 2 + offset[0], y + ship.size / 2 + offset[1]))
+
+    """Returns where to draw a ship or projectile, between its position before the last tick and its current one.
+
+    :param entity: ship or projectile to draw
+    :type entity: Ship or Projectile
+    :returns: x and y position to draw at
+    :rtype: (float, float)
+    """
+
+    def _interpolate(self, entity):
+        if not self._rewind or entity.prev_x is None:
+            return entity.x, entity.y
+        return (entity.x - (entity.x - entity.prev_x) * self._rewind,
+                entity.y - (entity.y - entity.prev_y) * self._rewind)
+
+    """Renders every projectile in the pool, reading the bullets straight from its arrays.
+
+    :param pool: projectiles to render
+    :type pool: ProjectilePool
+    """
 
-        self._game_display.blit(ship_image,
-                                self._find_posn(ship_image, ship.x + ship.size / 2, ship.y + ship.size / 2))
+    def _render_projectiles(self, pool):
+        center = self._ship_size / 2
+        for x, y, direction, entity_id in zip(*pool.get_bullets(self._rewind)):
+            if entity_id in self._projectiles_with_no_sprite:
+                continue
+            # Rotates the projectile depending on its angle
+            projectile_image, offset = self._image_dict.get(entity_id).get(direction - 90)
+            self._blit(projectile_image, (x + center + offset[0], y + center + offset[1]))
+        for projectile in pool.objects:
+            self._render_projectile(projectile)
 
     """Renders an individual projectile depending on its orientation.
 
@@ -325,13 +527,12 @@ class View:
     def _render_projectile(self, projectile):
         if projectile.entity_id in self._projectiles_with_no_sprite:
             return
-        image = self._image_dict.get(projectile.entity_id)
         # Rotates the projectile depending on its angle
-        projectile_image = pygame.transform.rotate(image, projectile.direction - 90)
-        center_height = projectile.y + self._ship_size / 2
-        center_width = projectile.x + self._ship_size / 2
-        self._game_display.blit(projectile_image,
-                                self._find_posn(projectile_image, center_width, center_height))
+        projectile_image, offset = self._image_dict.get(projectile.entity_id).get(projectile.direction - 90)
+        x, y = self._interpolate(projectile)
+        center_height = y + self._ship_size / 2
+        center_width = x + self._ship_size / 2
+        self._blit(projectile_image, (center_width + offset[0], center_height + offset[1]))
 
     """Renders the given effect. Returns the effect.
 
@@ -343,7 +544,7 @@ class View:
 
     def _render_effect(self, effect):
         image = self._image_dict.get(effect.entity_id).get_frame(effect)
-        self._game_display.blit(image, (effect.x, effect.y))
+        self._blit(image, (effect.x, effect.y))
         return effect
 
     """Renders the FPS counter for the game.
@@ -353,9 +554,25 @@ class View:
     """
 
     def render_fps(self, fps):
-        self._game_display.blit(self._fps_text, (self._width - (5 * self._font_size), self._height - self._font_size))
-        fps_number = self._text_font.render(str(fps), 1, self.WHITE).convert_alpha()
-        self._game_display.blit(fps_number, (self._width - (2 * self._font_size), self._height - self._font_size))
+        self._blit(self._fps_text, (self._width - (5 * self._font_size), self._height - self._font_size))
+        self._blit_glyphs(self._digits, str(fps), (self._width - (2 * self._font_size), self._height - self._font_size))
+
+    """Renders the profiler overlay above the FPS counter, showing the milliseconds spent in each phase of a frame and
+    how many entities are alive.
+
+    :param averages: milliseconds spent in each phase
+    :type averages: {str: float}
+    :param counts: number of each kind of entity
+    :type counts: {str: int}
+    """
+
+    def render_profile(self, averages, counts):
+        lines = [phase.upper() + ": " + "%.2f" % milliseconds + "MS" for phase, milliseconds in averages.items()]
+        lines += [name.upper() + " ALIVE: " + str(count) for name, count in counts.items()]
+        y = self._height - self._font_size - len(lines) * self._profile_font_size
+        for line in lines:
+            self._blit_glyphs(self._profile_glyphs, line, (self._width - self._profile_glyphs.get_width(line), y))
+            y += self._profile_font_size
 
     """Finds position given a Surface and coordinates for the center. Returns the coordinates that
     correspond to the correct top left position to place the surface to achieve the given center.
@@ -385,7 +602,7 @@ class View:
             if self._background_alpha > 0:
                 self._background_alpha -= 15
                 self._background.set_alpha(self._background_alpha)
-                self._new_background = self._backgrounds[background_id]
+                self._new_background = self._get_background(background_id)
                 self._new_background.set_alpha(255 - self._background_alpha)
                 self._draw_background(self._new_background)
             else: